@@ -1,20 +1,34 @@
-from typing import Callable
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+import cmath
 import os 
 
 from maths.power_flow import PowerFlow
 from models.bus import Bus, BusType
 from models.line import Line
-from models.network_element import ElementEvent, NetworkElement
+from models.network_element import ChangeSet, ElementEvent, NetworkElement
 from models.faults import FaultType, FaultStudyResult
 from models.generator import Generator
 
 from typing import cast
 from PySide6.QtWidgets import QMessageBox, QInputDialog
-from maths.short_circuit import (run_three_phase_fault_from_powerflow, run_slg_fault_from_powerflow, run_ll_fault_from_powerflow, run_dlg_fault_from_powerflow)
-from view.fault_result_dialog import FaultResultDialog
-import numpy as np
 import re
 
+if TYPE_CHECKING:
+    from maths.short_circuit import ShortCircuitSession
+
+# maths.short_circuit (numpy), view.fault_result_dialog, view.voltage_profile_plot
+# (matplotlib) e reports.pdf_report (reportlab) são importados sob demanda, dentro
+# dos métodos que os usam, para não pesarem na inicialização da janela.
+
+
+ElementListener = Callable[[NetworkElement, ElementEvent], None]
+ChangeSetListener = Callable[[ChangeSet], None]
+
+# Chave do registro de inscrições: (id do elemento, tipo de evento).
+# None em qualquer posição funciona como curinga ("todos").
+_SubscriptionKey = tuple[str | None, ElementEvent | None]
+
 
 class SimulatorController:
     __instance = None
@@ -26,12 +40,12 @@ class SimulatorController:
         return SimulatorController.__instance
 
     def clear_state(self):
-        for bus in self.__buses.values():
-            for listener in self.__listeners:
-                listener(bus, ElementEvent.DELETED)
-        for connection in self.__connections.values():
-            for listener in self.__listeners:
-                listener(connection, ElementEvent.DELETED)
+        with self.batch():
+            for bus in list(self.__buses.values()):
+                self.__emit(bus, ElementEvent.DELETED)
+            for connection in list(self.__connections.values()):
+                self.__emit(connection, ElementEvent.DELETED)
+        self.__power_flow = None
         self.__buses.clear()
         self.__connections.clear()
         self.__generators.clear()
@@ -53,17 +67,156 @@ class SimulatorController:
         self.__buses = dict[str, Bus]()
         self.__connections = dict[str, Line]()
         self.__generators = dict[str, Generator]()  # id -> Generator
-        self.__listeners: list[Callable[[NetworkElement, ElementEvent], None]] = []
+        self.__subscriptions: dict[
+            _SubscriptionKey, dict[int, tuple[ElementListener, ChangeSetListener | None]]
+        ] = {}
+        self.__next_subscription: int = 0
+        self.__batch_depth: int = 0
+        self.__pending: ChangeSet | None = None
         self.power_base_mva: float = 100.0
         self.__power_flow: PowerFlow | None = None
+        # redes de sequência fatoradas do último fluxo resolvido (ver _short_circuit_session)
+        self.__short_circuit: "ShortCircuitSession | None" = None
         self.__next_bus_num = 1
         self.__free_bus_nums: set[int] = set()
         self.__next_bus_number: int = 1
         self.__free_bus_numbers: set[int] = set()
 
 
-    def listen(self, callback: Callable[[NetworkElement, ElementEvent], None]) -> None:
-        self.__listeners.append(callback)
+    def listen(
+        self,
+        callback: ElementListener,
+        element_id: str | None = None,
+        events: Iterable[ElementEvent] | None = None,
+        on_batch: ChangeSetListener | None = None,
+    ) -> Callable[[], None]:
+        """
+        Inscreve um listener.
+
+        - sem filtros: recebe todos os eventos (ex.: BoardView)
+        - element_id: só eventos daquele elemento (ex.: BusWidget da barra)
+        - events: só esses tipos de evento
+        - on_batch: ao fim de um lote (batch()/add_many), recebe UMA vez o ChangeSet
+          inteiro em vez de um callback por elemento. Sem on_batch, os eventos do
+          lote são repassados um a um ao callback.
+
+        Retorna a função que cancela a inscrição; widgets devem chamá-la
+        quando forem destruídos/removidos, senão o callback vaza.
+        """
+        self.__next_subscription += 1
+        token = self.__next_subscription
+
+        if events is None:
+            keys: list[_SubscriptionKey] = [(element_id, None)]
+        else:
+            keys = [(element_id, event) for event in events]
+
+        for key in keys:
+            self.__subscriptions.setdefault(key, {})[token] = (callback, on_batch)
+
+        def unsubscribe() -> None:
+            for key in keys:
+                bucket = self.__subscriptions.get(key)
+                if bucket is None:
+                    continue
+                bucket.pop(token, None)
+                if not bucket:
+                    del self.__subscriptions[key]
+
+        return unsubscribe
+
+    @staticmethod
+    def __keys_for(element: NetworkElement, event: ElementEvent) -> tuple[_SubscriptionKey, ...]:
+        return (
+            (element.id, event),
+            (element.id, None),
+            (None, event),
+            (None, None),
+        )
+
+    def __emit(self, element: NetworkElement, event: ElementEvent) -> None:
+        # toda mudança de barra/linha/gerador passa por aqui: a sessão de curto fica velha
+        self.__short_circuit = None
+
+        if self.__pending is not None:
+            self.__pending.record(element, event)
+            return
+
+        # Só os listeners daquele elemento/evento + os curingas: O(interessados), não O(todos).
+        for key in SimulatorController.__keys_for(element, event):
+            bucket = self.__subscriptions.get(key)
+            if not bucket:
+                continue
+            # cópia: um callback pode cancelar inscrições durante o disparo
+            for callback, _ in tuple(bucket.values()):
+                callback(element, event)
+
+    def begin_batch(self) -> None:
+        """Passa a acumular os eventos em um ChangeSet até o commit_batch() correspondente."""
+        if self.__batch_depth == 0:
+            self.__pending = ChangeSet()
+        self.__batch_depth += 1
+
+    def commit_batch(self) -> None:
+        """Fecha o lote e entrega as mudanças coalescidas (lotes aninhados entregam no mais externo)."""
+        if self.__batch_depth == 0:
+            return
+        self.__batch_depth -= 1
+        if self.__batch_depth > 0:
+            return
+
+        changes = self.__pending
+        self.__pending = None
+        if not changes:
+            return
+
+        batch_handlers: dict[int, ChangeSetListener] = {}
+        single_events: list[tuple[ElementListener, NetworkElement, ElementEvent]] = []
+        for element, event in changes.events():
+            for key in SimulatorController.__keys_for(element, event):
+                bucket = self.__subscriptions.get(key)
+                if not bucket:
+                    continue
+                for token, (callback, on_batch) in bucket.items():
+                    if on_batch is not None:
+                        batch_handlers[token] = on_batch
+                    else:
+                        single_events.append((callback, element, event))
+
+        # primeiro as views estruturais (criam/removem widgets num passo só),
+        # depois os listeners de elemento (já alvos, O(1) cada)
+        for on_batch in batch_handlers.values():
+            on_batch(changes)
+        for callback, element, event in single_events:
+            callback(element, event)
+
+    @contextmanager
+    def batch(self) -> Iterator[ChangeSet]:
+        """
+        with controller.batch():
+            ...  # várias mutações
+        Ao sair do bloco (mesmo com exceção) as views recebem um único ChangeSet.
+        """
+        self.begin_batch()
+        try:
+            yield cast(ChangeSet, self.__pending)
+        finally:
+            self.commit_batch()
+
+    def add_many(
+        self,
+        buses: Iterable[Bus] = (),
+        lines: Iterable[Line] = (),
+        generators: Iterable[Generator] = (),
+    ) -> list[Bus]:
+        """Adiciona vários elementos em um único lote. Retorna as barras como armazenadas."""
+        with self.batch():
+            added = [self.addBus(bus) for bus in buses]
+            for line in lines:
+                self.addConnection(line)
+            for gen in generators:
+                self.addGenerator(gen)
+        return added
 
     @staticmethod
     def _extract_int(s: str) -> int | None:
@@ -118,8 +271,7 @@ class SimulatorController:
 
         # guarda e emite evento
         self.__buses[bus.id] = bus
-        for cb in self.__listeners:
-            cb(bus, ElementEvent.CREATED)
+        self.__emit(bus, ElementEvent.CREATED)
         return bus
 
 
@@ -135,15 +287,13 @@ class SimulatorController:
 
         self.__power_flow = None
 
-        for callback in self.__listeners:
-            callback(element, ElementEvent.CREATED)
+        self.__emit(element, ElementEvent.CREATED)
 
         return element
     
     def addGenerator(self, gen: Generator) -> Generator:
         self.__generators[gen.id] = gen
-        for cb in self.__listeners:
-            cb(gen, ElementEvent.CREATED)
+        self.__emit(gen, ElementEvent.CREATED)
         return gen
 
     def updateElement(self, element: NetworkElement) -> None:
@@ -158,8 +308,7 @@ class SimulatorController:
 
         self.__power_flow = None 
 
-        for callback in self.__listeners:
-            callback(element, ElementEvent.UPDATED)
+        self.__emit(element, ElementEvent.UPDATED)
             
     def getGeneratorByBusId(self, bus_id: str) -> Generator | None:
         for g in self.__generators.values():
@@ -187,8 +336,7 @@ class SimulatorController:
             )
 
         self.__generators[gen.id] = gen
-        for cb in self.__listeners:
-            cb(gen, ElementEvent.UPDATED)
+        self.__emit(gen, ElementEvent.UPDATED)
         return gen
 
     def get_bus_by_id(self, id: str) -> Bus:
@@ -240,9 +388,9 @@ class SimulatorController:
         power_flow.solve(decoupled=True, max_iterations=50, tol=1e-5)
         self.__power_flow = power_flow
 
-        for bus in self.__buses.values():
-            for callback in self.__listeners:
-                callback(bus, ElementEvent.UPDATED)
+        with self.batch():
+            for bus in self.__buses.values():
+                self.__emit(bus, ElementEvent.UPDATED)
         from view.voltage_profile_plot import show_voltage_profile
 
         # =============================
@@ -278,6 +426,64 @@ class SimulatorController:
 
     
 
+    def get_bus_report_data(self) -> list[dict[str, object]]:
+        """Dados por barra usados na tabela do relatório PDF."""
+        return [
+            {
+                "id": bus.number,
+                "type": bus.type.name,
+                "v": bus.v,
+                "angle": bus.o * 180.0 / cmath.pi,
+                "p": bus.p,
+                "q": bus.q,
+            }
+            for bus in self.__buses.values()
+        ]
+
+    def exportPdfReport(self, pdf_path: str) -> None:
+        """
+        Gera o relatório PDF do último fluxo de potência.
+        matplotlib e reportlab só são carregados aqui (primeiro uso).
+        """
+        from view.voltage_profile_plot import save_voltage_profile_chunks
+        from reports.pdf_report import generate_pdf
+
+        buses = []
+        voltages = []
+
+        for bus in self.__buses.values():
+            buses.append(bus.number)
+            voltages.append(bus.v)
+
+        output_dir = os.path.abspath("temp_graficos")
+
+        image_paths = save_voltage_profile_chunks(
+            buses=buses,
+            voltages=voltages,
+            output_dir=output_dir,
+            bars_per_image=20
+        )
+
+        # gera PDF
+        bus_data = self.get_bus_report_data()
+        generate_pdf(
+            filename=pdf_path,
+            bus_data=bus_data,
+            image_paths=image_paths,
+            logo_path="reports/assets/logo.png"
+        )
+
+    def exportResultTables(self, path: str) -> list[str]:
+        """
+        Barras e fluxos nos ramos do último fluxo de potência em tabelas
+        (Parquet/Arrow/CSV pela extensão); retorna os arquivos gravados.
+        """
+        from storage.storage import StorageFacade
+
+        return StorageFacade.save_results_files(
+            path, self.buses, self.connections, self.power_base_mva
+        )
+
     def printNetwork(self):
         pf = PowerFlow()
         for bus in self.__buses.values():
@@ -295,6 +501,8 @@ class SimulatorController:
         return " "  # TODO
     
     def _show_fault_result_dialog(self, result: FaultStudyResult, window_title: str) -> None:
+        from view.fault_result_dialog import FaultResultDialog
+
         dlg = FaultResultDialog(result, buses=self.__buses, s_base_mva=self.power_base_mva)
         dlg.setWindowTitle(window_title)
         dlg.exec()
@@ -342,31 +550,21 @@ class SimulatorController:
         
         bus_id = self._resolve_bus_id(bus_id)
 
-
-        buses = []
-        voltages = []
-
-        for bus in self.__buses.values():
-            buses.append(bus.number)
-            voltages.append(bus.v)
-
-        output_dir = os.path.abspath("temp_graficos")
-
-        image_paths = save_voltage_profile_chunks(
-            buses=buses,
-            voltages=voltages,
-            output_dir=output_dir,
-            bars_per_image=20
-        )
-
-        # gera PDF
-        bus_data = self.get_bus_report_data()
-        generate_pdf(
-            filename=pdf_path,
-            bus_data=bus_data,
-            image_paths=image_paths,
-            logo_path="reports/assets/logo.png"
+        item, ok = QInputDialog.getItem(
+            None,
+            "Curto-circuito",
+            "Selecione o tipo de falta:",
+            [
+                "Falta trifásica (3φ)",
+                "Falta monofásica (SLG)",
+                "Falta fase-fase (LL)",
+                "Falta dupla fase-terra (DLG)",
+            ],
+            0,
+            False,
         )
+        if not ok:
+            return
 
         if item.startswith("Falta trifásica"):
             self._run_three_phase_fault_on_bus(bus_id)
@@ -465,19 +663,35 @@ class SimulatorController:
 
         return slack_id, Z1, Z2, Z0
 
+    def _short_circuit_session(
+        self,
+        source_bus_id: str | None = None,
+        z1_source_pu: complex | None = None,
+        z2_source_pu: complex | None = None,
+        z0_source_pu: complex | None = None,
+    ) -> "ShortCircuitSession":
+        """
+        Sessão de curto do fluxo de potência atual, reaproveitada entre faltas.
+
+        Só é remontada quando o fluxo muda (novo runPowerFlow), quando algum
+        elemento muda (__emit a descarta) ou quando a fonte Thevenin é outra.
+        """
+        from maths.short_circuit import ShortCircuitSession
+
+        assert self.__power_flow is not None
+        source = (source_bus_id, z1_source_pu, z2_source_pu, z0_source_pu)
+        session = self.__short_circuit
+        if session is None or not session.matches(self.__power_flow, *source):
+            session = ShortCircuitSession(self.__power_flow, self.generators, *source)
+            self.__short_circuit = session
+        return session
+
     def _run_three_phase_fault_on_bus(self, bus_id: str) -> None:
         try:
             source_bus_id, Z1s, Z2s, Z0s = self._ask_thevenin_source_data()
 
-            result = run_three_phase_fault_from_powerflow(
-                self.__power_flow,
-                bus_id,
-                source_bus_id=source_bus_id,
-                z1_source_pu=Z1s,
-                z2_source_pu=Z2s,
-                z0_source_pu=Z0s,
-                generators=self.generators,
-            )
+            session = self._short_circuit_session(source_bus_id, Z1s, Z2s, Z0s)
+            result = session.run(FaultType.THREE_PHASE, bus_id)
             self._show_fault_result_dialog(result, f"Falta 3φ na barra {bus_id}")
         except Exception as e:
             QMessageBox.critical(None, "Erro no curto-circuito", str(e))
@@ -492,16 +706,8 @@ class SimulatorController:
             if len(self.generators) == 0:
                 source_bus_id, Z1s, Z2s, Z0s = self._ask_thevenin_source_data()
 
-            result = run_slg_fault_from_powerflow(
-                self.__power_flow,
-                bus_id,
-                phase=phase,
-                source_bus_id=source_bus_id,
-                z1_source_pu=Z1s,
-                z2_source_pu=Z2s,
-                z0_source_pu=Z0s,
-                generators=self.generators,
-            )
+            session = self._short_circuit_session(source_bus_id, Z1s, Z2s, Z0s)
+            result = session.run(FaultType.SINGLE_LINE_TO_GROUND, bus_id, phase=phase)
             self._show_fault_result_dialog(result, f"Falta SLG ({phase}) na barra {bus_id}")
         except Exception as e:
             QMessageBox.critical(None, "Erro no curto-circuito", str(e))
@@ -517,16 +723,8 @@ class SimulatorController:
                 source_bus_id, Z1s, Z2s, Z0s = self._ask_thevenin_source_data()
 
 
-            result = run_ll_fault_from_powerflow(
-                self.__power_flow,
-                bus_id,
-                phase=phase,
-                source_bus_id=source_bus_id,
-                z1_source_pu=Z1s,
-                z2_source_pu=Z2s,
-                z0_source_pu=Z0s,
-                generators=self.generators,
-            )
+            session = self._short_circuit_session(source_bus_id, Z1s, Z2s, Z0s)
+            result = session.run(FaultType.LINE_TO_LINE, bus_id, phase=phase)
             self._show_fault_result_dialog(result, f"Falta LL ({phase}) na barra {bus_id}")
         except Exception as e:
             QMessageBox.critical(None, "Erro no curto-circuito", str(e))
@@ -541,16 +739,8 @@ class SimulatorController:
             if len(self.generators) == 0:
                 source_bus_id, Z1s, Z2s, Z0s = self._ask_thevenin_source_data()
 
-            result = run_dlg_fault_from_powerflow(
-                self.__power_flow,
-                bus_id,
-                phase=phase,
-                source_bus_id=source_bus_id,
-                z1_source_pu=Z1s,
-                z2_source_pu=Z2s,
-                z0_source_pu=Z0s,
-                generators=self.generators,
-            )
+            session = self._short_circuit_session(source_bus_id, Z1s, Z2s, Z0s)
+            result = session.run(FaultType.DOUBLE_LINE_TO_GROUND, bus_id, phase=phase)
             self._show_fault_result_dialog(result, f"Falta DLG ({phase}) na barra {bus_id}")
         except Exception as e:
             QMessageBox.critical(None, "Erro no curto-circuito", str(e))
@@ -562,15 +752,13 @@ class SimulatorController:
 
         if line is None:
             return
-        for cb in self.__listeners:
-            cb(line, ElementEvent.DELETED)
+        self.__emit(line, ElementEvent.DELETED)
 
     def deleteGenerator(self, gen_id: str) -> None:
         gen = self.__generators.pop(gen_id, None)
         if gen is None:
             return
-        for cb in self.__listeners:
-            cb(gen, ElementEvent.DELETED)
+        self.__emit(gen, ElementEvent.DELETED)
 
     def deleteBus(self, bus_id: str) -> None:
         bus = self.__buses.pop(bus_id, None)
@@ -582,8 +770,7 @@ class SimulatorController:
         # libera o número pra ser reutilizado
         self.__free_bus_numbers.add(bus.number)
 
-        for cb in self.__listeners:
-            cb(bus, ElementEvent.DELETED)
+        self.__emit(bus, ElementEvent.DELETED)
 
 
         # apaga linhas conectadas
@@ -606,8 +793,7 @@ class SimulatorController:
         bus = self.__buses.pop(bus_id, None)
         if bus is None:
             return
-        for cb in self.__listeners:
-            cb(bus, ElementEvent.DELETED)
+        self.__emit(bus, ElementEvent.DELETED)
 
     def __extract_bus_num(self, bus_id: str) -> int | None:
         # tenta pegar o final numérico: "B_3" -> 3, "3" -> 3
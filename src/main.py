@@ -1,19 +1,43 @@
+import time
+
+_STARTUP_T0 = time.perf_counter()  # marca o início antes de qualquer import pesado
+
 import sys
 import os
-import qdarktheme # remover?
-from typing import * # verificar se typing realmente for usada, definir quais funcoes estao sendo realmente usadas. exemplo: from typing import List, Optional, Union
 from PySide6.QtWidgets import QApplication
 from view.main_window import MainWindow
 
+# Se definida, mede o tempo até a primeira janela aparecer, imprime e encerra.
+# Usado por test/startup_time.py (orçamento de inicialização).
+STARTUP_PROBE_ENV = "POWERSIM_STARTUP_PROBE"
+
+
+def _report_first_window_and_quit(app: QApplication) -> None:
+    elapsed_ms = (time.perf_counter() - _STARTUP_T0) * 1000.0
+    heavy = [m for m in ("numpy", "scipy", "matplotlib", "reportlab", "qdarktheme") if m in sys.modules]
+    print(f"startup: first_window_ms={elapsed_ms:.1f}", flush=True)
+    print(f"startup: heavy_modules={','.join(heavy)}", flush=True)
+    app.quit()
+
+
 def main():
     app = QApplication(sys.argv)
     window = MainWindow()
     #if os.name == "nt":
+    #    import qdarktheme  # só carrega se o tema for usado
     #    window.setStyleSheet(qdarktheme.load_stylesheet())  # 'light'
     window.resize(640, 480)
     window.show()
+
+    if os.environ.get(STARTUP_PROBE_ENV):
+        from PySide6.QtCore import QTimer
+
+        # singleShot(0) dispara depois que o loop processa o primeiro show/paint
+        QTimer.singleShot(0, lambda: _report_first_window_and_quit(app))
+
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    os.system("cls" if os.name == "nt" else "clear")
+    if not os.environ.get(STARTUP_PROBE_ENV):
+        os.system("cls" if os.name == "nt" else "clear")
     main()
@@ -10,7 +10,33 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Pacotes do ambiente de desenvolvimento que o app não usa: ficam fora do
+    # executável (menos arquivos para extrair = inicialização mais rápida).
+    excludes=[
+        'qdarktheme',
+        'tkinter',
+        'IPython',
+        'jupyter',
+        'jupyterlab',
+        'notebook',
+        'pypsa',
+        'pandapower',
+        'linopy',
+        'highspy',
+        'xarray',
+        'dask',
+        'geopandas',
+        'shapely',
+        'pyproj',
+        'netCDF4',
+        'plotly',
+        'seaborn',
+        'PySide6.QtWebEngineCore',
+        'PySide6.QtWebEngineWidgets',
+        'PySide6.Qt3DCore',
+        'PySide6.QtQuick',
+        'PySide6.QtQml',
+    ],
     noarchive=False,
     optimize=0,
 )
@@ -0,0 +1,204 @@
+"""
+Estudos de falta em lote, em vários processos, gravando os resultados aos poucos.
+
+    studies = study_grid(bus_ids, [(FaultType.SINGLE_LINE_TO_GROUND, "A")], [0j, 0.05])
+    with CsvFaultSink("faltas.csv") as sink:
+        BatchFaultRunner(session.solver, workers=4).run(studies, sink)
+
+Cada processo recebe o ShortCircuitSolver uma vez (no fork, os fatores LU são
+herdados sem cópia; no spawn, cada processo refatora as Ybus ao desserializar).
+As faltas vão em blocos de barras com o mesmo (tipo, fases, Zf); cada bloco
+volta como arrays e vira linhas no sink, sem montar FaultResultBasic.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import groupby, islice, product
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from maths.short_circuit import ShortCircuitSolver
+from models.faults import FaultType
+from storage.results_export import ArrowTableSink, CsvTableSink, ParquetTableSink, TableSink
+
+
+@dataclass(frozen=True)
+class FaultStudy:
+    bus_id: str
+    fault_type: FaultType
+    phase: str = "A"
+    z_fault_pu: complex = 0 + 0j
+
+
+_STUDY_KEY = attrgetter("fault_type", "phase", "z_fault_pu")
+
+
+def study_grid(
+    bus_ids: Iterable[str],
+    kinds: Iterable[tuple[FaultType, str]],
+    z_faults: Iterable[complex] = (0 + 0j,),
+) -> List[FaultStudy]:
+    """Produto barra x (tipo, fases) x Zf."""
+    return [
+        FaultStudy(bus_id, fault_type, phase, complex(zf))
+        for (fault_type, phase), zf, bus_id in product(list(kinds), list(z_faults), list(bus_ids))
+    ]
+
+
+# ------------------------------------------------------------------
+# processo de trabalho
+# ------------------------------------------------------------------
+_worker_solver: Optional[ShortCircuitSolver] = None
+
+
+def _init_worker(solver: ShortCircuitSolver) -> None:
+    global _worker_solver
+    _worker_solver = solver
+
+
+def _run_block(
+    fault_type: FaultType, phase: str, z_fault_pu: complex, bus_ids: List[str], voltages: bool
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    assert _worker_solver is not None
+    i012, V012 = _worker_solver.fault_block(fault_type, phase, z_fault_pu, bus_ids)
+    A_T = ShortCircuitSolver._symm_matrix_A().T
+    return i012 @ A_T, (V012 @ A_T if voltages else None)
+
+
+# ------------------------------------------------------------------
+# saídas
+# ------------------------------------------------------------------
+# os sinks genéricos de storage.results_export (blocos de colunas -> CSV/Parquet/Arrow)
+FaultSink = TableSink
+CsvFaultSink = CsvTableSink
+ParquetFaultSink = ParquetTableSink
+ArrowFaultSink = ArrowTableSink
+
+
+# ------------------------------------------------------------------
+# execução
+# ------------------------------------------------------------------
+_PHASES = ("a", "b", "c")
+
+
+def _block_columns(
+    buses: np.ndarray,
+    first_study: int,
+    fault_type: FaultType,
+    phase: str,
+    z_fault_pu: complex,
+    bus_ids: List[str],
+    i_abc: np.ndarray,
+    v_abc: Optional[np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Colunas de um bloco: uma linha por falta, ou falta x barra se houver tensões."""
+    k = len(bus_ids)
+    study = np.arange(first_study, first_study + k)
+    fault_bus = np.array(bus_ids, dtype=object)
+    if v_abc is not None:
+        n = v_abc.shape[1]
+        study = np.repeat(study, n)
+        fault_bus = np.repeat(fault_bus, n)
+        i_abc = np.repeat(i_abc, n, axis=0)
+
+    columns: Dict[str, np.ndarray] = {
+        "study": study,
+        "fault_bus": fault_bus,
+        "fault_type": np.full(len(study), fault_type.name, dtype=object),
+        "phase": np.full(len(study), phase, dtype=object),
+        "zf_re": np.full(len(study), complex(z_fault_pu).real),
+        "zf_im": np.full(len(study), complex(z_fault_pu).imag),
+    }
+    for j, ph in enumerate(_PHASES):
+        columns[f"i{ph}_mag"] = np.abs(i_abc[:, j])
+        columns[f"i{ph}_deg"] = np.degrees(np.angle(i_abc[:, j]))
+    if v_abc is not None:
+        v = v_abc.reshape(-1, 3)
+        columns["bus"] = np.tile(buses, k)
+        for j, ph in enumerate(_PHASES):
+            columns[f"v{ph}_mag"] = np.abs(v[:, j])
+            columns[f"v{ph}_deg"] = np.degrees(np.angle(v[:, j]))
+    return columns
+
+
+class BatchFaultRunner:
+    """
+    Executa FaultStudy (lista ou gerador) em `workers` processos (0/1 = no próprio processo).
+
+    block: faltas por tarefa (cada uma resolve block colunas das Zbus de uma vez);
+    voltages=True grava as tensões de fase de todas as barras (uma linha por
+    falta x barra); False grava só a corrente na falta (uma linha por falta).
+    No máximo 2·workers blocos ficam em voo: a memória não cresce com o estudo.
+    """
+
+    def __init__(
+        self,
+        solver: ShortCircuitSolver,
+        workers: int | None = None,
+        block: int = 64,
+        voltages: bool = True,
+    ) -> None:
+        self.solver = solver
+        self.workers = multiprocessing.cpu_count() if workers is None else workers
+        self.block = max(1, block)
+        self.voltages = voltages
+        self._buses = np.array(list(solver.bus_index), dtype=object)
+
+    def _tasks(
+        self, studies: Iterable[FaultStudy]
+    ) -> Iterator[tuple[int, FaultType, str, complex, List[str]]]:
+        """
+        Blocos consecutivos com o mesmo (tipo, fases, Zf), na ordem dos estudos; estes são
+        consumidos conforme os blocos saem (no máximo `block` de cada vez na memória).
+        """
+        first = 0
+        for (fault_type, phase, z_fault_pu), group in groupby(studies, _STUDY_KEY):
+            while bus_ids := [s.bus_id for s in islice(group, self.block)]:
+                yield first, fault_type, phase, z_fault_pu, bus_ids
+                first += len(bus_ids)
+
+    def run(self, studies: Iterable[FaultStudy], sink: FaultSink) -> int:
+        """Grava todos os estudos no sink; retorna o número de linhas escritas."""
+        rows = 0
+
+        if self.workers <= 1:
+            _init_worker(self.solver)
+            for first, ft, ph, zf, bus_ids in self._tasks(studies):
+                i_abc, v_abc = _run_block(ft, ph, zf, bus_ids, self.voltages)
+                columns = _block_columns(self._buses, first, ft, ph, zf, bus_ids, i_abc, v_abc)
+                sink.write(columns)
+                rows += len(columns["study"])
+            return rows
+
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.solver,),
+        ) as pool:
+            pending: deque[tuple[tuple, Future]] = deque()
+            tasks = self._tasks(studies)
+
+            def submit_next() -> None:
+                task = next(tasks, None)
+                if task is not None:
+                    _, ft, ph, zf, bus_ids = task
+                    future = pool.submit(_run_block, ft, ph, zf, bus_ids, self.voltages)
+                    pending.append((task, future))
+
+            for _ in range(2 * self.workers):
+                submit_next()
+            while pending:
+                (first, ft, ph, zf, bus_ids), future = pending.popleft()
+                i_abc, v_abc = future.result()
+                submit_next()
+                columns = _block_columns(self._buses, first, ft, ph, zf, bus_ids, i_abc, v_abc)
+                sink.write(columns)
+                rows += len(columns["study"])
+        return rows
@@ -7,13 +7,10 @@ from models.y_bus_square_matrix import YBusSquareMatrix
 def _bii_total(bus_i: Bus, buses: dict[str, Bus], Y: YBusSquareMatrix) -> float:
     """
     Retorna B_ii efetivo = imag(Y_ii) + soma(line_charging/2) de todas as conexões incidentes.
-    No teu YBusSquareMatrix, o bc não entra na matriz, então precisamos somar aqui.
+    A soma percorre só os ramos da barra (índice CSR da Ybus), em O(grau).
     """
-    bc_half_sum = 0.0
-    for b in buses.values():
-        if b.index == bus_i.index:
-            continue
-        bc_half_sum += Y.getBc(bus_i.index, b.index) / 2.0
+    branches = Y.branches[Y.bus_branches(bus_i.index)]
+    bc_half_sum = float(branches["bc"].sum()) / 2.0
     return float(Y.y_matrix[bus_i.index][bus_i.index].imag) + bc_half_sum
 
 
@@ -25,9 +22,9 @@ def calcP(
     Y: YBusSquareMatrix,
 ) -> float:
     sum: float = 0.0
+    row = Y.y_matrix[self.index]
     for bus in buses.values():
-        y = abs(Y.y_matrix[self.index][bus.index])
-        theta = cmath.phase(Y.y_matrix[self.index][bus.index])
+        y, theta = cmath.polar(row[bus.index])
         sum += self.v * bus.v * y * cos(theta - self.o + bus.o)
     return sum
 
@@ -40,9 +37,9 @@ def calcQ(
     Y: YBusSquareMatrix,
 ) -> float:
     s = 0.0
+    row = Y.y_matrix[self.index]
     for bus in buses.values():
-        y = abs(Y.y_matrix[self.index][bus.index])
-        theta = cmath.phase(Y.y_matrix[self.index][bus.index])
+        y, theta = cmath.polar(row[bus.index])
         s += self.v * bus.v * y * sin(theta - self.o + bus.o)
     return -s
 
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
 import cmath
 from math import sqrt
-from typing import Any, Callable
-import numpy
-import numpy as np 
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    import numpy
+
+# numpy é importado dentro dos métodos que o usam: montar a rede na interface
+# (PowerFlow/Bus/Line) não deve custar o import do numpy na inicialização.
 
 from maths.power_calculator import calcP, calcQ, dPdO, dPdV, dQdO, dQdV
 from models.line import Line
@@ -66,7 +72,7 @@ class PowerFlow:
             bus_matrix.add_bus(bus.id)  # id correto
             bus.index = index
             # shunt da barra entra na diagonal
-            bus_matrix.y_matrix[index][index] += complex(bus.g_shunt, bus.b_shunt)
+            bus_matrix.add_value(index, index, complex(bus.g_shunt, bus.b_shunt))
 
 
         # conexões entre barras
@@ -113,7 +119,7 @@ class PowerFlow:
                     zeq = z0 + 3 * zn
                     if abs(zeq) < 1e-12:
                         return
-                    bus_matrix.y_matrix[bus_i][bus_i] += 1 / zeq
+                    bus_matrix.add_value(bus_i, bus_i, 1 / zeq)
 
                 # Caso 1: Yg-Yg (sem delta) -> conecta barras na seq. zero
                 if hv_star_g and lv_star_g and hv_star and lv_star and (not hv_delta) and (not lv_delta):
@@ -151,7 +157,7 @@ class PowerFlow:
                     if abs(zeq) < 1e-12:
                         return
                     ysh = 1 / zeq
-                    bus_matrix.y_matrix[bus_i][bus_i] += ysh
+                    bus_matrix.add_value(bus_i, bus_i, ysh)
 
                 if hv_star_g and not hv_delta:
                     add_zero_shunt(hv_idx, connection.meta.xn_hv_pu)
@@ -194,6 +200,26 @@ class PowerFlow:
 
         return bus_matrix
 
+    def get_ybus_sparse_sequences(self):
+        """
+        Retorna (Y1, Y2, Y0) como matrizes esparsas (CSC), montadas numa única
+        passada pelos ramos (ver maths.sequence_branches.sequence_ybus).
+        """
+        from maths.sequence_branches import BranchPrimitives, sequence_ybus
+
+        branches = BranchPrimitives.from_connections(self.connections.values(), self.get_bus_index_dict())
+        Y0, Y1, Y2 = sequence_ybus(branches, self.get_bus_shunts_sequences())
+        return Y1, Y2, Y0
+
+    def get_bus_shunts_sequences(self) -> numpy.ndarray:
+        """Shunt de cada barra (g + jb) repetido nas sequências 0/1/2: array (n, 3)."""
+        import numpy as np
+
+        for index, bus in enumerate(self.buses.values()):
+            bus.index = index
+        shunt = np.array([complex(b.g_shunt, b.b_shunt) for b in self.buses.values()], dtype=complex)
+        return np.repeat(shunt[:, None], 3, axis=1)
+
     def get_ybus_numpy_sequences(self):
         """
         Retorna (Y1, Y2, Y0) como np.ndarray para estudos de curto-circuito.
@@ -202,12 +228,7 @@ class PowerFlow:
         Y2: sequência negativa
         Y0: sequência zero
         """
-        Y1 = self.build_bus_matrix("positive").y_matrix
-        Y2 = self.build_bus_matrix("negative").y_matrix
-        Y0 = self.build_bus_matrix("zero").y_matrix
-
-        return np.array(Y1, dtype=complex), np.array(Y2, dtype=complex), np.array(Y0, dtype=complex)
-
+        return tuple(Y.toarray() for Y in self.get_ybus_sparse_sequences())
 
     def solve(
             self,
@@ -216,6 +237,8 @@ class PowerFlow:
             decoupled: bool = False,
             tol: float = 1e-6, 
         ) -> None:
+        import numpy as np
+
         print("Solving power flow...")
         self.__yMatrix = self.build_bus_matrix()
         self.__update_indexes()
@@ -512,7 +535,8 @@ class PowerFlow:
         Devolve a matriz Ybus interna como um numpy.ndarray de complexos.
         Deve ser chamada DEPOIS de solve(), pois usa self.__yMatrix.
         """
-        # self.__yMatrix.y_matrix é uma lista de listas de complexos
+        import numpy
+
         return numpy.array(self.__yMatrix.y_matrix, dtype=complex)
 
     def get_bus_index_dict(self) -> dict[str, int]:
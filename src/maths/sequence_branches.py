@@ -0,0 +1,247 @@
+import cmath
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from models.line import Line
+
+# ordem das sequências nos arrays: 0 = zero, 1 = positiva, 2 = negativa (como I012/V012)
+SEQUENCES = ("zero", "positive", "negative")
+
+
+def _c0(x) -> complex:
+    return 0 + 0j if x is None else complex(x)
+
+
+def _f0(x) -> float:
+    return 0.0 if x is None else float(x)
+
+
+# ligação de cada enrolamento do transformador (código por ramo, avaliado em lote)
+WINDING_DELTA = 0  # Δ (ou ligação desconhecida): bloqueia a sequência zero
+WINDING_STAR = 1  # Y isolado
+WINDING_STAR_GROUNDED = 2  # Yg, ou Y com o checkbox de aterramento
+
+
+def _winding_code(conn: str, grounded: bool) -> int:
+    conn = conn.upper().strip()
+    if conn == "YG" or (conn == "Y" and grounded):
+        return WINDING_STAR_GROUNDED
+    return WINDING_STAR if conn == "Y" else WINDING_DELTA
+
+
+def _pi_terms(
+    y: np.ndarray, bc: np.ndarray, tap: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Quadripolos pi com tap no lado "from" (mesmo modelo de YBusSquareMatrix.connect_bus_to_bus)."""
+    tap = np.where(np.abs(tap) < 1e-12, 1.0 + 0j, tap)
+    ysh = 1j * (bc / 2.0)
+    return (y + ysh) / (tap * tap.conj()).real, -y / tap.conj(), -y / tap, y + ysh
+
+
+def branch_terms(connections: Iterable[Line]) -> np.ndarray:
+    """
+    (yff, yft, ytf, ytt) de todos os ramos nas três sequências: array (4, m, 3),
+    com as mesmas regras de PowerFlow.build_bus_matrix:
+    I_from = yff Vf + yft Vt, I_to = ytf Vf + ytt Vt.
+
+    Os atributos de cada ramo são lidos uma vez; as regras (inclusive as do
+    transformador na sequência zero) são aplicadas em lote sobre códigos por ramo.
+    Transformador sem passagem de sequência zero (há Δ ou Y isolado): as barras
+    ficam desacopladas (yft = ytf = 0) e só o lado Yg vê o shunt 1/(Z0 + 3 Zn).
+    """
+    from models.transformer import Transformer  # import local evita ciclo
+
+    connections = list(connections)
+    m = len(connections)
+    y = np.zeros((m, 3), dtype=complex)  # série, por sequência 0/1/2
+    bc = np.zeros((m, 3))
+    tap = np.ones(m, dtype=complex)
+    tap_zero = np.ones(m, dtype=complex)  # Yg-Yg na seq. zero usa tap·e^{jφ}
+    z0 = np.zeros(m, dtype=complex)
+    xn = np.zeros((m, 2))
+    winding = np.full((m, 2), -1, dtype=np.int8)  # -1: não é transformador
+
+    for j, c in enumerate(connections):
+        y1 = _c0(c.y1)
+        y[j] = (_c0(c.y0) or y1, y1, _c0(c.y2) or y1)
+        b1 = _f0(c.b1)
+        bc[j] = (_f0(c.b0), b1, b1)
+        tap[j] = c.tap
+        if isinstance(c, Transformer):
+            meta = c.meta
+            winding[j] = (
+                _winding_code(meta.conn_hv, meta.grounded_hv),
+                _winding_code(meta.conn_lv, meta.grounded_lv),
+            )
+            xn[j] = (float(meta.xn_hv_pu), float(meta.xn_lv_pu))
+            tap_zero[j] = c.tap * cmath.exp(1j * getattr(c, "phase", 0.0))
+            # Z0 direto (é o que o diálogo edita); senão 1/y0; senão Z1
+            z = _c0(c.z0)
+            if abs(z) < 1e-12:
+                y0 = _c0(c.y0)
+                z = 1 / y0 if abs(y0) > 1e-12 else _c0(c.z1)
+            z0[j] = z
+
+    terms = np.empty((4, m, 3), dtype=complex)
+    for s in range(3):
+        terms[:, :, s] = _pi_terms(y[:, s], bc[:, s], tap)
+
+    is_transformer = winding[:, 0] >= 0
+    grounded = winding == WINDING_STAR_GROUNDED
+    passes = is_transformer & grounded.all(axis=1)  # Yg-Yg
+    blocked = is_transformer & ~passes
+
+    if passes.any():
+        z = z0[passes]
+        y_series = np.where(np.abs(z) < 1e-12, 0j, 1 / np.where(z == 0, 1, z))
+        terms[:, passes, 0] = _pi_terms(y_series, bc[passes, 0], tap_zero[passes])
+
+    if blocked.any():
+        zeq = z0[blocked, None] + 3j * xn[blocked]  # (k, 2): lados hv/lv
+        shunt = np.where(
+            grounded[blocked] & (np.abs(zeq) >= 1e-12), 1 / np.where(zeq == 0, 1, zeq), 0j
+        )
+        terms[0, blocked, 0] = shunt[:, 0]
+        terms[1, blocked, 0] = 0j
+        terms[2, blocked, 0] = 0j
+        terms[3, blocked, 0] = shunt[:, 1]
+    return terms
+
+
+def sequence_ybus(branches: "BranchPrimitives", shunts: np.ndarray) -> tuple:
+    """
+    Ybus esparsas (CSC) das três sequências, na ordem 0/1/2, num único COO.
+
+    shunts: (n, 3) admitâncias para a terra por barra e sequência (shunt da
+    barra, geradores, fonte Thevenin); n define a ordem das matrizes.
+    Se Y2 sair igual a Y1, devolve o mesmo objeto nas duas posições.
+    """
+    from scipy.sparse import coo_matrix
+
+    n = shunts.shape[0]
+    diag = np.arange(n)
+    rows = np.concatenate([branches.f, branches.f, branches.t, branches.t, diag])
+    cols = np.concatenate([branches.f, branches.t, branches.f, branches.t, diag])
+    data = np.concatenate(
+        [branches.yff, branches.yft, branches.ytf, branches.ytt, shunts]
+    )  # (4m + n, 3)
+    matrices = []
+    for s in range(3):
+        if s == 2 and np.array_equal(data[:, 2], data[:, 1]):
+            # Y2 == Y1 (caso comum): o mesmo objeto, para a fatoração ser compartilhada
+            matrices.append(matrices[1])
+            continue
+        Y = coo_matrix((data[:, s], (rows, cols)), shape=(n, n)).tocsc()  # soma os repetidos
+        Y.eliminate_zeros()
+        matrices.append(Y)
+    return tuple(matrices)
+
+
+@dataclass
+class BranchPrimitives:
+    """
+    Quadripolos de todos os ramos (Line/Transformer), nas três sequências.
+
+    f/t: índices das barras na matriz; yff/yft/ytf/ytt: (m, 3), coluna = sequência 0/1/2.
+    """
+
+    ids: List[str]
+    from_bus: List[str]
+    to_bus: List[str]
+    f: np.ndarray
+    t: np.ndarray
+    yff: np.ndarray
+    yft: np.ndarray
+    ytf: np.ndarray
+    ytt: np.ndarray
+    tap: np.ndarray
+    is_transformer: np.ndarray
+    _positions: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+
+    def position(self, branch_id: str) -> int:
+        if self._positions is None:
+            self._positions = {bid: j for j, bid in enumerate(self.ids)}
+        try:
+            return self._positions[branch_id]
+        except KeyError:
+            raise ValueError(f"Ramo {branch_id!r} não encontrado.") from None
+
+    @staticmethod
+    def from_connections(connections: Iterable[Line], bus_index: dict[str, int]) -> "BranchPrimitives":
+        from models.transformer import Transformer
+
+        connections = list(connections)
+        terms = branch_terms(connections)
+        return BranchPrimitives(
+            ids=[c.id for c in connections],
+            from_bus=[c.tap_bus_id for c in connections],
+            to_bus=[c.z_bus_id for c in connections],
+            f=np.array([bus_index[c.tap_bus_id] for c in connections], dtype=np.int64),
+            t=np.array([bus_index[c.z_bus_id] for c in connections], dtype=np.int64),
+            yff=terms[0],
+            yft=terms[1],
+            ytf=terms[2],
+            ytt=terms[3],
+            tap=np.array([c.tap for c in connections], dtype=float),
+            is_transformer=np.array([isinstance(c, Transformer) for c in connections], dtype=bool),
+        )
+
+    def out_of_service(self, positions: np.ndarray) -> "BranchPrimitives":
+        """Cópia com os ramos de positions desligados (quadripolos nulos: corrente zero)."""
+        terms = {}
+        for name in ("yff", "yft", "ytf", "ytt"):
+            values = getattr(self, name).copy()
+            values[positions] = 0
+            terms[name] = values
+        return replace(self, **terms)
+
+    def currents(self, v_from: np.ndarray, v_to: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Correntes de sequência nas duas pontas de cada ramo (saindo da barra para o ramo).
+
+        v_from / v_to: (..., m, 3) tensões V012 das barras f e t.
+        """
+        return self.yff * v_from + self.yft * v_to, self.ytf * v_from + self.ytt * v_to
+
+
+@dataclass
+class GeneratorPrimitives:
+    """
+    Geradores como shunts de sequência (Generator.sc): y (g, 3), coluna = sequência 0/1/2.
+
+    Sem aterramento o gerador não conduz sequência zero (y0 = 0).
+    """
+
+    ids: List[str]
+    bus_ids: List[str]
+    bus: np.ndarray
+    y: np.ndarray
+
+    @staticmethod
+    def from_generators(generators, bus_index: dict[str, int]) -> "GeneratorPrimitives":
+        gens = [g for g in (generators or ()) if g.bus_id in bus_index]
+        y = np.zeros((len(gens), 3), dtype=complex)
+        for j, gen in enumerate(gens):
+            z012 = (
+                1j * (gen.sc.x0_pu + 3.0 * gen.sc.xn_pu) if gen.sc.grounded else None,
+                1j * gen.sc.x1_pu,
+                1j * gen.sc.x2_pu,
+            )
+            for s, z in enumerate(z012):
+                if z is not None and abs(z) >= 1e-12:
+                    y[j, s] = 1 / z
+        return GeneratorPrimitives(
+            ids=[g.id for g in gens],
+            bus_ids=[g.bus_id for g in gens],
+            bus=np.array([bus_index[g.bus_id] for g in gens], dtype=np.int64),
+            y=y,
+        )
+
+    def currents(self, delta_v: np.ndarray) -> np.ndarray:
+        """
+        Contribuição de cada gerador para a falta (injetada na barra), por superposição:
+        I = -y ΔV, com ΔV012 = V012 pós-falta - [0, Vpre, 0] na barra do gerador.
+        """
+        return -self.y * delta_v
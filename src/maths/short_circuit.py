@@ -1,8 +1,20 @@
+import copy
 from dataclasses import dataclass
 from typing import Dict
 import numpy as np
-from models.faults import FaultSpec, FaultType, FaultResultBasic, FaultStudyResult
-from maths.power_flow import PowerFlow  
+from models.faults import (
+    BranchCurrents,
+    FaultOutageSweepResult,
+    FaultParametricResult,
+    FaultSpec,
+    FaultStudyResult,
+    FaultSweepResult,
+    FaultType,
+    GeneratorCurrents,
+    LineFaultSweepResult,
+)
+from maths.power_flow import PowerFlow
+from maths.sequence_branches import BranchPrimitives, GeneratorPrimitives, sequence_ybus
 
 @dataclass
 class ThreePhaseFaultResult:
@@ -12,19 +24,270 @@ class ThreePhaseFaultResult:
     V_post: Dict[str, complex]         # tensões pós-falta em cada barra (pu)
 
 
-def safe_inv(Y: np.ndarray, eps: float = 1e-9) -> np.ndarray:
+class _DenseFallback:
+    """Último recurso quando nem a Ybus regularizada fatora: pseudo-inversa densa."""
+
+    def __init__(self, Y) -> None:
+        self._z = np.linalg.pinv(Y.toarray())
+
+    def solve(self, b: np.ndarray, trans: str = "N") -> np.ndarray:
+        return (self._z.T if trans == "T" else self._z) @ b
+
+
+def _splu(Y, symmetric: bool):
+    from scipy.sparse.linalg import splu
+
+    if symmetric:
+        # mesma permutação em linhas e colunas, sem pivoteamento: L U = L D L^T,
+        # que é o que a inversão seletiva (SequenceNetwork.diagonal) precisa
+        lu = splu(
+            Y,
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options=dict(SymmetricMode=True),
+        )
+        if np.array_equal(lu.perm_r, lu.perm_c):
+            return lu
+    return splu(Y)
+
+
+def _factorize(Y, eps: float = 1e-9, symmetric: bool = False):
+    """
+    LU esparsa da Ybus (scipy.sparse.linalg.splu).
+
+    Se a matriz for singular (ex.: ilha sem caminho para a terra na seq. zero),
+    regulariza a diagonal: equivale a um shunt desprezível -> quase aberto.
+    """
+    from scipy.sparse import identity
+
     try:
-        return np.linalg.inv(Y)
-    except np.linalg.LinAlgError:
-        # Regulariza a diagonal (equivale a colocar um shunt absurdamente grande -> quase aberto)
-        Yreg = Y.copy().astype(complex)
-        idx = np.diag_indices_from(Yreg)
-        Yreg[idx] += eps
+        return _splu(Y, symmetric)
+    except RuntimeError:
+        Yreg = (Y + eps * identity(Y.shape[0], dtype=complex, format="csc")).tocsc()
         try:
-            return np.linalg.inv(Yreg)
-        except np.linalg.LinAlgError:
-            # Último recurso
-            return np.linalg.pinv(Yreg)
+            return _splu(Yreg, symmetric)
+        except RuntimeError:
+            return _DenseFallback(Yreg)
+
+
+def _is_symmetric(Y, rtol: float = 1e-12) -> bool:
+    """Ybus sem defasadores é simétrica (não hermitiana): Y == Y.T."""
+    diff = abs(Y - Y.T)
+    if diff.nnz == 0:
+        return True
+    return bool(diff.max() <= rtol * max(abs(Y).max(), 1.0))
+
+
+def _selected_inverse_diagonal(lu) -> np.ndarray:
+    """
+    Diagonal de Z = Y^-1 por inversão seletiva (equações de Takahashi).
+
+    Com P Y P^T = L D L^T, Z_p = L^-T D^-1 L^-1 satisfaz, coluna a coluna de trás
+    para frente (S = linhas não nulas de L[:, j] abaixo da diagonal):
+
+        Z[S, j] = -Z[S, S] @ L[S, j]
+        Z[j, j] = 1/D[j] - L[S, j] @ Z[S, j]
+
+    Só são calculados os elementos de Z no padrão de L (fechado para esses
+    acessos), nunca a inversa inteira.
+    """
+    n = lu.shape[0]
+    L = lu.L.tocsc()
+    L.sort_indices()
+    d = lu.U.diagonal()
+
+    cols = np.repeat(np.arange(n), np.diff(L.indptr))
+    below = L.indices > cols
+    rows = L.indices[below].astype(np.int64)
+    l_vals = L.data[below]
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cols[below], minlength=n), out=ptr[1:])
+    # chave coluna*n + linha: ordenada (CSC com índices ordenados) -> searchsorted
+    keys = cols[below].astype(np.int64) * n + rows
+
+    z_off = np.zeros(len(rows), dtype=complex)  # Z[linha, coluna] no padrão de L
+    z_diag = np.zeros(n, dtype=complex)
+
+    for j in range(n - 1, -1, -1):
+        a, b = ptr[j], ptr[j + 1]
+        if a == b:
+            z_diag[j] = 1.0 / d[j]
+            continue
+        S = rows[a:b]
+        m = b - a
+        Zs = np.zeros((m, m), dtype=complex)
+        if m > 1:
+            iu, ju = np.triu_indices(m, 1)
+            Zs[iu, ju] = z_off[np.searchsorted(keys, S[iu] * n + S[ju])]
+            Zs += Zs.T
+        Zs[np.arange(m), np.arange(m)] = z_diag[S]
+        z = -(Zs @ l_vals[a:b])
+        z_off[a:b] = z
+        z_diag[j] = 1.0 / d[j] - l_vals[a:b] @ z
+
+    # a barra k ocupa a posição perm_c[k] na matriz permutada
+    return z_diag[lu.perm_c]
+
+
+class SequenceNetwork:
+    """
+    Ybus de uma sequência, fatorada uma única vez.
+
+    Um estudo de falta na barra k só precisa da coluna k da Zbus: ela sai de uma
+    solução Y z = e_k com os fatores LU, e fica memorizada por barra. Uma varredura
+    em todas as barras só precisa da diagonal (ver diagonal()).
+    """
+
+    DIAGONAL_BLOCK = 256  # colunas por solve no caminho não simétrico de diagonal()
+
+    def __init__(self, ybus) -> None:
+        from scipy.sparse import csc_matrix
+
+        self.ybus = csc_matrix(ybus, dtype=complex)
+        self.n: int = self.ybus.shape[0]
+        self.symmetric = _is_symmetric(self.ybus)
+        self._lu = _factorize(self.ybus, symmetric=self.symmetric)
+        self._columns: Dict[int, np.ndarray] = {}
+        self._diagonal: np.ndarray | None = None
+
+    def __getstate__(self) -> dict:
+        # fatores do SuperLU não são serializáveis: outro processo refatora a Ybus
+        return {"ybus": self.ybus}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["ybus"])
+
+    def solve(self, b: np.ndarray, trans: str = "N") -> np.ndarray:
+        """Resolve Ybus x = b (b pode ter várias colunas); trans="T" resolve Ybus^T x = b."""
+        return self._lu.solve(np.asarray(b, dtype=complex), trans=trans)
+
+    def column(self, k: int) -> np.ndarray:
+        """Coluna k da Zbus (somente leitura, memorizada)."""
+        col = self._columns.get(k)
+        if col is None:
+            e = np.zeros(self.n, dtype=complex)
+            e[k] = 1.0
+            col = self.solve(e)
+            col.setflags(write=False)
+            self._columns[k] = col
+        return col
+
+    def diagonal(self) -> np.ndarray:
+        """
+        Diagonal da Zbus (Z[k, k] de todas as barras; somente leitura, memorizada).
+
+        Ybus simétrica: inversão seletiva sobre os fatores L D L^T. Com defasador
+        (Y != Y.T) não há L D L^T; resolve blocos de colunas e guarda só a diagonal.
+        """
+        if self._diagonal is None:
+            if isinstance(self._lu, _DenseFallback):
+                diag = np.diag(self._lu._z).copy()
+            elif self.symmetric and np.array_equal(self._lu.perm_r, self._lu.perm_c):
+                diag = _selected_inverse_diagonal(self._lu)
+            else:
+                diag = np.empty(self.n, dtype=complex)
+                for start in range(0, self.n, self.DIAGONAL_BLOCK):
+                    stop = min(start + self.DIAGONAL_BLOCK, self.n)
+                    block = np.zeros((self.n, stop - start), dtype=complex)
+                    block[np.arange(start, stop), np.arange(stop - start)] = 1.0
+                    diag[start:stop] = self.solve(block)[np.arange(start, stop), np.arange(stop - start)]
+            diag.setflags(write=False)
+            self._diagonal = diag
+        return self._diagonal
+
+
+class OutageNetwork:
+    """
+    Rede de sequência com ramos fora de serviço, sem refatorar a Ybus.
+
+    Retirar os ramos dá Y' = Y - E D E^T, com E = colunas da identidade nas p
+    barras terminais e D (p x p) a soma dos quadripolos retirados. Pela
+    identidade de Sherman-Morrison-Woodbury,
+
+        Z' = Z + (Z E) K (E^T Z),   K = D (I - E^T Z E D)^-1
+
+    então só são necessárias as colunas de Z nas barras terminais (memorizadas
+    na rede base) e uma matriz p x p; cada solve é o da base mais uma correção
+    de posto p. Mesma interface de SequenceNetwork (solve/column/diagonal).
+    """
+
+    def __init__(self, base, terminals: np.ndarray, d: np.ndarray, ze: np.ndarray, k: np.ndarray) -> None:
+        self.base = base
+        self.n: int = base.n
+        self.terminals = terminals
+        self.symmetric = base.symmetric and np.allclose(d, d.T)
+        self._d = d
+        self._ze = ze  # Z E: (n, p)
+        self._k = k
+        self._columns: Dict[int, np.ndarray] = {}
+        self._diagonal: np.ndarray | None = None
+
+    @property
+    def ybus(self):
+        return self.base.ybus - _terminal_matrix(self.n, self.terminals, self._d)
+
+    def solve(self, b: np.ndarray, trans: str = "N") -> np.ndarray:
+        if trans == "T":
+            # Z'^T = Z^T + (E^T Z)^T K^T (Z E)^T
+            b = np.asarray(b, dtype=complex)
+            return self.base.solve(b, trans="T") + self._rows() @ (self._k.T @ (self._ze.T @ b))
+        x = self.base.solve(b)
+        return x + self._ze @ (self._k @ x[self.terminals])
+
+    def column(self, k: int) -> np.ndarray:
+        col = self._columns.get(k)
+        if col is None:
+            base_col = self.base.column(k)
+            col = base_col + self._ze @ (self._k @ base_col[self.terminals])
+            col.setflags(write=False)
+            self._columns[k] = col
+        return col
+
+    def _rows(self) -> np.ndarray:
+        """(E^T Z)^T: (n, p). Com Ybus simétrica é o próprio Z E."""
+        if self.base.symmetric:
+            return self._ze
+        e = np.zeros((self.n, len(self.terminals)), dtype=complex)
+        e[self.terminals, np.arange(len(self.terminals))] = 1.0
+        return self.base.solve(e, trans="T")
+
+    def diagonal(self) -> np.ndarray:
+        """diag(Z') = diag(Z) + soma_pq (Z E)[i, p] K[p, q] (E^T Z)[q, i]: O(n p²)."""
+        if self._diagonal is None:
+            diag = self.base.diagonal() + np.einsum("ip,pq,iq->i", self._ze, self._k, self._rows())
+            diag.setflags(write=False)
+            self._diagonal = diag
+        return self._diagonal
+
+
+def _terminal_matrix(n: int, terminals: np.ndarray, d: np.ndarray):
+    """E D E^T como matriz esparsa n x n."""
+    from scipy.sparse import coo_matrix
+
+    p = len(terminals)
+    rows = np.repeat(terminals, p)
+    cols = np.tile(terminals, p)
+    return coo_matrix((d.ravel(), (rows, cols)), shape=(n, n)).tocsc()
+
+
+OUTAGE_ISLAND_COND = 1e10  # acima disso I - E^T Z E D é tratada como singular (ilhamento)
+
+
+def _outage_network(base, terminals: np.ndarray, d: np.ndarray, ze: np.ndarray | None = None):
+    """
+    Rede base sem os ramos de D (ver OutageNetwork).
+
+    Se I - E^T Z E D for singular, a retirada ilhou parte da rede nessa sequência
+    (det Y' = det Y · det(I - E^T Z E D)): aí refatora Y' como SequenceNetwork,
+    com a mesma regularização de _factorize. ze: colunas Z E já calculadas.
+    Retorna (rede, ilhou).
+    """
+    if ze is None:
+        ze = np.column_stack([base.column(int(k)) for k in terminals])
+    m = np.eye(len(terminals)) - ze[terminals] @ d
+    if np.linalg.cond(m) > OUTAGE_ISLAND_COND:
+        return SequenceNetwork(base.ybus - _terminal_matrix(base.n, terminals, d)), True
+    return OutageNetwork(base, terminals, d, ze, d @ np.linalg.inv(m)), False
 
 
 class ShortCircuitSolver:
@@ -32,25 +295,94 @@ class ShortCircuitSolver:
     Resolve falta trifásica (simétrica) usando apenas a rede de sequência positiva.
     """
 
-    def __init__(self, ybus: np.ndarray, pre_fault_voltages: Dict[str, complex], bus_index: Dict[str, int], ybus_negative: np.ndarray | None = None, ybus_zero: np.ndarray | None = None):
+    def __init__(
+        self,
+        ybus,
+        pre_fault_voltages: Dict[str, complex],
+        bus_index: Dict[str, int],
+        ybus_negative=None,
+        ybus_zero=None,
+        branches: BranchPrimitives | None = None,
+        generators: GeneratorPrimitives | None = None,
+    ):
         """
-        :param ybus: matriz Ybus (sequência positiva), NxN, como numpy.array de complexos
+        :param ybus: matriz Ybus (sequência positiva), NxN, numpy.array ou matriz esparsa scipy
         :param pre_fault_voltages: tensões pré-falta em pu, ex: {"B1": 1+0j, "B2": 0.98-0.02j, ...}
         :param bus_index: mapeia id da barra -> índice da matriz, ex: {"B1": 0, "B2": 1, ...}
+        :param branches / generators: quadripolos dos ramos e shunts dos geradores; se
+            informados, os resultados trazem as correntes nos ramos e as contribuições
+
+        Nenhuma Zbus é invertida: cada sequência guarda os fatores LU da sua Ybus
+        e as colunas da Zbus são calculadas sob demanda (ver SequenceNetwork).
         """
-        self.y1 = ybus
-        self.y2 = ybus_negative if ybus_negative is not None else ybus
-        self.y0 = ybus_zero if ybus_zero is not None else ybus
-        
+        self.net1 = SequenceNetwork(ybus)
+        # Y2/Y0 não informadas (ou o mesmo objeto): reaproveita a fatoração da positiva
+        self.net2 = self.net1 if ybus_negative is None or ybus_negative is ybus else SequenceNetwork(ybus_negative)
+        self.net0 = self.net1 if ybus_zero is None or ybus_zero is ybus else SequenceNetwork(ybus_zero)
+
+        self.y1 = self.net1.ybus
+        self.y2 = self.net2.ybus
+        self.y0 = self.net0.ybus
+        self.ybus = self.y1
+
         self.pre_v = pre_fault_voltages
         self.bus_index = bus_index
 
-        self.z1 = safe_inv(self.y1)
-        self.z2 = safe_inv(self.y2)
-        self.z0 = safe_inv(self.y0)
+        # mesmas barras em forma de vetor (ordem de bus_index), para os cálculos pós-falta
+        self._bus_ids = list(bus_index)
+        self._idx = np.fromiter(bus_index.values(), dtype=np.int64, count=len(bus_index))
+        self._pre_v = np.array([pre_fault_voltages[b] for b in self._bus_ids], dtype=complex)
+
+        # posição de cada índice da matriz nesse vetor (ramos/geradores guardam índices da matriz)
+        self._row_of = np.empty(len(self._idx), dtype=np.int64)
+        self._row_of[self._idx] = np.arange(len(self._idx))
+        self.branches = branches
+        self.generators = generators
+        self._branch_rows = None if branches is None else (self._row_of[branches.f], self._row_of[branches.t])
+        self._generator_rows = None if generators is None else self._row_of[generators.bus]
+        self.outages: tuple[str, ...] = ()  # ramos fora de serviço (ver with_outage)
+
+    def _element_currents(
+        self, V012: np.ndarray
+    ) -> tuple[BranchCurrents | None, GeneratorCurrents | None]:
+        """
+        Correntes nos ramos e dos geradores a partir das tensões pós-falta.
 
-        self.ybus = self.y1
-        self.zbus = self.z1
+        V012: (..., n, 3) na ordem de bus_index; a saída tem as mesmas dimensões
+        iniciais, com (m, 3) / (g, 3) no fim. Tudo em operações de array.
+        """
+        A_T = self._symm_matrix_A().T
+        branch_currents = None
+        if self.branches is not None and self._branch_rows is not None:
+            f_rows, t_rows = self._branch_rows
+            i_from, i_to = self.branches.currents(V012[..., f_rows, :], V012[..., t_rows, :])
+            branch_currents = BranchCurrents(
+                ids=self.branches.ids,
+                from_bus=self.branches.from_bus,
+                to_bus=self.branches.to_bus,
+                i_from_012=i_from,
+                i_to_012=i_to,
+                i_from_abc=i_from @ A_T,
+                i_to_abc=i_to @ A_T,
+            )
+
+        generator_currents = None
+        if self.generators is not None and self._generator_rows is not None:
+            rows = self._generator_rows
+            delta_v = V012[..., rows, :].copy()
+            delta_v[..., 1] -= self._pre_v[rows]
+            i_gen = self.generators.currents(delta_v)
+            generator_currents = GeneratorCurrents(
+                ids=self.generators.ids,
+                bus_ids=self.generators.bus_ids,
+                i_012=i_gen,
+                i_abc=i_gen @ A_T,
+            )
+        return branch_currents, generator_currents
+
+    def _zbus_columns(self, k: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Colunas k das Zbus de sequência (Z0[:, k], Z1[:, k], Z2[:, k])."""
+        return self.net0.column(k), self.net1.column(k), self.net2.column(k)
 
     def three_phase_fault(self, spec: FaultSpec) -> FaultStudyResult:
         """
@@ -71,39 +403,213 @@ class ShortCircuitSolver:
         V_pref = self.pre_v[fault_bus_id]
 
         # impedância de Thevenin vista da barra de falta
-        Z_th = self.zbus[k, k]
+        z1k = self.net1.column(k)
+        Z_th = z1k[k]
 
         # corrente de falta na barra em falta (seq. positiva)
         I_fault = V_pref / (Z_th + z_fault_pu)
+        return self._post_fault_result(spec, (0 + 0j, I_fault, 0 + 0j), phase_index=0)
+
+    def _post_fault_result(
+        self,
+        spec: FaultSpec,
+        i012: tuple[complex, complex, complex],
+        phase_index: int,
+        injection: list[tuple[int, float]] | None = None,
+    ) -> FaultStudyResult:
+        """
+        Tensões pós-falta de todas as barras a partir das correntes de sequência na falta.
+
+        V012 = [-Z0[:, k] I0, Vpre - Z1[:, k] I1, -Z2[:, k] I2] são três operações em
+        vetores (nenhum laço por barra); Vabc = V012 @ A^T converte tudo para abc
+        num único produto (n x 3)(3 x 3).
+
+        injection: a corrente de falta sai de uma combinação de barras [(índice, peso)]
+        em vez da barra spec.bus_id (falta no meio da linha, ver line_fault).
+        """
+        if injection is None:
+            injection = [(self.bus_index[spec.bus_id], 1.0)]
+        idx = self._idx
+
+        # sequência sem corrente (ex.: 0 e 2 na falta 3φ) não precisa da coluna da Zbus
+        V012 = np.zeros((len(idx), 3), dtype=complex)
+        V012[:, 1] = self._pre_v
+        for s, (net, current) in enumerate(zip((self.net0, self.net1, self.net2), i012)):
+            if current != 0:
+                for k, weight in injection:
+                    V012[:, s] -= net.column(k)[idx] * (weight * current)
+
         A = self._symm_matrix_A()
-        Iabc_fault = tuple((A @ np.array([0+0j, I_fault, 0+0j], dtype=complex)).tolist())
-
-        # resultado por barra
-        results: Dict[str, FaultResultBasic] = {}
-
-        for bus_id, i in self.bus_index.items():
-            Zik = self.zbus[i, k]
-            V_post = self.pre_v[bus_id] - Zik * I_fault
-
-            # por enquanto, corrente não nula só na barra em falta
-            I_bus = I_fault if bus_id == fault_bus_id else 0+0j
-            Vabc = tuple((A @ np.array([0+0j, V_post, 0+0j], dtype=complex)).tolist())
-            Iabc = Iabc_fault if bus_id == fault_bus_id else (0+0j, 0+0j, 0+0j)
-
-            results[bus_id] = FaultResultBasic(
-                bus_id=bus_id,
-                v_pu=V_post,
-                i_pu=I_bus,
-                v_abc=Vabc,
-                i_abc=Iabc,
-            )
+        Vabc = V012 @ A.T
+        Iabc_fault = A @ np.array(i012, dtype=complex)
+        branch_currents, generator_currents = self._element_currents(V012)
 
         return FaultStudyResult(
             spec=spec,
-            fault_current_pu=I_fault,
-            buses=results,
+            fault_current_pu=complex(Iabc_fault[phase_index]),
+            bus_ids=self._bus_ids,
+            v_abc=Vabc,
+            i_abc_fault=Iabc_fault,
+            phase_index=phase_index,
+            branches=branch_currents,
+            generators=generator_currents,
+        )
+
+    def fault_block(
+        self,
+        fault_type: FaultType,
+        phase: str,
+        z_fault_pu: complex,
+        bus_ids: list[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Falta em cada barra de bus_ids, em lote: (I012 na falta (k, 3), V012 (k, n, 3)).
+
+        As k colunas das Zbus saem de um único solve com k lados direitos
+        (memória ~ k·n); V012 segue a ordem de bus_index.
+        """
+        cols = np.array([self.bus_index[b] for b in bus_ids], dtype=np.int64)
+        k = len(cols)
+
+        E = np.zeros((self.net1.n, k), dtype=complex)
+        E[cols, np.arange(k)] = 1.0
+        Z = {}
+        for net in (self.net0, self.net1, self.net2):
+            if id(net) not in Z:
+                # (k, n) na ordem de bus_index
+                Z[id(net)] = net.solve(E)[self._idx].T
+        z0, z1, z2 = (Z[id(net)] for net in (self.net0, self.net1, self.net2))
+
+        rows = self._row_of[cols]
+        faults = np.arange(k)
+        z012 = np.column_stack([z0[faults, rows], z1[faults, rows], z2[faults, rows]])
+        v1_pref = self._pre_v[rows]
+        M, b = self._boundary_system(fault_type, phase, z012, v1_pref, z_fault_pu)
+        i012 = np.linalg.solve(M, b[:, :, None])[:, :, 0]
+
+        V012 = np.empty((k, len(self._idx), 3), dtype=complex)
+        V012[:, :, 0] = -z0 * i012[:, 0:1]
+        V012[:, :, 1] = self._pre_v[None, :] - z1 * i012[:, 1:2]
+        V012[:, :, 2] = -z2 * i012[:, 2:3]
+        return i012, V012
+
+    def fault_contributions(
+        self,
+        fault_type: FaultType,
+        phase: str = "A",
+        z_fault_pu: complex = 0 + 0j,
+        bus_ids: list[str] | None = None,
+    ) -> tuple[list[str], BranchCurrents | None, GeneratorCurrents | None]:
+        """
+        Correntes nos ramos e dos geradores para uma falta em cada barra de bus_ids
+        (padrão: todas), em lote: arrays (k faltas, m ramos | g geradores, 3).
+        Para redes grandes, chame em blocos de barras (ver fault_block).
+        """
+        if bus_ids is None:
+            bus_ids = self._bus_ids
+        _, V012 = self.fault_block(fault_type, phase, z_fault_pu, bus_ids)
+
+        branch_currents, generator_currents = self._element_currents(V012)
+        return list(bus_ids), branch_currents, generator_currents
+
+    # Falta no meio da linha
+
+    def _line_terms(self, line_id: str) -> tuple[int, int, int, np.ndarray]:
+        """(posição do ramo, índice da barra tap, índice da barra z, z série por sequência)."""
+        if self.branches is None:
+            raise ValueError("Solver sem dados dos ramos: falta em linha indisponível.")
+        j = self.branches.position(line_id)
+        if line_id in self.outages:
+            raise ValueError(f"Ramo {line_id!r} está fora de serviço.")
+        if self.branches.is_transformer[j] or abs(self.branches.tap[j] - 1.0) > 1e-9:
+            raise ValueError(f"Falta no meio do ramo {line_id!r}: só para linhas (sem tap).")
+        yft = self.branches.yft[j]
+        if np.any(yft == 0):
+            raise ValueError(f"Ramo {line_id!r} sem impedância série em alguma sequência.")
+        # tap 1: yft = -y  ->  z = -1/yft
+        return j, int(self.branches.f[j]), int(self.branches.t[j]), -1.0 / yft
+
+    def line_fault_sweep(
+        self,
+        line_id: str,
+        positions,
+        fault_type: FaultType,
+        phase: str = "A",
+        z_fault_pu: complex = 0 + 0j,
+    ) -> LineFaultSweepResult:
+        """
+        Falta ao longo de uma linha p-q, em cada fração de positions (0 = tap_bus_id).
+
+        O ponto de falta f é a barra fictícia dos casos 2 e 4 do ZBusSquareMatrix
+        (nova barra ligada a p por αz e a q por (1-α)z, retirando a linha original),
+        em forma fechada sobre as colunas p e q já fatoradas:
+
+            Z_ff = (1-α)² Z_pp + α² Z_qq + α(1-α) (Z_pq + Z_qp + z)
+            V_f  = (1-α) V_p + α V_q
+
+        Cada ponto custa poucas operações escalares; a carga capacitiva da linha
+        continua nas pontas (aproximação).
+        """
+        _, p, q, z = self._line_terms(line_id)
+        alpha = np.atleast_1d(np.asarray(positions, dtype=float))
+        if np.any((alpha < 0) | (alpha > 1)):
+            raise ValueError("Posição da falta deve estar entre 0 e 1.")
+        beta = 1.0 - alpha
+
+        z012 = np.empty((len(alpha), 3), dtype=complex)
+        for s, net in enumerate((self.net0, self.net1, self.net2)):
+            zp, zq = net.column(p), net.column(q)
+            z012[:, s] = beta**2 * zp[p] + alpha**2 * zq[q] + alpha * beta * (zp[q] + zq[p] + z[s])
+        v_pre = beta * self.pre_v_at(p) + alpha * self.pre_v_at(q)
+
+        M, b = self._boundary_system(fault_type, phase, z012, v_pre, z_fault_pu)
+        i012 = np.linalg.solve(M, b[:, :, None])[:, :, 0]
+        i_abc = i012 @ self._symm_matrix_A().T
+        p_phase, _, _ = self._parse_phases(fault_type, phase)
+        return LineFaultSweepResult(
+            line_id=line_id,
+            fault_type=fault_type,
+            phase=phase,
+            positions=alpha,
+            z_thevenin_012=z012,
+            i012=i012,
+            i_abc=i_abc,
+            fault_current_pu=i_abc[:, p_phase],
         )
-    
+
+    def line_fault(self, spec: FaultSpec) -> FaultStudyResult:
+        """
+        Falta em spec.line_id, na fração spec.line_position a partir de tap_bus_id.
+
+        Tensões nas barras: a corrente de falta sai de p e q com pesos (1-α) e α.
+        Nas duas seções da linha em falta somam-se (1-α)·If e α·If às correntes
+        calculadas com o quadripolo da linha inteira.
+        """
+        if spec.line_id is None:
+            raise ValueError("line_fault precisa de spec.line_id")
+        j, p, q, _ = self._line_terms(spec.line_id)
+        alpha = spec.line_position
+        sweep = self.line_fault_sweep(spec.line_id, [alpha], spec.fault_type, spec.phase, spec.z_fault_pu)
+        i012 = sweep.i012[0]
+        p_phase, _, _ = self._parse_phases(spec.fault_type, spec.phase)
+
+        result = self._post_fault_result(
+            spec,
+            (i012[0], i012[1], i012[2]),
+            phase_index=p_phase,
+            injection=[(p, 1.0 - alpha), (q, alpha)],
+        )
+        if result.branches is not None:
+            A_T = self._symm_matrix_A().T
+            result.branches.i_from_012[j] += (1.0 - alpha) * i012
+            result.branches.i_to_012[j] += alpha * i012
+            result.branches.i_from_abc[j] = result.branches.i_from_012[j] @ A_T
+            result.branches.i_to_abc[j] = result.branches.i_to_012[j] @ A_T
+        return result
+
+    def pre_v_at(self, k: int) -> complex:
+        """Tensão pré-falta da barra de índice k na matriz."""
+        return complex(self._pre_v[self._row_of[k]])
 
     # Componentes simétricas
 
@@ -139,28 +645,34 @@ class ShortCircuitSolver:
         - q = segunda fase (LL/DLG) ou None (SLG)
         - r = fase restante (a que NÃO participa em LL/DLG) ou uma das não-faltosas em SLG
         """
-        ft = spec.fault_type
+        return ShortCircuitSolver._parse_phases(spec.fault_type, spec.phase)
+
+    @staticmethod
+    def _parse_phases(ft: FaultType, phase: str) -> tuple[int, int | None, int]:
+        if ft == FaultType.THREE_PHASE:
+            # simétrica: a fase A representa as três
+            return 0, None, 1
 
         if ft == FaultType.SINGLE_LINE_TO_GROUND:
-            p = ShortCircuitSolver._phase_to_index(spec.phase)
+            p = ShortCircuitSolver._phase_to_index(phase)
             others = [0, 1, 2]
             others.remove(p)
             r = others[0]
             return p, None, r
 
         if ft == FaultType.LINE_TO_LINE:
-            ph = spec.phase.upper().strip()
+            ph = phase.upper().strip()
             if ph not in ("AB", "BC", "CA"):
-                raise ValueError(f"Fases inválidas para LL: {spec.phase!r}. Use 'AB', 'BC' ou 'CA'.")
+                raise ValueError(f"Fases inválidas para LL: {phase!r}. Use 'AB', 'BC' ou 'CA'.")
             p = ShortCircuitSolver._phase_to_index(ph[0])
             q = ShortCircuitSolver._phase_to_index(ph[1])
             r = ({0, 1, 2} - {p, q}).pop()
             return p, q, r
 
         if ft == FaultType.DOUBLE_LINE_TO_GROUND:
-            ph = spec.phase.upper().strip()
+            ph = phase.upper().strip()
             if ph not in ("ABG", "BCG", "CAG"):
-                raise ValueError(f"Fases inválidas para DLG: {spec.phase!r}. Use 'ABG', 'BCG' ou 'CAG'.")
+                raise ValueError(f"Fases inválidas para DLG: {phase!r}. Use 'ABG', 'BCG' ou 'CAG'.")
             p = ShortCircuitSolver._phase_to_index(ph[0])
             q = ShortCircuitSolver._phase_to_index(ph[1])
             r = ({0, 1, 2} - {p, q}).pop()
@@ -168,88 +680,335 @@ class ShortCircuitSolver:
 
         raise ValueError(f"Tipo de falta não suportado aqui: {ft}")
 
-    def _solve_sequence_currents_at_fault_bus(self, spec: FaultSpec) -> tuple[complex, complex, complex]:
+    @staticmethod
+    def _boundary_system(
+        ft: FaultType,
+        phase: str,
+        z012: np.ndarray,
+        v1_pref: np.ndarray,
+        z_fault,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Resolve I0, I1, I2 na barra da falta (Thevenin por sequência) impondo
-        condições de contorno em abc. Isso permite escolher A/B/C (ou AB/BC/CA, ABG/BCG/CAG)
-        sem "gambiarras" e corrige LL sólida.
+        Monta as condições de contorno em abc de m faltas de uma vez.
 
-        Retorna: (I0, I1, I2)
+        z012: (m, 3) com [Z0kk, Z1kk, Z2kk] de cada barra em falta
+        v1_pref: (m,) tensões pré-falta; z_fault: escalar ou (m,)
+        Retorna M (m, 3, 3) e b (m, 3) tais que M @ [I0, I1, I2] = b.
         """
-        fault_bus_id = spec.bus_id
-        k = self.bus_index[fault_bus_id]
+        m = z012.shape[0]
+        A = ShortCircuitSolver._symm_matrix_A()
+        Zf = np.broadcast_to(np.asarray(z_fault, dtype=complex), (m,))[:, None]
 
-        Zf = spec.z_fault_pu
-        V1_pref = self.pre_v[fault_bus_id]
+        # Iabc = A @ [I0,I1,I2]
+        Irow = np.broadcast_to(A, (m, 3, 3))
+        # V012 = [ -Z0 I0, V1_pref - Z1 I1, -Z2 I2 ] = c + D x
+        # Vabc = A @ (c + D x) = Vconst + Vrow x
+        Vrow = A[None, :, :] * (-z012)[:, None, :]
+        Vconst = A[None, :, 1] * v1_pref[:, None]
+
+        M = np.empty((m, 3, 3), dtype=complex)
+        b = np.zeros((m, 3), dtype=complex)
+        p, q, r = ShortCircuitSolver._parse_phases(ft, phase)
+
+        if ft == FaultType.THREE_PHASE:
+            # só sequência positiva: I0 = I2 = 0, (Z1 + Zf) I1 = V1_pref
+            M[:] = 0
+            M[:, 0, 0] = 1
+            M[:, 1, 2] = 1
+            M[:, 2, 1] = z012[:, 1] + Zf[:, 0]
+            b[:, 2] = v1_pref
+
+        elif ft == FaultType.SINGLE_LINE_TO_GROUND:
+            others = [0, 1, 2]
+            others.remove(p)
+            M[:, 0] = Irow[:, others[0]]
+            M[:, 1] = Irow[:, others[1]]
+            M[:, 2] = Vrow[:, p] - Zf * Irow[:, p]
+            b[:, 2] = -Vconst[:, p]
 
-        Z0kk = self.z0[k, k]
-        Z1kk = self.z1[k, k]
-        Z2kk = self.z2[k, k]
+        elif ft == FaultType.LINE_TO_LINE:
+            assert q is not None
+            M[:, 0] = Irow[:, r]
+            M[:, 1] = Irow[:, p] + Irow[:, q]
+            M[:, 2] = (Vrow[:, p] - Vrow[:, q]) - Zf * Irow[:, p]
+            b[:, 2] = -(Vconst[:, p] - Vconst[:, q])
 
-        A = self._symm_matrix_A()
+        elif ft == FaultType.DOUBLE_LINE_TO_GROUND:
+            assert q is not None
+            sum_I = Irow[:, p] + Irow[:, q]
+            M[:, 0] = Irow[:, r]
+            M[:, 1] = Vrow[:, p] - Zf * sum_I
+            M[:, 2] = Vrow[:, q] - Zf * sum_I
+            b[:, 1] = -Vconst[:, p]
+            b[:, 2] = -Vconst[:, q]
 
-        # Iabc = A @ [I0,I1,I2]
-        Irow = A
+        else:
+            raise ValueError(f"Tipo de falta não suportado: {ft}")
 
-        # V012 = [ -Z0 I0, V1_pref - Z1 I1, -Z2 I2 ] = c + D x
-        D = np.diag([-Z0kk, -Z1kk, -Z2kk]).astype(complex)
-        c = np.array([0 + 0j, V1_pref, 0 + 0j], dtype=complex)
+        return M, b
 
-        # Vabc = A @ (c + D x) = Vconst + Vrow x
-        Vconst = A @ c
-        Vrow = A @ D
+    def _solve_sequence_currents_at_fault_bus(self, spec: FaultSpec) -> tuple[complex, complex, complex]:
+        """
+        Resolve I0, I1, I2 na barra da falta (Thevenin por sequência) impondo
+        condições de contorno em abc. Isso permite escolher A/B/C (ou AB/BC/CA, ABG/BCG/CAG)
+        sem "gambiarras" e corrige LL sólida.
 
-        ft = spec.fault_type
-        p, q, r = self._parse_fault_phases(spec)
+        Retorna: (I0, I1, I2)
+        """
+        if spec.fault_type == FaultType.THREE_PHASE:
+            raise ValueError(f"Tipo de falta não suportado: {spec.fault_type}")
 
-        rows = []
-        rhs = []
+        k = self.bus_index[spec.bus_id]
+        z0k, z1k, z2k = self._zbus_columns(k)
+        z012 = np.array([[z0k[k], z1k[k], z2k[k]]], dtype=complex)
+        v1_pref = np.array([self.pre_v[spec.bus_id]], dtype=complex)
 
-        if ft == FaultType.SINGLE_LINE_TO_GROUND:
-            others = [0, 1, 2]
-            others.remove(p)
-
-            rows.append(Irow[others[0]])
-            rhs.append(0 + 0j)
+        M, b = self._boundary_system(spec.fault_type, spec.phase, z012, v1_pref, spec.z_fault_pu)
+        I0, I1, I2 = np.linalg.solve(M[0], b[0])
+        return I0, I1, I2
 
-            rows.append(Irow[others[1]])
-            rhs.append(0 + 0j)
+    def fault_sweep(
+        self,
+        z_fault_pu: complex = 0 + 0j,
+        s_base_mva: float = 100.0,
+        slg_phase: str = "A",
+        ll_phase: str = "BC",
+        dlg_phase: str = "BCG",
+    ) -> FaultSweepResult:
+        """
+        Falta 3φ, SLG, LL e DLG em todas as barras, numa só passada vetorizada.
 
-            rows.append(Vrow[p] - Zf * Irow[p])
-            rhs.append(-(Vconst[p]))
+        Só usa a diagonal das três Zbus (SequenceNetwork.diagonal) e resolve as
+        4·n condições de contorno como uma pilha de sistemas 3x3.
+        """
+        order = sorted(self.bus_index.items(), key=lambda item: item[1])
+        bus_ids = [bus_id for bus_id, _ in order]
+        idx = np.array([i for _, i in order], dtype=np.int64)
+        m = len(idx)
 
-        elif ft == FaultType.LINE_TO_LINE:
-            assert q is not None
-            rows.append(Irow[r])
-            rhs.append(0 + 0j)
+        z012 = np.column_stack(
+            [self.net0.diagonal()[idx], self.net1.diagonal()[idx], self.net2.diagonal()[idx]]
+        )
+        v1_pref = np.array([self.pre_v[bus_id] for bus_id in bus_ids], dtype=complex)
 
-            rows.append(Irow[p] + Irow[q])
-            rhs.append(0 + 0j)
+        kinds = (
+            (FaultType.THREE_PHASE, "A"),
+            (FaultType.SINGLE_LINE_TO_GROUND, slg_phase),
+            (FaultType.LINE_TO_LINE, ll_phase),
+            (FaultType.DOUBLE_LINE_TO_GROUND, dlg_phase),
+        )
+        systems = [self._boundary_system(ft, ph, z012, v1_pref, z_fault_pu) for ft, ph in kinds]
+        M = np.concatenate([s[0] for s in systems])
+        b = np.concatenate([s[1] for s in systems])
+        i012_all = np.linalg.solve(M, b[:, :, None])[:, :, 0]
+        iabc_all = i012_all @ self._symm_matrix_A().T
+
+        result = FaultSweepResult(bus_ids=bus_ids, z_fault_pu=z_fault_pu, s_base_mva=s_base_mva)
+        v_mag = np.abs(v1_pref)
+        for j, (ft, ph) in enumerate(kinds):
+            p, _, _ = self._parse_phases(ft, ph)
+            i012 = i012_all[j * m : (j + 1) * m]
+            iabc = iabc_all[j * m : (j + 1) * m]
+            result.phases[ft] = ph
+            result.i012[ft] = i012
+            result.i_abc[ft] = iabc
+            result.fault_current_pu[ft] = iabc[:, p]
+            result.mva[ft] = v_mag * np.abs(iabc[:, p]) * s_base_mva
+        return result
+
+    def parametric_sweep(
+        self,
+        fault_type: FaultType,
+        z_fault_pu=0 + 0j,
+        operating_points=None,
+        phase: str = "A",
+        s_base_mva: float = 100.0,
+    ) -> FaultParametricResult:
+        """
+        Falta em todas as barras para cada Zf e cada condição pré-falta.
 
-            rows.append((Vrow[p] - Vrow[q]) - Zf * Irow[p])
-            rhs.append(-(Vconst[p] - Vconst[q]))
+        z_fault_pu: escalar ou array (F,) de impedâncias de falta
+        operating_points: lista (P) de tensões pré-falta; cada item é um dict
+            {bus_id: V}, um array na ordem de bus_index ou um escalar (ex.: 1.0 =
+            flat start). None = tensões do fluxo de potência do solver.
 
-        elif ft == FaultType.DOUBLE_LINE_TO_GROUND:
-            assert q is not None
-            rows.append(Irow[r])
-            rhs.append(0 + 0j)
+        As condições de contorno são lineares em V_pre: resolve-se uma vez a
+        pilha (n·F) de sistemas 3x3 com V_pre = 1 e o resto é broadcast numpy,
+        I012[bus, zf, op] = X[bus, zf] · V_pre[bus, op].
+        """
+        bus_ids = self._bus_ids
+        idx = self._idx
+        n = len(idx)
+        zf = np.atleast_1d(np.asarray(z_fault_pu, dtype=complex))
+        n_zf = len(zf)
+
+        if operating_points is None:
+            operating_points = [self._pre_v]
+        v_pre = np.empty((n, len(operating_points)), dtype=complex)
+        for j, point in enumerate(operating_points):
+            if isinstance(point, dict):
+                v_pre[:, j] = [point[bus_id] for bus_id in bus_ids]
+            else:
+                v_pre[:, j] = np.broadcast_to(np.asarray(point, dtype=complex), (n,))
 
-            sum_I = Irow[p] + Irow[q]
-            rows.append(Vrow[p] - Zf * sum_I)
-            rhs.append(-(Vconst[p]))
+        z012 = np.column_stack(
+            [self.net0.diagonal()[idx], self.net1.diagonal()[idx], self.net2.diagonal()[idx]]
+        )
+        # (n·F) sistemas: barra varia mais devagar, Zf mais depressa
+        M, b = self._boundary_system(
+            fault_type,
+            phase,
+            np.repeat(z012, n_zf, axis=0),
+            np.ones(n * n_zf, dtype=complex),
+            np.tile(zf, n),
+        )
+        x = np.linalg.solve(M, b[:, :, None])[:, :, 0].reshape(n, n_zf, 3)
+
+        i012 = x[:, :, None, :] * v_pre[:, None, :, None]  # (n, F, P, 3)
+        i_abc = i012 @ self._symm_matrix_A().T
+        p, _, _ = self._parse_phases(fault_type, phase)
+        fault_current = i_abc[..., p]
+        return FaultParametricResult(
+            bus_ids=bus_ids,
+            fault_type=fault_type,
+            phase=phase,
+            z_fault_pu=zf,
+            pre_fault_voltages=v_pre,
+            i012=i012,
+            i_abc=i_abc,
+            fault_current_pu=fault_current,
+            mva=np.abs(v_pre)[:, None, :] * np.abs(fault_current) * s_base_mva,
+        )
 
-            rows.append(Vrow[q] - Zf * sum_I)
-            rhs.append(-(Vconst[q]))
+    # Contingências (ramos fora de serviço)
 
-        else:
-            raise ValueError(f"Tipo de falta não suportado: {ft}")
+    def _outage_networks(
+        self, positions: np.ndarray, columns: dict | None = None
+    ) -> tuple[tuple, bool]:
+        """
+        (net0, net1, net2) sem os ramos de positions, e se alguma sequência ilhou.
 
-        M = np.vstack(rows).astype(complex)
-        b = np.array(rhs, dtype=complex)
+        columns: {id(rede): (posição de cada barra em cols, cols)} com colunas da Zbus
+        já resolvidas em lote (outage_sweep); senão usa rede.column (memorizada).
+        """
+        br = self.branches
+        assert br is not None
+        f, t = br.f[positions], br.t[positions]
+        terminals = np.unique(np.concatenate([f, t]))
+        lf, lt = np.searchsorted(terminals, f), np.searchsorted(terminals, t)
+        p = len(terminals)
+
+        nets: dict = {}
+        islanded = False
+        for s, net in enumerate((self.net0, self.net1, self.net2)):
+            if id(net) in nets:
+                continue
+            d = np.zeros((p, p), dtype=complex)
+            np.add.at(d, (lf, lf), br.yff[positions, s])
+            np.add.at(d, (lf, lt), br.yft[positions, s])
+            np.add.at(d, (lt, lf), br.ytf[positions, s])
+            np.add.at(d, (lt, lt), br.ytt[positions, s])
+            ze = None
+            if columns is not None:
+                pos_of, cols = columns[id(net)]
+                ze = cols[:, pos_of[terminals]]
+            nets[id(net)], isl = _outage_network(net, terminals, d, ze)
+            islanded |= isl
+        return tuple(nets[id(net)] for net in (self.net0, self.net1, self.net2)), islanded
+
+    def with_outage(self, branch_ids) -> "ShortCircuitSolver":
+        """
+        Solver da mesma rede com os ramos branch_ids fora de serviço.
 
-        I0, I1, I2 = np.linalg.solve(M, b)
-        return I0, I1, I2
+        Nada é refatorado: cada sequência vira uma OutageNetwork (correção de
+        Woodbury de posto <= 2 por ramo sobre os fatores já prontos), e todos os
+        estudos (faltas, varreduras, correntes nos ramos) funcionam sobre ela.
+        As tensões pré-falta continuam as do caso base.
+        """
+        if self.branches is None:
+            raise ValueError("Solver sem dados dos ramos: contingência indisponível.")
+        ids = tuple(dict.fromkeys(branch_ids))
+        repeated = set(ids) & set(self.outages)
+        if repeated:
+            raise ValueError(f"Ramo(s) já fora de serviço: {sorted(repeated)}")
+        positions = np.array([self.branches.position(b) for b in ids], dtype=np.int64)
+        (net0, net1, net2), _ = self._outage_networks(positions)
+
+        solver = copy.copy(self)
+        solver.net0, solver.net1, solver.net2 = net0, net1, net2
+        solver.y0, solver.y1, solver.y2 = net0.ybus, net1.ybus, net2.ybus
+        solver.ybus = solver.y1
+        solver.branches = self.branches.out_of_service(positions)
+        solver.outages = self.outages + ids
+        return solver
+
+    def outage_sweep(
+        self,
+        fault_type: FaultType,
+        phase: str = "A",
+        z_fault_pu: complex = 0 + 0j,
+        outages=None,
+        s_base_mva: float = 100.0,
+        chunk: int = 256,
+    ) -> FaultOutageSweepResult:
+        """
+        Falta em todas as barras para cada contingência (padrão: N-1 de todos os ramos).
 
+        outages: lista de ids de ramo ou de grupos de ids (retirados juntos).
+        Para cada bloco de `chunk` contingências, as colunas da Zbus nas barras
+        terminais saem de um único solve com vários lados direitos; cada caso
+        custa então a diagonal corrigida (O(n p²)) e as condições de contorno de
+        todos os casos são resolvidas juntas como uma pilha de sistemas 3x3.
+        """
+        br = self.branches
+        if br is None:
+            raise ValueError("Solver sem dados dos ramos: contingência indisponível.")
+        if outages is None:
+            cases = [(bid,) for bid in br.ids]
+        else:
+            cases = [(o,) if isinstance(o, str) else tuple(dict.fromkeys(o)) for o in outages]
+        positions = [np.array([br.position(b) for b in case], dtype=np.int64) for case in cases]
+
+        idx = self._idx
+        n, o = len(idx), len(cases)
+        z012 = np.empty((o, n, 3), dtype=complex)
+        islanded = np.zeros(o, dtype=bool)
+        unique_nets = list({id(net): net for net in (self.net0, self.net1, self.net2)}.values())
+
+        for start in range(0, o, chunk):
+            block = positions[start : start + chunk]
+            needed = np.unique(np.concatenate([np.concatenate([br.f[p], br.t[p]]) for p in block]))
+            pos_of = np.full(self.net1.n, -1, dtype=np.int64)
+            pos_of[needed] = np.arange(len(needed))
+            e = np.zeros((self.net1.n, len(needed)), dtype=complex)
+            e[needed, np.arange(len(needed))] = 1.0
+            columns = {id(net): (pos_of, net.solve(e)) for net in unique_nets}
+
+            for j, p in enumerate(block):
+                nets, islanded[start + j] = self._outage_networks(p, columns)
+                for s, net in enumerate(nets):
+                    z012[start + j, :, s] = net.diagonal()[idx]
+
+        M, b = self._boundary_system(
+            fault_type, phase, z012.reshape(-1, 3), np.tile(self._pre_v, o), z_fault_pu
+        )
+        i012 = np.linalg.solve(M, b[:, :, None])[:, :, 0].reshape(o, n, 3)
+        i_abc = i012 @ self._symm_matrix_A().T
+        p_phase, _, _ = self._parse_phases(fault_type, phase)
+        fault_current = i_abc[..., p_phase]
+        return FaultOutageSweepResult(
+            outages=cases,
+            bus_ids=self._bus_ids,
+            fault_type=fault_type,
+            phase=phase,
+            z_fault_pu=z_fault_pu,
+            s_base_mva=s_base_mva,
+            islanded=islanded,
+            i012=i012,
+            i_abc=i_abc,
+            fault_current_pu=fault_current,
+            mva=np.abs(self._pre_v)[None, :] * np.abs(fault_current) * s_base_mva,
+        )
 
     def single_line_to_ground_fault(self, spec: FaultSpec) -> FaultStudyResult:
         """
@@ -260,42 +1019,9 @@ class ShortCircuitSolver:
         if spec.fault_type != FaultType.SINGLE_LINE_TO_GROUND:
             raise ValueError("single_line_to_ground_fault só aceita FaultType.SINGLE_LINE_TO_GROUND")
 
-        fault_bus_id = spec.bus_id
-        k = self.bus_index[fault_bus_id]
-
         I0, I1, I2 = self._solve_sequence_currents_at_fault_bus(spec)
-        A = self._symm_matrix_A()
-
-        V0_post: Dict[str, complex] = {}
-        V1_post: Dict[str, complex] = {}
-        V2_post: Dict[str, complex] = {}
-
-        for bus_id, i in self.bus_index.items():
-            Z0ik = self.z0[i, k]
-            Z1ik = self.z1[i, k]
-            Z2ik = self.z2[i, k]
-
-            V0_post[bus_id] = -Z0ik * I0
-            V1_post[bus_id] = self.pre_v[bus_id] - Z1ik * I1
-            V2_post[bus_id] = -Z2ik * I2
-
-        Iabc_fault = tuple((A @ np.array([I0, I1, I2], dtype=complex)).tolist())
-        p = self._phase_to_index(spec.phase)
-
-        results: Dict[str, FaultResultBasic] = {}
-        for bus_id in self.bus_index.keys():
-            Vabc = tuple((A @ np.array([V0_post[bus_id], V1_post[bus_id], V2_post[bus_id]], dtype=complex)).tolist())
-            Iabc = Iabc_fault if bus_id == fault_bus_id else (0 + 0j, 0 + 0j, 0 + 0j)
-
-            results[bus_id] = FaultResultBasic(
-                bus_id=bus_id,
-                v_pu=Vabc[p],
-                i_pu=Iabc[p],
-                v_abc=Vabc,
-                i_abc=Iabc,
-            )
-
-        return FaultStudyResult(spec=spec, fault_current_pu=results[fault_bus_id].i_pu, buses=results)
+        p, _, _ = self._parse_fault_phases(spec)
+        return self._post_fault_result(spec, (I0, I1, I2), phase_index=p)
 
     def line_to_line_fault(self, spec: FaultSpec) -> FaultStudyResult:
         """
@@ -306,42 +1032,9 @@ class ShortCircuitSolver:
         if spec.fault_type != FaultType.LINE_TO_LINE:
             raise ValueError("line_to_line_fault só aceita FaultType.LINE_TO_LINE")
 
-        fault_bus_id = spec.bus_id
-        k = self.bus_index[fault_bus_id]
-
         I0, I1, I2 = self._solve_sequence_currents_at_fault_bus(spec)
-        A = self._symm_matrix_A()
-
-        V0_post: Dict[str, complex] = {}
-        V1_post: Dict[str, complex] = {}
-        V2_post: Dict[str, complex] = {}
-
-        for bus_id, i in self.bus_index.items():
-            Z0ik = self.z0[i, k]
-            Z1ik = self.z1[i, k]
-            Z2ik = self.z2[i, k]
-
-            V0_post[bus_id] = -Z0ik * I0
-            V1_post[bus_id] = self.pre_v[bus_id] - Z1ik * I1
-            V2_post[bus_id] = -Z2ik * I2
-
-        Iabc_fault = tuple((A @ np.array([I0, I1, I2], dtype=complex)).tolist())
         p, _, _ = self._parse_fault_phases(spec)
-
-        results: Dict[str, FaultResultBasic] = {}
-        for bus_id in self.bus_index.keys():
-            Vabc = tuple((A @ np.array([V0_post[bus_id], V1_post[bus_id], V2_post[bus_id]], dtype=complex)).tolist())
-            Iabc = Iabc_fault if bus_id == fault_bus_id else (0 + 0j, 0 + 0j, 0 + 0j)
-
-            results[bus_id] = FaultResultBasic(
-                bus_id=bus_id,
-                v_pu=Vabc[p],
-                i_pu=Iabc[p],
-                v_abc=Vabc,
-                i_abc=Iabc,
-            )
-
-        return FaultStudyResult(spec=spec, fault_current_pu=results[fault_bus_id].i_pu, buses=results)
+        return self._post_fault_result(spec, (I0, I1, I2), phase_index=p)
 
     def double_line_to_ground_fault(self, spec: FaultSpec) -> FaultStudyResult:
         """
@@ -352,42 +1045,9 @@ class ShortCircuitSolver:
         if spec.fault_type != FaultType.DOUBLE_LINE_TO_GROUND:
             raise ValueError("double_line_to_ground_fault só aceita FaultType.DOUBLE_LINE_TO_GROUND")
 
-        fault_bus_id = spec.bus_id
-        k = self.bus_index[fault_bus_id]
-
         I0, I1, I2 = self._solve_sequence_currents_at_fault_bus(spec)
-        A = self._symm_matrix_A()
-
-        V0_post: Dict[str, complex] = {}
-        V1_post: Dict[str, complex] = {}
-        V2_post: Dict[str, complex] = {}
-
-        for bus_id, i in self.bus_index.items():
-            Z0ik = self.z0[i, k]
-            Z1ik = self.z1[i, k]
-            Z2ik = self.z2[i, k]
-
-            V0_post[bus_id] = -Z0ik * I0
-            V1_post[bus_id] = self.pre_v[bus_id] - Z1ik * I1
-            V2_post[bus_id] = -Z2ik * I2
-
-        Iabc_fault = tuple((A @ np.array([I0, I1, I2], dtype=complex)).tolist())
         p, _, _ = self._parse_fault_phases(spec)
-
-        results: Dict[str, FaultResultBasic] = {}
-        for bus_id in self.bus_index.keys():
-            Vabc = tuple((A @ np.array([V0_post[bus_id], V1_post[bus_id], V2_post[bus_id]], dtype=complex)).tolist())
-            Iabc = Iabc_fault if bus_id == fault_bus_id else (0 + 0j, 0 + 0j, 0 + 0j)
-
-            results[bus_id] = FaultResultBasic(
-                bus_id=bus_id,
-                v_pu=Vabc[p],
-                i_pu=Iabc[p],
-                v_abc=Vabc,
-                i_abc=Iabc,
-            )
-
-        return FaultStudyResult(spec=spec, fault_current_pu=results[fault_bus_id].i_pu, buses=results)
+        return self._post_fault_result(spec, (I0, I1, I2), phase_index=p)
 
 
 
@@ -399,50 +1059,27 @@ def _build_solver_from_powerflow(
     z0_source_pu: complex | None = None,
     generators=None,  # <- NOVO: lista de Generator
 ) -> ShortCircuitSolver:
-    y1, y2, y0 = pf.get_ybus_numpy_sequences()
+    shunts = pf.get_bus_shunts_sequences()  # (n, 3), sequências 0/1/2
     pre_v = pf.get_bus_voltages_complex_pu()
     bus_index = pf.get_bus_index_dict()
 
     # Fonte Thevenin (se você ainda estiver usando)
     if source_bus_id is not None:
         k = bus_index[source_bus_id]
-
-        def add_shunt(Y: np.ndarray, z: complex | None) -> None:
+        for seq, z in enumerate((z0_source_pu, z1_source_pu, z2_source_pu)):
             if z is None:
-                return
+                continue
             if abs(z) < 1e-12:
                 raise ValueError("Impedância da fonte muito pequena (próxima de 0).")
-            Y[k, k] += 1 / z
-
-        add_shunt(y1, z1_source_pu)
-        add_shunt(y2, z2_source_pu)
-        add_shunt(y0, z0_source_pu)
-
-    # NOVO: contribuição dos geradores como shunt (sem importar controller)
-    if generators:
-        for gen in generators:
-            if gen.bus_id not in bus_index:
-                continue
-            k = bus_index[gen.bus_id]
+            shunts[k, seq] += 1 / z
 
-            Z1 = 1j * gen.sc.x1_pu
-            Z2 = 1j * gen.sc.x2_pu
+    # contribuição dos geradores como shunt (sem importar controller)
+    gens = GeneratorPrimitives.from_generators(generators, bus_index)
+    np.add.at(shunts, gens.bus, gens.y)
 
-            if gen.sc.grounded:
-                Z0 = 1j * (gen.sc.x0_pu + 3.0 * gen.sc.xn_pu)
-            else:
-                Z0 = None
-
-            def add_shunt_Z(Y, Z):
-                if Z is None:
-                    return
-                if abs(Z) < 1e-12:
-                    return
-                Y[k, k] += 1 / Z
-
-            add_shunt_Z(y1, Z1)
-            add_shunt_Z(y2, Z2)
-            add_shunt_Z(y0, Z0)
+    # Y0/Y1/Y2 esparsas numa passada só pelos ramos (os mesmos quadripolos das correntes)
+    branches = BranchPrimitives.from_connections(pf.connections.values(), bus_index)
+    y0, y1, y2 = sequence_ybus(branches, shunts)
 
     return ShortCircuitSolver(
         ybus=y1,
@@ -450,8 +1087,154 @@ def _build_solver_from_powerflow(
         bus_index=bus_index,
         ybus_negative=y2,
         ybus_zero=y0,
+        branches=branches,
+        generators=gens,
     )
 
+class ShortCircuitSession:
+    """
+    Estudos de curto-circuito sobre um PowerFlow já resolvido.
+
+    As redes de sequência (com geradores e fonte Thevenin) são montadas e fatoradas
+    uma vez; as faltas seguintes só resolvem com os fatores já prontos. Quem guarda
+    a sessão (SimulatorController) a descarta quando a rede ou os geradores mudam.
+    """
+
+    _DESCRIPTIONS = {
+        FaultType.THREE_PHASE: "Falta 3φ na barra {bus}",
+        FaultType.SINGLE_LINE_TO_GROUND: "Falta SLG sólida na barra {bus}",
+        FaultType.LINE_TO_LINE: "Falta LL sólida na barra {bus}",
+        FaultType.DOUBLE_LINE_TO_GROUND: "Falta DLG sólida na barra {bus}",
+    }
+
+    def __init__(
+        self,
+        pf: PowerFlow,
+        generators=None,
+        source_bus_id: str | None = None,
+        z1_source_pu: complex | None = None,
+        z2_source_pu: complex | None = None,
+        z0_source_pu: complex | None = None,
+    ) -> None:
+        self.power_flow = pf
+        self.source = (source_bus_id, z1_source_pu, z2_source_pu, z0_source_pu)
+        self.solver = _build_solver_from_powerflow(
+            pf,
+            source_bus_id=source_bus_id,
+            z1_source_pu=z1_source_pu,
+            z2_source_pu=z2_source_pu,
+            z0_source_pu=z0_source_pu,
+            generators=generators,
+        )
+
+    def matches(
+        self,
+        pf: PowerFlow,
+        source_bus_id: str | None = None,
+        z1_source_pu: complex | None = None,
+        z2_source_pu: complex | None = None,
+        z0_source_pu: complex | None = None,
+    ) -> bool:
+        """A sessão serve para este fluxo de potência e esta fonte Thevenin?"""
+        return pf is self.power_flow and self.source == (
+            source_bus_id,
+            z1_source_pu,
+            z2_source_pu,
+            z0_source_pu,
+        )
+
+    def run(
+        self,
+        fault_type: FaultType,
+        bus_id: str,
+        phase: str = "A",
+        z_fault_pu: complex = 0 + 0j,
+        description: str | None = None,
+    ) -> FaultStudyResult:
+        if description is None:
+            description = self._DESCRIPTIONS[fault_type].format(bus=bus_id)
+        spec = FaultSpec(
+            bus_id=bus_id,
+            fault_type=fault_type,
+            z_fault_pu=z_fault_pu,
+            description=description,
+            phase=phase,
+        )
+        if fault_type == FaultType.THREE_PHASE:
+            return self.solver.three_phase_fault(spec)
+        if fault_type == FaultType.SINGLE_LINE_TO_GROUND:
+            return self.solver.single_line_to_ground_fault(spec)
+        if fault_type == FaultType.LINE_TO_LINE:
+            return self.solver.line_to_line_fault(spec)
+        if fault_type == FaultType.DOUBLE_LINE_TO_GROUND:
+            return self.solver.double_line_to_ground_fault(spec)
+        raise ValueError(f"Tipo de falta não suportado: {fault_type}")
+
+    def run_line(
+        self,
+        fault_type: FaultType,
+        line_id: str,
+        position: float,
+        phase: str = "A",
+        z_fault_pu: complex = 0 + 0j,
+        description: str | None = None,
+    ) -> FaultStudyResult:
+        """Falta a `position` (0..1) do tap_bus_id ao longo da linha line_id."""
+        branches = self.solver.branches
+        assert branches is not None
+        tap_bus = branches.from_bus[branches.position(line_id)]
+        if description is None:
+            description = f"Falta {fault_type.value} na linha {line_id} a {position:.0%} da barra {tap_bus}"
+        spec = FaultSpec(
+            bus_id=tap_bus,
+            fault_type=fault_type,
+            z_fault_pu=z_fault_pu,
+            description=description,
+            phase=phase,
+            line_id=line_id,
+            line_position=position,
+        )
+        return self.solver.line_fault(spec)
+
+    def parametric(
+        self,
+        fault_type: FaultType,
+        z_fault_pu=0 + 0j,
+        operating_points=None,
+        phase: str = "A",
+        s_base_mva: float | None = None,
+    ) -> FaultParametricResult:
+        return self.solver.parametric_sweep(
+            fault_type,
+            z_fault_pu=z_fault_pu,
+            operating_points=operating_points,
+            phase=phase,
+            s_base_mva=self.power_flow.base if s_base_mva is None else s_base_mva,
+        )
+
+    def outage_sweep(
+        self,
+        fault_type: FaultType,
+        phase: str = "A",
+        z_fault_pu: complex = 0 + 0j,
+        outages=None,
+        s_base_mva: float | None = None,
+    ) -> FaultOutageSweepResult:
+        return self.solver.outage_sweep(
+            fault_type,
+            phase=phase,
+            z_fault_pu=z_fault_pu,
+            outages=outages,
+            s_base_mva=self.power_flow.base if s_base_mva is None else s_base_mva,
+        )
+
+    def sweep(self, z_fault_pu: complex = 0 + 0j, s_base_mva: float | None = None) -> FaultSweepResult:
+        return self.solver.fault_sweep(
+            z_fault_pu=z_fault_pu,
+            s_base_mva=self.power_flow.base if s_base_mva is None else s_base_mva,
+        )
+
+
 def run_three_phase_fault_from_powerflow(
     pf: PowerFlow,
     bus_id: str,
@@ -594,5 +1377,31 @@ def run_dlg_fault_from_powerflow(
     return solver.double_line_to_ground_fault(spec)
 
 
+def run_fault_sweep_from_powerflow(
+    pf: PowerFlow,
+    z_fault_pu: complex = 0 + 0j,
+    s_base_mva: float | None = None,
+    source_bus_id: str | None = None,
+    z1_source_pu: complex | None = None,
+    z2_source_pu: complex | None = None,
+    z0_source_pu: complex | None = None,
+    generators=None,
+) -> FaultSweepResult:
+    """
+    Faltas 3φ/SLG/LL/DLG em todas as barras de um PowerFlow já resolvido.
 
+    Monta as redes de sequência uma vez; s_base_mva padrão = pf.base.
+    """
+    solver = _build_solver_from_powerflow(
+        pf,
+        source_bus_id=source_bus_id,
+        z1_source_pu=z1_source_pu,
+        z2_source_pu=z2_source_pu,
+        z0_source_pu=z0_source_pu,
+        generators=generators,
+    )
+    return solver.fault_sweep(
+        z_fault_pu=z_fault_pu,
+        s_base_mva=pf.base if s_base_mva is None else s_base_mva,
+    )
 
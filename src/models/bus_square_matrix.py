@@ -1,83 +1,195 @@
 # src/models/bus_square_matrix.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Generic, List, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, TypeVar
 
-T = TypeVar("T")
+if TYPE_CHECKING:
+    import numpy as np
 
+# numpy é importado nos métodos: este módulo entra na inicialização da interface
+# (PowerFlow -> YBusSquareMatrix) e a matriz só é criada ao rodar um estudo.
 
-@dataclass
-class BusIndex:
-    bus_id: str
-    index: int
+T = TypeVar("T")
 
 
 class BusSquareMatrix(Generic[T]):
-    def __init__(self, m: Optional[List[List[T]]] = None) -> None:
+    """
+    Matriz quadrada indexada por barra, sobre um array numpy pré-alocado.
+
+    - matrix: o canto n x n ativo de um buffer cuja capacidade dobra quando enche
+      (add_bus não realoca a cada barra)
+    - índice bidirecional em dicts/lista: id -> índice e índice -> id em O(1)
+    - remove_bus troca a barra removida pela última (O(n), sem renumerar as outras)
+    - version: contador de alterações; a fatoração LU, a inversa e as colunas
+      dela ficam em cache até a próxima alteração. matrix é somente leitura:
+      escreve-se por set_value/add_value (ou add_bus/remove_bus/clear).
+    """
+
+    def __init__(self, m: Optional[List[List[T]]] = None, dtype: Any = complex, capacity: int = 8) -> None:
+        import numpy as np
+
         # EVITA default mutável compartilhado entre instâncias
-        self.__m: List[List[T]] = m if m is not None else []
-        self.__indexes: List[BusIndex] = []
+        n = len(m) if m is not None else 0
+        initial = np.array(m, dtype=dtype).reshape(n, n) if n else None
+        capacity = max(1, capacity, n)
+        self.__buffer: np.ndarray = np.zeros((capacity, capacity), dtype=dtype)
+        if initial is not None:
+            self.__buffer[:n, :n] = initial
+        self.__size = n
+        self.__writable: np.ndarray = self.__buffer[:n, :n]
+        self.__view: np.ndarray = self.__buffer[:n, :n]
+        self.__view.flags.writeable = False
+        self.__index: Dict[str, int] = {}
+        self.__ids: List[Optional[str]] = [None] * n
+
+        self.__version = 0
+        self.__lu: Any = None
+        self.__inverse: Optional[np.ndarray] = None
+        self.__columns: Dict[int, np.ndarray] = {}
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Matriz ativa n x n (view somente leitura do buffer)."""
+        return self.__view
 
     @property
-    def matrix(self):
-        return self.__m  # ou o nome real da tua matriz interna
+    def version(self) -> int:
+        return self.__version
+
+    def __modified(self) -> None:
+        self.__version += 1
+        self.__lu = None
+        self.__inverse = None
+        self.__columns = {}
 
     @property
     def size(self) -> int:
-        # mais robusto do que manter "size" separado
-        return len(self.__m)
-    
+        return self.__size
+
     @property
-    def inverse(self):
-        import numpy as np
-        return np.linalg.inv(np.array(self.matrix, dtype=complex)).tolist()
+    def capacity(self) -> int:
+        return self.__buffer.shape[0]
 
+    @property
+    def inverse(self) -> np.ndarray:
+        """Inversa (somente leitura), calculada uma vez por versão a partir da LU."""
+        if self.__inverse is None:
+            import numpy as np
 
-    def add_bus(self, bus_id: str, initial_value: T) -> None:
-        bus_index = BusIndex(bus_id, self.size)
-        self.__indexes.append(bus_index)
+            inverse = self.solve(np.eye(self.__size, dtype=self.__buffer.dtype))
+            inverse.flags.writeable = False
+            self.__inverse = inverse
+        return self.__inverse
 
-        # adiciona coluna nas linhas existentes
-        for row in self.__m:
-            row.append(initial_value)
+    def __factorization(self) -> Any:
+        if self.__lu is None:
+            from scipy.linalg import lu_factor
 
-        # adiciona nova linha
-        self.__m.append([initial_value] * (self.size + 1))
+            self.__lu = lu_factor(self.__view)
+        return self.__lu
 
-    def remove_bus(self, bus_id: str) -> None:
-        idx = self.get_bus_index(bus_id)
+    def solve(self, b: Any) -> np.ndarray:
+        """Resolve M x = b (b: vetor ou matriz de colunas) com a LU em cache."""
+        import numpy as np
+        from scipy.linalg import lu_solve
+
+        return lu_solve(self.__factorization(), np.asarray(b))
+
+    def column(self, k: int) -> np.ndarray:
+        """Coluna k da inversa (somente leitura), sem montar a inversa inteira."""
+        column = self.__columns.get(k)
+        if column is None:
+            if self.__inverse is not None:
+                column = self.__inverse[:, k]
+            else:
+                import numpy as np
+
+                e = np.zeros(self.__size, dtype=self.__buffer.dtype)
+                e[k] = 1
+                column = self.solve(e)
+                column.flags.writeable = False
+            self.__columns[k] = column
+        return column
+
+    def __resize(self, n: int) -> None:
+        if n > self.capacity:
+            import numpy as np
+
+            buffer = np.zeros((max(n, 2 * self.capacity),) * 2, dtype=self.__buffer.dtype)
+            buffer[: self.__size, : self.__size] = self.__view
+            self.__buffer = buffer
+        self.__size = n
+        self.__writable = self.__buffer[:n, :n]
+        self.__view = self.__buffer[:n, :n]
+        self.__view.flags.writeable = False
+        self.__modified()
+
+    def add_bus(self, bus_id: str, initial_value: T) -> None:
+        if bus_id in self.__index:
+            raise ValueError(f"Bus id already present: {bus_id}")
+        idx = self.__size
+        self.__resize(idx + 1)
 
-        self.__m.pop(idx)
-        for row in self.__m:
-            row.pop(idx)
+        # nova linha e nova coluna com initial_value
+        self.__buffer[idx, : idx + 1] = initial_value
+        self.__buffer[:idx, idx] = initial_value
 
-        self.__indexes = [b for b in self.__indexes if b.bus_id != bus_id]
-        for b in self.__indexes:
-            if b.index > idx:
-                b.index -= 1
+        self.__index[bus_id] = idx
+        self.__ids.append(bus_id)
+
+    def remove_bus(self, bus_id: str) -> Optional[tuple[int, int]]:
+        """
+        Remove a barra movendo a última para o lugar dela.
+
+        Retorna (índice antigo, índice novo) da barra movida, ou None se a
+        removida já era a última. As demais barras mantêm o índice.
+        """
+        idx = self.get_bus_index(bus_id)
+        last = self.__size - 1
+        moved = None
+        if idx != last:
+            b = self.__buffer
+            b[idx, : last + 1] = b[last, : last + 1]
+            b[: last + 1, idx] = b[: last + 1, last]  # b[idx, idx] recebe o antigo b[last, last]
+            moved_id = self.__ids[last]
+            self.__ids[idx] = moved_id
+            if moved_id is not None:
+                self.__index[moved_id] = idx
+            moved = (last, idx)
+
+        del self.__index[bus_id]
+        self.__ids.pop()
+        self.__resize(last)
+        return moved
 
     def set_value(self, i: int, j: int, value: T) -> None:
-        self.__m[i][j] = value
+        self.__writable[i, j] = value
+        self.__modified()
+
+    def add_value(self, i: int, j: int, value: T) -> None:
+        """M[i, j] += value."""
+        self.__writable[i, j] += value
+        self.__modified()
 
     def get_value(self, i: int, j: int) -> T:
-        return self.__m[i][j]
+        return self.__view[i, j]
 
     def get_bus_index(self, bus_id: str) -> int:
-        for b in self.__indexes:
-            if b.bus_id == bus_id:
-                return b.index
-        raise ValueError(f"Bus id not found: {bus_id}")
+        try:
+            return self.__index[bus_id]
+        except KeyError:
+            raise ValueError(f"Bus id not found: {bus_id}") from None
 
     def get_bus_id(self, index: int) -> str:
-        for b in self.__indexes:
-            if b.index == index:
-                return b.bus_id
-        raise ValueError(f"Bus index not found: {index}")
+        bus_id = self.__ids[index] if 0 <= index < self.__size else None
+        if bus_id is None:
+            raise ValueError(f"Bus index not found: {index}")
+        return bus_id
 
     def as_list(self) -> List[List[T]]:
-        return self.__m
+        return self.__view.tolist()
 
     def clear(self) -> None:
-        self.__m = []
-        self.__indexes = []
+        self.__resize(0)  # também invalida os caches
+        self.__index = {}
+        self.__ids = []
@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class FaultType(Enum):
@@ -23,12 +26,17 @@ class FaultSpec:
 
     Exemplo:
         FaultSpec(bus_id="B5", fault_type=FaultType.THREE_PHASE)
+
+    Falta no meio de uma linha: line_id + line_position (fração a partir de
+    tap_bus_id); bus_id fica com a barra tap da linha, só como referência.
     """
     bus_id: str
     fault_type: FaultType
     z_fault_pu: complex = 0+0j
     description: str = ""
     phase: str = "A"
+    line_id: Optional[str] = None
+    line_position: float = 0.0
 
 
 @dataclass
@@ -45,15 +53,173 @@ class FaultResultBasic:
     v_abc: Optional[Tuple[complex, complex, complex]] = None
     i_abc: Optional[Tuple[complex, complex, complex]] = None
 
+@dataclass
+class BranchCurrents:
+    """
+    Correntes nos ramos (Line/Transformer) durante a falta, saindo de cada barra
+    para o ramo. Arrays (..., m, 3): a última dimensão é a sequência (0, 1, 2)
+    em i_*_012 e a fase (a, b, c) em i_*_abc.
+    """
+    ids: List[str]
+    from_bus: List[str]
+    to_bus: List[str]
+    i_from_012: "np.ndarray"
+    i_to_012: "np.ndarray"
+    i_from_abc: "np.ndarray"
+    i_to_abc: "np.ndarray"
+
+
+@dataclass
+class GeneratorCurrents:
+    """Contribuição de cada gerador para a falta (injetada na barra), (..., g, 3)."""
+    ids: List[str]
+    bus_ids: List[str]
+    i_012: "np.ndarray"
+    i_abc: "np.ndarray"
+
+
 @dataclass
 class FaultStudyResult:
     """
-    Resultado de um estudo de falta (por enquanto, 3φ):
+    Resultado de um estudo de falta:
 
     - spec: dados da falta (onde, tipo, Zf)
     - fault_current_pu: corrente de falta na barra em falta (pu)
-    - buses: resultados por barra (tensão e corrente “local” simplificada)
+    - bus_ids / v_abc: tensões de fase pós-falta, (n, 3), na ordem de bus_ids
+    - i_abc_fault: correntes de fase na barra em falta (3,)
+    - phase_index: fase "principal" (0=A, 1=B, 2=C) usada em v_pu / i_pu
+    - branches / generators: correntes nos ramos e contribuições dos geradores
+      (None se o solver não recebeu os dados dos elementos)
+    - buses: resultados por barra (FaultResultBasic), montados só se pedidos
     """
     spec: FaultSpec
     fault_current_pu: complex
-    buses: Dict[str, FaultResultBasic]
+    bus_ids: List[str] = field(default_factory=list)
+    v_abc: Optional["np.ndarray"] = None
+    i_abc_fault: Optional["np.ndarray"] = None
+    phase_index: int = 0
+    branches: Optional[BranchCurrents] = None
+    generators: Optional[GeneratorCurrents] = None
+    _buses: Optional[Dict[str, FaultResultBasic]] = field(default=None, init=False, repr=False)
+
+    @property
+    def v_pu(self) -> "np.ndarray":
+        """Tensão da fase principal em todas as barras (n,)."""
+        assert self.v_abc is not None
+        return self.v_abc[:, self.phase_index]
+
+    @property
+    def buses(self) -> Dict[str, FaultResultBasic]:
+        if self._buses is None:
+            assert self.v_abc is not None and self.i_abc_fault is not None
+            p = self.phase_index
+            i_fault = tuple(self.i_abc_fault.tolist())
+            no_current = (0 + 0j, 0 + 0j, 0 + 0j)
+            buses: Dict[str, FaultResultBasic] = {}
+            for bus_id, v_abc in zip(self.bus_ids, self.v_abc.tolist()):
+                at_fault = bus_id == self.spec.bus_id and self.spec.line_id is None
+                i_abc = i_fault if at_fault else no_current
+                buses[bus_id] = FaultResultBasic(
+                    bus_id=bus_id,
+                    v_pu=v_abc[p],
+                    i_pu=i_abc[p],
+                    v_abc=tuple(v_abc),
+                    i_abc=i_abc,
+                )
+            self._buses = buses
+        return self._buses
+
+
+@dataclass
+class FaultSweepResult:
+    """
+    Varredura de faltas em todas as barras (ShortCircuitSolver.fault_sweep).
+
+    Os arrays seguem a ordem de bus_ids e são indexados pelo tipo de falta:
+    - i012 / i_abc: (n, 3) correntes de sequência / de fase na barra em falta (pu)
+    - fault_current_pu: (n,) corrente da fase principal (a mesma de FaultStudyResult)
+    - mva: (n,) potência de curto-circuito |V_pre|·|I_falta|·S_base (MVA)
+    """
+    bus_ids: List[str]
+    z_fault_pu: complex = 0+0j
+    s_base_mva: float = 100.0
+    phases: Dict[FaultType, str] = field(default_factory=dict)
+    i012: Dict[FaultType, "np.ndarray"] = field(default_factory=dict)
+    i_abc: Dict[FaultType, "np.ndarray"] = field(default_factory=dict)
+    fault_current_pu: Dict[FaultType, "np.ndarray"] = field(default_factory=dict)
+    mva: Dict[FaultType, "np.ndarray"] = field(default_factory=dict)
+
+    def at(self, bus_id: str, fault_type: FaultType) -> Tuple[complex, float]:
+        """(corrente de falta em pu, MVA de curto) de uma barra."""
+        i = self.bus_ids.index(bus_id)
+        return complex(self.fault_current_pu[fault_type][i]), float(self.mva[fault_type][i])
+
+
+@dataclass
+class LineFaultSweepResult:
+    """
+    Falta ao longo de uma linha (ShortCircuitSolver.line_fault_sweep).
+
+    Arrays na ordem de positions (fração a partir de tap_bus_id):
+    z_thevenin_012 / i012 / i_abc (k, 3) e fault_current_pu (k,).
+    """
+    line_id: str
+    fault_type: FaultType
+    phase: str
+    positions: "np.ndarray"
+    z_thevenin_012: "np.ndarray"
+    i012: "np.ndarray"
+    i_abc: "np.ndarray"
+    fault_current_pu: "np.ndarray"
+
+
+@dataclass
+class FaultParametricResult:
+    """
+    Falta em todas as barras x impedâncias de falta x condições pré-falta
+    (ShortCircuitSolver.parametric_sweep).
+
+    - z_fault_pu: (F,); pre_fault_voltages: (n, P) na ordem de bus_ids
+    - i012 / i_abc: (n, F, P, 3); fault_current_pu / mva: (n, F, P)
+    """
+    bus_ids: List[str]
+    fault_type: FaultType
+    phase: str
+    z_fault_pu: "np.ndarray"
+    pre_fault_voltages: "np.ndarray"
+    i012: "np.ndarray"
+    i_abc: "np.ndarray"
+    fault_current_pu: "np.ndarray"
+    mva: "np.ndarray"
+
+
+@dataclass
+class FaultOutageSweepResult:
+    """
+    Falta em todas as barras para cada contingência de ramos
+    (ShortCircuitSolver.outage_sweep).
+
+    - outages: ids dos ramos retirados em cada caso (o casos)
+    - islanded: (o,) True se a retirada deixou parte da rede sem referência em
+      alguma sequência (essa rede foi refatorada, com a regularização de sempre)
+    - i012 / i_abc: (o, n, 3); fault_current_pu / mva: (o, n), na ordem de bus_ids
+    """
+    outages: List[Tuple[str, ...]]
+    bus_ids: List[str]
+    fault_type: FaultType
+    phase: str
+    z_fault_pu: complex
+    s_base_mva: float
+    islanded: "np.ndarray"
+    i012: "np.ndarray"
+    i_abc: "np.ndarray"
+    fault_current_pu: "np.ndarray"
+    mva: "np.ndarray"
+
+    def case(self, *branch_ids: str) -> int:
+        """Posição da contingência com exatamente esses ramos retirados."""
+        key = set(branch_ids)
+        for j, outage in enumerate(self.outages):
+            if set(outage) == key:
+                return j
+        raise ValueError(f"Contingência {branch_ids!r} não está na varredura.")
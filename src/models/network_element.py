@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Iterator
 
 
 class NetworkElement:
@@ -28,3 +29,44 @@ class ElementEvent(Enum):
     CREATED = "node_created"
     UPDATED = "wire_created"
     DELETED = "wire_deleted"
+
+
+class ChangeSet:
+    """
+    Mudanças acumuladas em um lote (SimulatorController.batch()), coalescidas por id:
+    - criar + atualizar  -> criar (com o objeto mais recente)
+    - criar + apagar     -> nada
+    - várias atualizações -> só a última
+    Apagar e recriar o mesmo id (ex.: limpar e importar) mantém as duas entradas.
+    """
+
+    def __init__(self) -> None:
+        self.deleted: dict[str, NetworkElement] = {}
+        self.created: dict[str, NetworkElement] = {}
+        self.updated: dict[str, NetworkElement] = {}
+
+    def record(self, element: NetworkElement, event: ElementEvent) -> None:
+        element_id = element.id
+        if event is ElementEvent.CREATED:
+            self.created[element_id] = element
+        elif event is ElementEvent.UPDATED:
+            if element_id in self.created:
+                self.created[element_id] = element
+            else:
+                self.updated[element_id] = element
+        elif event is ElementEvent.DELETED:
+            self.updated.pop(element_id, None)
+            if self.created.pop(element_id, None) is None:
+                self.deleted[element_id] = element
+
+    def events(self) -> Iterator[tuple[NetworkElement, ElementEvent]]:
+        # ordem segura para as views: remove, cria, atualiza
+        for element in self.deleted.values():
+            yield element, ElementEvent.DELETED
+        for element in self.created.values():
+            yield element, ElementEvent.CREATED
+        for element in self.updated.values():
+            yield element, ElementEvent.UPDATED
+
+    def __len__(self) -> int:
+        return len(self.deleted) + len(self.created) + len(self.updated)
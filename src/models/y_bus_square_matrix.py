@@ -1,22 +1,82 @@
 from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from models.bus_square_matrix import BusSquareMatrix
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# tipo das linhas de YBusSquareMatrix.branches (numpy.dtype aceita a lista de campos)
+BRANCH_DTYPE = [
+    ("source", "i8"),
+    ("target", "i8"),
+    ("y", "c16"),
+    ("bc", "f8"),
+    ("tap", "c16"),
+]
+
 
 class YBusSquareMatrix:
     def __init__(self, log_print: bool = False):
         self.__m: BusSquareMatrix = BusSquareMatrix()
         self.__log_print: bool = log_print
-        self.__bc: dict[str, float] = {}
+        # ramos em arrays alinhados (posição k = k-ésimo connect_bus_to_bus), com
+        # capacidade que dobra; o índice CSR barra -> ramos é montado sob demanda
+        self.__branches: np.ndarray | None = None
+        self.__branch_count = 0
+        self.__adjacency: tuple[np.ndarray, np.ndarray] | None = None
+
+    def __add_branch(self, source: int, target: int, y: complex, bc: float, tap: complex) -> None:
+        import numpy as np
+
+        k = self.__branch_count
+        if self.__branches is None or k == len(self.__branches):
+            branches = np.zeros(max(8, 2 * k), dtype=BRANCH_DTYPE)
+            if self.__branches is not None:
+                branches[:k] = self.__branches
+            self.__branches = branches
+        self.__branches[k] = (source, target, y, bc, tap)
+        self.__branch_count = k + 1
+        self.__adjacency = None
 
-    def __getIndex(self, i: int, j: int) -> str:
-        if i > j:
-            return f"{i}_{j}"
-        else:
-            return f"{j}_{i}"
+    @property
+    def branches(self) -> np.ndarray:
+        """Ramos conectados (array estruturado: source, target, y, bc, tap), somente leitura."""
+        import numpy as np
+
+        if self.__branches is None:
+            return np.zeros(0, dtype=BRANCH_DTYPE)
+        view = self.__branches[: self.__branch_count]
+        view.flags.writeable = False
+        return view
+
+    def __adjacent(self) -> tuple[np.ndarray, np.ndarray]:
+        """CSR barra -> ramos incidentes: ramos de i em order[indptr[i]:indptr[i + 1]]."""
+        if self.__adjacency is None:
+            import numpy as np
+
+            b = self.branches
+            ends = np.concatenate((b["source"], b["target"]))
+            order = np.argsort(ends, kind="stable") % len(b) if len(b) else ends
+            counts = np.bincount(ends, minlength=self.__m.size)
+            indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=indptr[1:])
+            self.__adjacency = (indptr, order)
+        return self.__adjacency
+
+    def bus_branches(self, i: int) -> np.ndarray:
+        """Posições (em branches) dos ramos incidentes na barra i, em O(grau)."""
+        indptr, order = self.__adjacent()
+        if i + 1 >= len(indptr):
+            return order[:0]
+        return order[indptr[i] : indptr[i + 1]]
 
     def getBc(self, i: int, j: int) -> float:
-        index = self.__getIndex(i, j)
-        return self.__bc[index] if index in self.__bc else 0.0
+        """Soma do carregamento bc dos ramos entre i e j (paralelos somam), em O(grau)."""
+        b = self.branches[self.bus_branches(i)]
+        mask = ((b["source"] == i) & (b["target"] == j)) | ((b["source"] == j) & (b["target"] == i))
+        return float(b["bc"][mask].sum())
 
     # Caso 1 - Adicionar um barramento e conecta a terra. Aumenta a ordem da matriz.
     def add_bus(self, bus_id: str) -> None:
@@ -53,27 +113,43 @@ class YBusSquareMatrix:
         tap_abs2 = tap * tap.conjugate()  # |tap|^2
 
         # Parte série
-        self.y_matrix[source][source] += y / tap_abs2
-        self.y_matrix[target][target] += y
-        self.y_matrix[source][target] += -y / tap.conjugate()
-        self.y_matrix[target][source] += -y / tap
+        m = self.__m
+        m.add_value(source, source, y / tap_abs2)
+        m.add_value(target, target, y)
+        m.add_value(source, target, -y / tap.conjugate())
+        m.add_value(target, source, -y / tap)
 
         # Line charging (shunt)
-        self.y_matrix[source][source] += 1j * (bc / 2.0) / tap_abs2
-        self.y_matrix[target][target] += 1j * (bc / 2.0)
+        m.add_value(source, source, 1j * (bc / 2.0) / tap_abs2)
+        m.add_value(target, target, 1j * (bc / 2.0))
+
+        self.__add_branch(source, target, y, bc, tap)
+
+
+    def add_value(self, i: int, j: int, value: complex) -> None:
+        """Y[i, j] += value (ex.: shunt da barra na diagonal)."""
+        self.__m.add_value(i, j, value)
+
+    @property
+    def version(self) -> int:
+        """Muda a cada alteração da Ybus; z_matrix/solve/column são recalculados só então."""
+        return self.__m.version
 
-        # Se você usa bc em algum getBc, mantenha a matriz/registro que você já tinha:
-        # (ajuste o nome do atributo conforme o teu arquivo)
-        self.__bc[self.__getIndex(source, target)] = bc
+    def solve(self, i: np.ndarray) -> np.ndarray:
+        """Tensões V de Y V = I, com a fatoração em cache (sem montar a Zbus)."""
+        return self.__m.solve(i)
 
+    def column(self, k: int) -> np.ndarray:
+        """Coluna k da Zbus."""
+        return self.__m.column(k)
 
     def __str__(self) -> str:
         return f"{self.__m}"
 
     @property
-    def y_matrix(self) -> list[list[complex | float]]:
+    def y_matrix(self) -> np.ndarray:
         return self.__m.matrix
 
     @property
-    def z_matrix(self) -> list[list[complex | float]]:
+    def z_matrix(self) -> np.ndarray:
         return self.__m.inverse
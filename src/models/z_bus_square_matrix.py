@@ -1,20 +1,88 @@
-from models.bus_square_matrix import BusSquareMatrix
+from __future__ import annotations
+
+import numpy as np
 
 
 class ZBusSquareMatrix:
-    def __init__(self, log_print: bool = False):
-        self.__m: BusSquareMatrix = BusSquareMatrix()
+    """
+    Algoritmo de montagem da Zbus (casos 1 a 4), sobre um array numpy pré-alocado.
+
+    A matriz ativa é o canto n x n de um buffer cuja capacidade dobra quando
+    enche: adicionar barras não realoca a cada passo. Os casos 3 e 4 são a
+    redução de Kron da linha/coluna extra, feita direto na matriz como uma
+    atualização de posto 1 (Z -= u v^T / d), em faixas de linhas.
+
+    Cada caso incrementa version; a Ybus (y_matrix), a LU de Z e as colunas
+    de Y ficam em cache até a próxima alteração.
+    """
+
+    KRON_BLOCK = 256  # linhas por faixa na atualização de posto 1 (limita o temporário)
+
+    def __init__(self, log_print: bool = False, capacity: int = 8):
+        self.__buffer = np.zeros((max(1, capacity), max(1, capacity)), dtype=complex)
+        self.__size = 0
         self.__log_print: bool = log_print
+        self.__version = 0
+        self.__lu = None
+        self.__y: np.ndarray | None = None
+        self.__columns: dict[int, np.ndarray] = {}
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def capacity(self) -> int:
+        return self.__buffer.shape[0]
+
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    def __modified(self) -> None:
+        self.__version += 1
+        self.__lu = None
+        self.__y = None
+        self.__columns = {}
+
+    @property
+    def __z(self) -> np.ndarray:
+        return self.__buffer[: self.__size, : self.__size]
+
+    def __grow(self) -> int:
+        """Abre espaço para mais uma barra (capacidade dobra se preciso); retorna o índice dela."""
+        n = self.__size
+        if n == self.capacity:
+            buffer = np.zeros((2 * n, 2 * n), dtype=complex)
+            buffer[:n, :n] = self.__buffer
+            self.__buffer = buffer
+        self.__buffer[n, : n + 1] = 0
+        self.__buffer[:n, n] = 0
+        self.__size = n + 1
+        self.__modified()
+        return n
+
+    def __kron(self, u: np.ndarray, v: np.ndarray, d: complex) -> None:
+        """Z -= u v^T / d, in-place, em faixas de KRON_BLOCK linhas."""
+        if abs(d) < 1e-12:
+            raise ValueError("Redução de Kron com pivô nulo (laço de impedância zero).")
+        z = self.__z
+        v = v / d
+        for start in range(0, self.__size, self.KRON_BLOCK):
+            stop = start + self.KRON_BLOCK
+            z[start:stop] -= u[start:stop, None] * v[None, :]
+        self.__modified()
 
     # Caso 1 - Adicionar um barramento e conecta a terra. Aumenta a ordem da matriz.
     def add_bus_and_connect_to_ground(self, z: complex) -> int:
-        new_bus = self.__m.size
+        new_bus = self.__size
         if self.__log_print:
             print(f"==========================================")
             print(f"Case 1: adding bus {new_bus+1} to ground, with z = {z}\n")
 
-        # Incrementa a ordem da matriz, zerando a nova linha e coluna.
-        self.__m = self.__m.increase_order(last_value=z)
+        # nova linha e coluna zeradas, z na diagonal
+        self.__grow()
+        self.__buffer[new_bus, new_bus] = z
 
         if self.__log_print:
             print(f"Z = \n{self}")
@@ -23,16 +91,16 @@ class ZBusSquareMatrix:
 
     # Caso 2 - Adicionar um barramento e conecta a outro barramento. Aumenta a ordem da matriz.
     def add_bus_and_connect_to_bus(self, z: complex, target: int) -> int:
-        new_bus = self.__m.size
+        new_bus = self.__size
         if self.__log_print:
             print(f"==========================================")
             print(f"Case 2: Adding bus {new_bus+1} to bus {target+1}, with z = {z}\n")
 
-        self.__m = self.__m.increase_order(
-            new_row=lambda c: self.__m[target][c],
-            new_column=lambda r: self.__m[r][target],
-            last_value=z + self.__m[target][target],
-        )
+        self.__grow()
+        b = self.__buffer
+        b[new_bus, :new_bus] = b[target, :new_bus]
+        b[:new_bus, new_bus] = b[:new_bus, target]
+        b[new_bus, new_bus] = b[target, target] + z
 
         if self.__log_print:
             print(f"Z = \n{self}")
@@ -45,15 +113,10 @@ class ZBusSquareMatrix:
             print(f"==========================================")
             print(f"Case 3: connecting bus {source+1} to ground, with z = {z}\n")
 
-        m = self.__m.increase_order(  # codigo do caso 2, apenas renomeando target para source
-            new_row=lambda c: self.__m[source][c],
-            new_column=lambda r: self.__m[r][source],
-            last_value=z + self.__m[source][source],
-        )
-        if self.__log_print:
-            print(f"Z = \n{m}")
-
-        self.__m = m.decrease_order()  # reduz ordem
+        # linha/coluna extra do caso 2 (com a terra), eliminada por Kron:
+        # Z -= Z[:, s] Z[s, :] / (Z[s, s] + z)
+        m = self.__z
+        self.__kron(m[:, source].copy(), m[source, :].copy(), m[source, source] + z)
 
         if self.__log_print:
             print(f"Reducing order\nZ = \n{self}")
@@ -65,33 +128,49 @@ class ZBusSquareMatrix:
             print(f"==========================================")
             print(f"Case 4: connecting bus {source+1} to bus {target+1}, with z = {z}\n")
 
-        last = (
-            self.__m[source][source] + self.__m[target][target] - 2 * self.__m[source][target] + z
-        )
-
-        def mapper(c: int) -> complex:
-            return self.__m[source][c] - self.__m[target][c]
-
-        m = self.__m.increase_order(
-            new_row=mapper,
-            new_column=mapper,
-            last_value=last,
-        )
-        if self.__log_print:
-            print(f"Z = \n{m}")
-
-        self.__m = m.decrease_order()
+        # Z -= (Z[:, s] - Z[:, t]) (Z[s, :] - Z[t, :]) / (Zss + Ztt - Zst - Zts + z)
+        m = self.__z
+        last = m[source, source] + m[target, target] - m[source, target] - m[target, source] + z
+        self.__kron(m[:, source] - m[:, target], m[source, :] - m[target, :], last)
 
         if self.__log_print:
             print(f"Reducing order\nZ = \n{self}")
 
     def __str__(self) -> str:
-        return f"{self.__m}"
+        return np.array2string(self.__z, precision=2, suppress_small=True)
 
     @property
-    def y_matrix(self) -> list[list[complex | float]]:
-        return self.__m.inverse
+    def y_matrix(self) -> np.ndarray:
+        """Ybus = Z^-1 (somente leitura), calculada uma vez por versão."""
+        if self.__y is None:
+            y = self.solve(np.eye(self.__size, dtype=complex))
+            y.flags.writeable = False
+            self.__y = y
+        return self.__y
 
     @property
-    def z_matrix(self) -> list[list[complex | float]]:
-        return self.__m.matrix
+    def z_matrix(self) -> np.ndarray:
+        """Zbus n x n (cópia; o buffer interno continua sendo atualizado in-place)."""
+        return self.__z.copy()
+
+    def solve(self, b) -> np.ndarray:
+        """Resolve Z x = b (ou seja, x = Y b) com a LU de Z em cache."""
+        from scipy.linalg import lu_factor, lu_solve
+
+        if self.__lu is None:
+            self.__lu = lu_factor(self.__z)
+        return lu_solve(self.__lu, np.asarray(b))
+
+    def column(self, k: int) -> np.ndarray:
+        """Coluna k da Ybus (somente leitura)."""
+        column = self.__columns.get(k)
+        if column is None:
+            if self.__y is not None:
+                column = self.__y[:, k]
+            else:
+                e = np.zeros(self.__size, dtype=complex)
+                e[k] = 1
+                column = self.solve(e)
+                column.flags.writeable = False
+            self.__columns[k] = column
+        return column
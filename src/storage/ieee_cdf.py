@@ -0,0 +1,299 @@
+"""
+Leitura em bloco do IEEE Common Data Format (assets/ieee_examples/common_data_format.txt).
+
+    case = read_ieee_cdf("ieee300cdf.txt")
+    case.buses["v"], case.branches["x"]      # colunas numpy, uma linha por cartão
+    f, t = case.branch_ends()                 # índices das barras de cada ramo
+    power_flow = power_flow_from_cdf(case)    # objetos Bus/Line só quando a interface precisa
+
+O arquivo é lido de uma vez e vira uma matriz de bytes (linhas x 128 colunas);
+cada campo de largura fixa é uma fatia de colunas dessa matriz, convertida
+para float/int/str em uma operação para todas as linhas da seção.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from maths.power_flow import PowerFlow
+from models.bus import Bus, BusType
+from models.line import Line
+from models.transformer import Transformer
+from storage.id_utils import norm_bus_id
+
+WIDTH = 128  # cartões de até 128 caracteres; o que passar disso é ignorado
+
+# (campo, primeira coluna, última coluna, tipo): colunas contadas a partir de 1,
+# como no formato; tipo "i" inteiro, "f" float, "a" texto, em maiúscula se o
+# campo é obrigatório (o "*" do formato)
+Field = Tuple[str, int, int, str]
+
+TITLE_FIELDS: List[Field] = [
+    ("date", 2, 9, "a"),
+    ("originator", 11, 30, "a"),
+    ("base_mva", 32, 37, "F"),
+    ("year", 39, 42, "i"),
+    ("season", 44, 44, "a"),
+    ("case_id", 46, 73, "a"),
+]
+
+BUS_FIELDS: List[Field] = [
+    ("number", 1, 4, "I"),
+    ("name", 6, 17, "A"),  # o formato diz 7-17; os arquivos do UW começam o nome na 6
+    ("area", 19, 20, "I"),
+    ("zone", 21, 23, "i"),
+    ("type", 25, 26, "I"),
+    ("v", 28, 33, "F"),
+    ("angle", 34, 40, "F"),  # graus
+    ("p_load", 41, 49, "F"),
+    ("q_load", 50, 59, "F"),
+    ("p_gen", 60, 67, "F"),
+    ("q_gen", 68, 75, "F"),
+    ("base_kv", 77, 83, "f"),
+    ("v_desired", 85, 90, "f"),
+    ("q_max", 91, 98, "f"),
+    ("q_min", 99, 106, "f"),
+    ("g_shunt", 107, 114, "F"),
+    ("b_shunt", 115, 122, "F"),
+    ("remote_bus", 124, 127, "i"),
+]
+
+BRANCH_FIELDS: List[Field] = [
+    ("tap_bus", 1, 4, "I"),
+    ("z_bus", 6, 9, "I"),
+    ("area", 11, 12, "i"),
+    ("zone", 13, 15, "i"),  # o formato diz 13-14; os arquivos do UW a põem na 15
+    ("circuit", 17, 17, "I"),
+    ("type", 19, 19, "I"),
+    ("r", 20, 29, "F"),
+    ("x", 30, 40, "F"),
+    ("b", 41, 50, "F"),  # carregamento total da linha
+    ("rating_1", 51, 55, "i"),
+    ("rating_2", 57, 61, "i"),
+    ("rating_3", 63, 67, "i"),
+    ("control_bus", 69, 72, "i"),
+    ("side", 74, 74, "i"),
+    ("ratio", 77, 82, "f"),
+    ("angle", 84, 90, "f"),  # graus
+    ("tap_min", 91, 97, "f"),
+    ("tap_max", 98, 104, "f"),
+    ("step", 106, 111, "f"),
+    ("limit_min", 113, 119, "f"),
+    ("limit_max", 120, 126, "f"),
+]
+
+LOSS_ZONE_FIELDS: List[Field] = [
+    ("number", 1, 3, "i"),
+    ("name", 5, 16, "a"),
+]
+
+INTERCHANGE_FIELDS: List[Field] = [
+    ("area", 1, 2, "I"),
+    ("slack_bus", 4, 7, "I"),
+    ("swing_name", 9, 20, "a"),
+    ("export_mw", 21, 28, "F"),
+    ("tolerance_mw", 30, 35, "F"),
+    ("code", 38, 43, "A"),
+    ("name", 46, 75, "a"),
+]
+
+TIE_LINE_FIELDS: List[Field] = [
+    ("metered_bus", 1, 4, "i"),
+    ("metered_area", 7, 8, "i"),
+    ("other_bus", 11, 14, "i"),
+    ("other_area", 17, 18, "i"),
+    ("circuit", 21, 21, "i"),
+]
+
+# seção -> (primeira palavra do cartão de início, campos)
+SECTIONS: Dict[str, Tuple[bytes, List[Field]]] = {
+    "buses": (b"BUS", BUS_FIELDS),
+    "branches": (b"BRANCH", BRANCH_FIELDS),
+    "loss_zones": (b"LOSS", LOSS_ZONE_FIELDS),
+    "interchange": (b"INTERCHANGE", INTERCHANGE_FIELDS),
+    "tie_lines": (b"TIE", TIE_LINE_FIELDS),
+}
+
+
+def fields_dtype(fields: List[Field]) -> np.dtype:
+    kinds = {"i": np.int64, "f": np.float64}
+    return np.dtype(
+        [
+            (name, kinds.get(kind.lower(), f"U{last - first + 1}"))
+            for name, first, last, kind in fields
+        ]
+    )
+
+
+def _optional_float(cell: bytes) -> float:
+    try:
+        return float(cell)
+    except ValueError:
+        return 0.0
+
+
+def parse_fields(rows: np.ndarray, fields: List[Field], section: str = "") -> np.ndarray:
+    """Converte os cartões (matriz uint8 k x WIDTH, brancos = espaço) em um array estruturado."""
+    out = np.empty(len(rows), dtype=fields_dtype(fields))
+    for name, first, last, kind in fields:
+        block = rows[:, first - 1 : last]
+        cells = np.ascontiguousarray(block).view(f"S{last - first + 1}").ravel()
+        if kind.lower() == "a":
+            cells = np.char.strip(cells)
+            plain = (block < 128).all()
+            out[name] = cells.astype(out.dtype[name]) if plain else np.char.decode(cells, "latin-1")
+            continue
+        blank = (block == 32).all(axis=1)
+        if blank.any():
+            cells[blank] = b"0"  # campos opcionais em branco valem zero
+        try:
+            values = cells.astype(np.float64)
+        except ValueError as e:
+            if kind.isupper():
+                raise ValueError(f"IEEE CDF: valor inválido em {section}.{name}: {e}") from None
+            # campos opcionais fora das colunas (comum no fim dos cartões de ramo)
+            # valem zero, como os em branco
+            values = np.array([_optional_float(c) for c in cells.tolist()])
+        out[name] = values
+    return out
+
+
+def bus_positions(bus_numbers: np.ndarray, numbers: np.ndarray) -> np.ndarray:
+    """Posição de cada número em bus_numbers (busca binária); ValueError se faltar algum."""
+    order = np.argsort(bus_numbers, kind="stable")
+    sorted_numbers = bus_numbers[order]
+    pos = np.searchsorted(sorted_numbers, numbers)
+    pos = np.minimum(pos, max(len(order) - 1, 0))
+    if len(numbers) and (len(order) == 0 or (sorted_numbers[pos] != numbers).any()):
+        missing = sorted(set(np.asarray(numbers).tolist()) - set(sorted_numbers.tolist()))
+        raise ValueError(f"Ramo ligado a barra inexistente: {missing[:5]}")
+    return order[pos]
+
+
+@dataclass
+class IeeeCdfCase:
+    """Um arquivo CDF em colunas: cada seção é um array estruturado (um campo por coluna)."""
+
+    title: np.ndarray  # registro único (TITLE_FIELDS)
+    buses: np.ndarray
+    branches: np.ndarray
+    loss_zones: np.ndarray
+    interchange: np.ndarray
+    tie_lines: np.ndarray
+
+    @property
+    def base_mva(self) -> float:
+        base = float(self.title["base_mva"])
+        return base if base > 0 else 100.0
+
+    def bus_index(self, numbers: np.ndarray) -> np.ndarray:
+        """Posição (linha de buses) de cada número de barra."""
+        return bus_positions(self.buses["number"], numbers)
+
+    def branch_ends(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Índices (tap, z) das barras de cada ramo."""
+        return self.bus_index(self.branches["tap_bus"]), self.bus_index(self.branches["z_bus"])
+
+    def branch_admittances(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(y série, bc, tap complexo = relação·e^{jθ}) por ramo; relação 0 vale 1."""
+        br = self.branches
+        y = 1.0 / (br["r"] + 1j * br["x"])
+        ratio = np.where(br["ratio"] == 0, 1.0, br["ratio"])
+        tap = ratio * np.exp(1j * np.radians(br["angle"]))
+        return y, br["b"].copy(), tap
+
+
+def _card_matrix(data: bytes) -> np.ndarray:
+    lines = data.splitlines()
+    cards = np.array(lines, dtype=f"S{WIDTH}").view(np.uint8).reshape(len(lines), WIDTH)
+    cards[cards == 0] = 32  # o numpy completa as linhas curtas com \0
+    return cards
+
+
+def parse_ieee_cdf(data: bytes) -> IeeeCdfCase:
+    cards = _card_matrix(data)
+    if len(cards) == 0:
+        raise ValueError("IEEE CDF: arquivo vazio.")
+
+    # cartões de fim de seção: -999, -99 ou -9 no começo da linha
+    first_word = np.char.strip(cards[:, :16].copy().view("S16").ravel())
+    ends = np.flatnonzero(np.char.startswith(first_word, b"-9"))
+
+    sections: Dict[str, np.ndarray] = {}
+    start = 1
+    for end in ends:
+        header = first_word[start].split(b" ")[0] if first_word[start] else b""
+        for name, (word, fields) in SECTIONS.items():
+            if header == word and name not in sections:
+                sections[name] = parse_fields(cards[start + 1 : end], fields, name)
+                break
+        start = end + 1
+
+    for name in ("buses", "branches"):
+        if name not in sections:
+            raise ValueError(f"IEEE CDF: seção obrigatória ausente: {name}")
+    for name, (_, fields) in SECTIONS.items():
+        sections.setdefault(name, np.empty(0, dtype=fields_dtype(fields)))
+
+    return IeeeCdfCase(title=parse_fields(cards[:1], TITLE_FIELDS, "title")[0], **sections)
+
+
+def read_ieee_cdf(path: str) -> IeeeCdfCase:
+    with open(path, "rb") as file:
+        return parse_ieee_cdf(file.read())
+
+
+# tipos 0 e 1 do CDF são barras PQ (1 só limita os MVAr, o que o fluxo não trata)
+_BUS_TYPES = {0: BusType.PQ, 1: BusType.PQ, 2: BusType.PV, 3: BusType.SLACK}
+
+
+def power_flow_from_cdf(case: IeeeCdfCase) -> PowerFlow:
+    """Monta o PowerFlow (objetos Bus/Line) a partir das colunas."""
+    power_flow = PowerFlow(base=case.base_mva)
+
+    b = case.buses
+    columns = {name: b[name].tolist() for name in b.dtype.names}
+    angles = np.radians(b["angle"]).tolist()
+    for k, number in enumerate(columns["number"]):
+        power_flow.add_bus(
+            Bus(
+                id=norm_bus_id(number),
+                number=number,
+                name=columns["name"][k],
+                type=_BUS_TYPES.get(columns["type"][k], BusType.PQ),
+                v=columns["v"][k],
+                o=angles[k],
+                p_load=columns["p_load"][k],
+                q_load=columns["q_load"][k],
+                p_gen=columns["p_gen"][k],
+                q_gen=columns["q_gen"][k],
+                v_rated=columns["base_kv"][k],
+                q_max=columns["q_max"][k],
+                q_min=columns["q_min"][k],
+                g_shunt=columns["g_shunt"][k],
+                b_shunt=columns["b_shunt"][k],
+            )
+        )
+
+    br = case.branches
+    tap = np.where(br["ratio"] == 0, 1.0, br["ratio"]).tolist()
+    phase = np.radians(br["angle"]).tolist()
+    # tipos 1-4 são transformadores; os arquivos do UW (14 e 57 barras) marcam alguns
+    # como tipo 0 e só preenchem a relação de espiras
+    transformer = ((br["type"] >= 1) & (br["type"] <= 4) | (br["ratio"] != 0)).tolist()
+    for k, (f, t, r, x, bc) in enumerate(
+        zip(*(br[name].tolist() for name in ("tap_bus", "z_bus", "r", "x", "b")))
+    ):
+        branch = Transformer.from_z if transformer[k] else Line.from_z
+        power_flow.add_connection(
+            branch(
+                tap_bus_id=norm_bus_id(f),
+                z_bus_id=norm_bus_id(t),
+                z=complex(r, x),
+                bc=bc,
+                tap=tap[k],
+                phase=phase[k],
+            )
+        )
+    return power_flow
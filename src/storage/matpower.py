@@ -0,0 +1,418 @@
+"""
+Casos MATPOWER (.m): leitura e escrita das matrizes bus/gen/branch.
+
+    case = read_matpower("case3120sp.m")
+    case.bus[:, VM], case.branch[:, BR_X]      # matrizes numpy, colunas como no MATPOWER
+    f, t = case.branch_ends()                  # índices das barras de cada ramo
+    power_flow = power_flow_from_matpower(case)
+
+    write_matpower("ieee118.m", case_from_cdf(read_ieee_cdf("ieee118cdf.txt")))
+
+Cada matriz é lida com um único split do texto e uma conversão numpy (sem um
+objeto por elemento); os objetos Bus/Line só são criados por
+power_flow_from_matpower, quando a interface precisa deles.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from maths.power_flow import PowerFlow
+from models.bus import Bus, BusType
+from models.line import Line
+from storage.id_utils import norm_bus_id
+from storage.ieee_cdf import IeeeCdfCase, bus_positions
+
+# colunas (idx_bus, idx_gen, idx_brch do MATPOWER, a partir de 0)
+BUS_I, BUS_TYPE, PD, QD, GS, BS, BUS_AREA, VM, VA, BASE_KV, ZONE, VMAX, VMIN = range(13)
+GEN_BUS, PG, QG, QMAX, QMIN, VG, MBASE, GEN_STATUS, PMAX, PMIN = range(10)
+F_BUS, T_BUS, BR_R, BR_X, BR_B, RATE_A, RATE_B, RATE_C, TAP, SHIFT, BR_STATUS = range(11)
+ANGMIN, ANGMAX = 11, 12
+
+# tipos de barra do MATPOWER
+PQ, PV, REF, NONE = 1, 2, 3, 4
+
+# colunas mínimas de cada matriz (formato 1 tem branch sem ANGMIN/ANGMAX)
+MIN_COLUMNS = {"bus": 13, "gen": 10, "branch": 11}
+
+_ASSIGNMENT = re.compile(r"^[ \t]*(?:\w+\.)?(\w+)[ \t]*=[ \t]*([\[{]|[^;\n]*)", re.M)
+_COMMENT = re.compile(r"%[^\n]*")
+_QUOTED = re.compile(r"'((?:[^']|'')*)'")
+
+
+@dataclass
+class MatpowerCase:
+    """Matrizes do caso como no MATPOWER (uma linha por barra/gerador/ramo)."""
+
+    base_mva: float
+    bus: np.ndarray
+    gen: np.ndarray
+    branch: np.ndarray
+    gencost: Optional[np.ndarray] = None
+    bus_name: Optional[List[str]] = None
+    name: str = "case"
+    version: str = "2"
+    extra: Dict[str, np.ndarray] = field(default_factory=dict)  # areas etc.
+
+    def bus_index(self, numbers: np.ndarray) -> np.ndarray:
+        """Posição (linha de bus) de cada número de barra."""
+        return bus_positions(self.bus[:, BUS_I].astype(np.int64), numbers.astype(np.int64))
+
+    def branch_ends(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Índices (from, to) das barras de cada ramo."""
+        return self.bus_index(self.branch[:, F_BUS]), self.bus_index(self.branch[:, T_BUS])
+
+    def branch_admittances(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(y série, bc, tap complexo = relação·e^{jθ}) por ramo; TAP 0 vale 1."""
+        br = self.branch
+        y = 1.0 / (br[:, BR_R] + 1j * br[:, BR_X])
+        ratio = np.where(br[:, TAP] == 0, 1.0, br[:, TAP])
+        return y, br[:, BR_B].copy(), ratio * np.exp(1j * np.radians(br[:, SHIFT]))
+
+
+# ------------------------------------------------------------------
+# leitura
+# ------------------------------------------------------------------
+def _matrix(body: str, name: str) -> np.ndarray:
+    body = _COMMENT.sub("", body).replace("...", " ").replace(",", " ")
+    rows = [row for row in re.split(r"[;\n]", body) if row.strip()]
+    if not rows:
+        return np.zeros((0, MIN_COLUMNS.get(name, 0)))
+    columns = len(rows[0].split())
+    values = np.array(" ".join(rows).split(), dtype=np.float64)
+    if columns == 0 or len(values) % columns:
+        raise ValueError(f"MATPOWER: mpc.{name} com linhas de tamanhos diferentes.")
+    matrix = values.reshape(-1, columns)
+    if len(matrix) != len(rows):
+        raise ValueError(f"MATPOWER: mpc.{name} com linhas de tamanhos diferentes.")
+    return matrix
+
+
+def parse_matpower(text: str) -> MatpowerCase:
+    matrices: Dict[str, np.ndarray] = {}
+    scalars: Dict[str, str] = {}
+    bus_name: Optional[List[str]] = None
+
+    function = re.search(r"^\s*function\s+(?:\w+\s*=\s*)?(\w+)", text, re.M)
+    for match in _ASSIGNMENT.finditer(text):
+        key, value = match.group(1), match.group(2)
+        if value == "[":
+            end = text.find("]", match.end())
+            if end < 0:
+                raise ValueError(f"MATPOWER: mpc.{key} sem ']'.")
+            matrices[key] = _matrix(text[match.end() : end], key)
+        elif value == "{":
+            end = text.find("}", match.end())
+            if key == "bus_name":
+                body = _COMMENT.sub("", text[match.end() : end])
+                bus_name = [s.replace("''", "'") for s in _QUOTED.findall(body)]
+        else:
+            scalars[key] = value.strip()
+
+    for key in ("bus", "gen", "branch"):
+        if key not in matrices:
+            raise ValueError(f"MATPOWER: matriz obrigatória ausente: mpc.{key}")
+        if matrices[key].shape[1] < MIN_COLUMNS[key]:
+            raise ValueError(
+                f"MATPOWER: mpc.{key} com {matrices[key].shape[1]} colunas "
+                f"(mínimo {MIN_COLUMNS[key]})."
+            )
+    try:
+        base_mva = float(scalars.get("baseMVA", "100"))
+    except ValueError:
+        raise ValueError(f"MATPOWER: baseMVA inválido: {scalars['baseMVA']}") from None
+
+    return MatpowerCase(
+        base_mva=base_mva,
+        bus=matrices.pop("bus"),
+        gen=matrices.pop("gen"),
+        branch=matrices.pop("branch"),
+        gencost=matrices.pop("gencost", None),
+        bus_name=bus_name,
+        name=function.group(1) if function else "case",
+        version=scalars.get("version", "2").strip("'\""),
+        extra=matrices,
+    )
+
+
+def read_matpower(path: str) -> MatpowerCase:
+    with open(path, "r", encoding="latin-1") as file:
+        return parse_matpower(file.read())
+
+
+# ------------------------------------------------------------------
+# escrita
+# ------------------------------------------------------------------
+def _number(v: float) -> str:
+    if math.isinf(v):
+        return "Inf" if v > 0 else "-Inf"
+    if math.isnan(v):
+        return "NaN"
+    return str(int(v)) if v.is_integer() and abs(v) < 1e15 else repr(v)
+
+
+def _matrix_text(name: str, matrix: np.ndarray) -> str:
+    # inteiros sem ".0", Inf/NaN como no MATLAB, o resto com repr (str de float);
+    # a máscara é montada em lote e cada linha vira texto com um único map(str)
+    cells = matrix.astype(object)
+    integral = np.isfinite(matrix) & (matrix == np.round(matrix)) & (np.abs(matrix) < 1e15)
+    cells[integral] = matrix[integral].astype(np.int64).tolist()
+    special = ~np.isfinite(matrix)
+    cells[special] = [_number(v) for v in matrix[special].tolist()]
+    rows = "".join(f"\t{chr(9).join(map(str, row))};\n" for row in cells.tolist())
+    return f"mpc.{name} = [\n{rows}];\n"
+
+
+def format_matpower(case: MatpowerCase) -> str:
+    """Texto .m (formato 2); os floats usam repr, que volta ao mesmo valor na leitura."""
+    parts = [
+        f"function mpc = {case.name}\n",
+        f"mpc.version = '{case.version}';\n",
+        f"mpc.baseMVA = {_number(float(case.base_mva))};\n",
+        _matrix_text("bus", case.bus),
+        _matrix_text("gen", case.gen),
+        _matrix_text("branch", case.branch),
+    ]
+    if case.gencost is not None:
+        parts.append(_matrix_text("gencost", case.gencost))
+    for key, matrix in case.extra.items():
+        parts.append(_matrix_text(key, matrix))
+    if case.bus_name is not None:
+        names = "".join(f"\t'{n.replace(chr(39), chr(39) * 2)}';\n" for n in case.bus_name)
+        parts.append(f"mpc.bus_name = {{\n{names}}};\n")
+    return "".join(parts)
+
+
+def write_matpower(path: str, case: MatpowerCase) -> None:
+    with open(path, "w", encoding="latin-1") as file:
+        file.write(format_matpower(case))
+
+
+# ------------------------------------------------------------------
+# conversões
+# ------------------------------------------------------------------
+# tipos do CDF (0/1 PQ, 2 PV, 3 referência) -> MATPOWER
+_CDF_TYPES = np.array([PQ, PQ, PV, REF])
+
+
+def case_from_cdf(cdf: IeeeCdfCase) -> MatpowerCase:
+    """Caso MATPOWER a partir das colunas do CDF (como o cdf2mpc), sem criar objetos."""
+    b = cdf.buses
+    base = cdf.base_mva
+    bus = np.zeros((len(b), 13))
+    bus[:, BUS_I] = b["number"]
+    bus[:, BUS_TYPE] = _CDF_TYPES[np.clip(b["type"], 0, 3)]
+    bus[:, PD] = b["p_load"]
+    bus[:, QD] = b["q_load"]
+    bus[:, GS] = b["g_shunt"] * base
+    bus[:, BS] = b["b_shunt"] * base
+    bus[:, BUS_AREA] = b["area"]
+    bus[:, VM] = b["v"]
+    bus[:, VA] = b["angle"]
+    bus[:, BASE_KV] = b["base_kv"]
+    bus[:, ZONE] = b["zone"]
+    bus[:, VMAX] = 1.06
+    bus[:, VMIN] = 0.94
+
+    # um gerador por barra PV/referência ou com geração não nula
+    has_gen = (b["type"] >= 2) | (b["p_gen"] != 0) | (b["q_gen"] != 0)
+    g = b[has_gen]
+    gen = np.zeros((len(g), 10))
+    gen[:, GEN_BUS] = g["number"]
+    gen[:, PG] = g["p_gen"]
+    gen[:, QG] = g["q_gen"]
+    gen[:, QMAX] = g["q_max"]
+    gen[:, QMIN] = g["q_min"]
+    gen[:, VG] = g["v"]
+    gen[:, MBASE] = base
+    gen[:, GEN_STATUS] = 1
+    gen[:, PMAX] = np.inf
+    gen[:, PMIN] = 0
+
+    r = cdf.branches
+    branch = np.zeros((len(r), 13))
+    branch[:, F_BUS] = r["tap_bus"]
+    branch[:, T_BUS] = r["z_bus"]
+    branch[:, BR_R] = r["r"]
+    branch[:, BR_X] = r["x"]
+    branch[:, BR_B] = r["b"]
+    branch[:, RATE_A] = r["rating_1"]
+    branch[:, RATE_B] = r["rating_2"]
+    branch[:, RATE_C] = r["rating_3"]
+    branch[:, TAP] = r["ratio"]
+    branch[:, SHIFT] = r["angle"]
+    branch[:, BR_STATUS] = 1
+    branch[:, ANGMIN] = -360
+    branch[:, ANGMAX] = 360
+
+    return MatpowerCase(
+        base_mva=base,
+        bus=bus,
+        gen=gen,
+        branch=branch,
+        bus_name=b["name"].tolist(),
+        name=re.sub(r"\W+", "_", str(cdf.title["case_id"])).strip("_").lower() or "case",
+    )
+
+
+_BUS_TYPES = {PQ: BusType.PQ, PV: BusType.PV, REF: BusType.SLACK}
+
+
+def power_flow_from_matpower(case: MatpowerCase) -> PowerFlow:
+    """
+    Monta o PowerFlow (objetos Bus/Line) a partir das matrizes.
+
+    Os geradores em serviço de cada barra são somados nela (Pg, Qg, limites de
+    Q) e o VG deles vira a tensão especificada das barras PV/referência. Barras
+    isoladas (tipo 4) e ramos fora de serviço ficam de fora.
+    """
+    base = case.base_mva
+    bus = case.bus
+    n = len(bus)
+
+    gen = case.gen[case.gen[:, GEN_STATUS] > 0]
+    at = case.bus_index(gen[:, GEN_BUS])
+    p_gen, q_gen, q_max, q_min = (
+        np.bincount(at, gen[:, column], minlength=n) for column in (PG, QG, QMAX, QMIN)
+    )
+    has_gen = np.bincount(at, minlength=n) > 0
+    v = bus[:, VM].copy()
+    v_gen = np.zeros(n)
+    v_gen[at] = gen[:, VG]
+    regulated = has_gen & np.isin(bus[:, BUS_TYPE], (PV, REF))
+    v[regulated] = v_gen[regulated]
+
+    power_flow = PowerFlow(base=base)
+    numbers = bus[:, BUS_I].astype(np.int64).tolist()
+    types = bus[:, BUS_TYPE].astype(np.int64).tolist()
+    names = case.bus_name if case.bus_name is not None else [None] * n
+    columns = [
+        c.tolist()
+        for c in (
+            v,
+            np.radians(bus[:, VA]),
+            bus[:, PD],
+            bus[:, QD],
+            p_gen,
+            q_gen,
+            bus[:, BASE_KV],
+            bus[:, GS] / base,
+            bus[:, BS] / base,
+        )
+    ]
+    limits = has_gen.tolist(), q_max.tolist(), q_min.tolist()
+    for k, (vk, ok, pl, ql, pg, qg, kv, gs, bs) in enumerate(zip(*columns)):
+        if types[k] == NONE:
+            continue
+        extra = {"q_max": limits[1][k], "q_min": limits[2][k]} if limits[0][k] else {}
+        power_flow.add_bus(
+            Bus(
+                id=norm_bus_id(numbers[k]),
+                number=numbers[k],
+                name=names[k],
+                type=_BUS_TYPES.get(types[k], BusType.PQ),
+                v=vk,
+                o=ok,
+                p_load=pl,
+                q_load=ql,
+                p_gen=pg,
+                q_gen=qg,
+                v_rated=kv,
+                g_shunt=gs,
+                b_shunt=bs,
+                **extra,
+            )
+        )
+
+    br = case.branch
+    isolated = set(np.asarray(numbers)[np.asarray(types) == NONE].tolist())
+    in_service = br[:, BR_STATUS] > 0
+    tap = np.where(br[:, TAP] == 0, 1.0, br[:, TAP])[in_service].tolist()
+    phase = np.radians(br[:, SHIFT])[in_service].tolist()
+    rows = zip(*(br[in_service, c].tolist() for c in (F_BUS, T_BUS, BR_R, BR_X, BR_B)))
+    for k, (f, t, r, x, bc) in enumerate(rows):
+        if int(f) in isolated or int(t) in isolated:
+            continue
+        power_flow.add_connection(
+            Line.from_z(
+                tap_bus_id=norm_bus_id(int(f)),
+                z_bus_id=norm_bus_id(int(t)),
+                z=complex(r, x),
+                bc=bc,
+                tap=tap[k],
+                phase=phase[k],
+            )
+        )
+    return power_flow
+
+
+_TYPES_TO_MATPOWER = {BusType.PQ: PQ, BusType.PV: PV, BusType.SLACK: REF}
+
+
+def case_from_elements(
+    buses: Iterable[Bus], lines: Iterable[Line], base_mva: float
+) -> MatpowerCase:
+    """Caso MATPOWER a partir dos objetos da interface (para exportar)."""
+    buses = list(buses)
+    lines = list(lines)
+    number = {bus.id: bus.number for bus in buses}
+
+    bus = np.zeros((len(buses), 13))
+    bus[:, [BUS_I, BUS_TYPE, PD, QD, GS, BS, VM, VA, BASE_KV]] = [
+        [
+            b.number,
+            _TYPES_TO_MATPOWER[b.type],
+            b.p_load,
+            b.q_load,
+            b.g_shunt * base_mva,
+            b.b_shunt * base_mva,
+            b.v,
+            math.degrees(b.o),
+            b.v_rated,
+        ]
+        for b in buses
+    ] or np.zeros((0, 9))
+    bus[:, [BUS_AREA, ZONE]] = 1
+    bus[:, VMAX] = 1.06
+    bus[:, VMIN] = 0.94
+
+    gens = [b for b in buses if b.type is not BusType.PQ or b.p_gen != 0 or b.q_gen != 0]
+    gen = np.zeros((len(gens), 10))
+    gen[:, [GEN_BUS, PG, QG, QMAX, QMIN, VG]] = [
+        [b.number, b.p_gen, b.q_gen, b.q_max, b.q_min, b.v] for b in gens
+    ] or np.zeros((0, 6))
+    gen[:, MBASE] = base_mva
+    gen[:, GEN_STATUS] = 1
+    gen[:, PMAX] = np.inf
+
+    branch = np.zeros((len(lines), 13))
+    rows = []
+    for line in lines:
+        z = line.z1 if line.z1 is not None else 1 / line.y
+        tap = line.tap if line.tap != 1.0 or line.phase != 0 else 0.0
+        rows.append(
+            [
+                number[line.tap_bus_id],
+                number[line.z_bus_id],
+                z.real,
+                z.imag,
+                line.bc,
+                tap,
+                math.degrees(line.phase),
+            ]
+        )
+    branch[:, [F_BUS, T_BUS, BR_R, BR_X, BR_B, TAP, SHIFT]] = rows or np.zeros((0, 7))
+    branch[:, BR_STATUS] = 1
+    branch[:, ANGMIN] = -360
+    branch[:, ANGMAX] = 360
+
+    return MatpowerCase(
+        base_mva=base_mva,
+        bus=bus,
+        gen=gen,
+        branch=branch,
+        bus_name=[b.name for b in buses],
+    )
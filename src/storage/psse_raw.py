@@ -0,0 +1,509 @@
+"""
+Importação de arquivos PSS/E RAW (revisões 33 e 34).
+
+    raw = read_psse_raw("rede.raw")
+    ctrl.add_many(buses=raw.buses, lines=raw.lines, generators=raw.generators)
+    for warning in raw.warnings:
+        print(warning)
+
+O arquivo é lido linha a linha, uma seção por vez (barras, cargas, shunts
+fixos, geradores, ramos, chaves e disjuntores da v34, transformadores de dois
+enrolamentos, shunts chaveados); cada registro vira direto o objeto do modelo, sem guardar o
+texto nem uma lista intermediária de registros. Cargas, shunts e geradores
+são acumulados na barra (potências em MW/Mvar, shunts em pu na base do
+sistema). Registros e seções que o modelo não representa (transformadores
+de três enrolamentos, elos CC, FACTS, ...) são pulados e listados em
+warnings, sem interromper a leitura.
+"""
+
+import csv
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from maths.power_flow import PowerFlow
+from models.bus import Bus, BusType
+from models.generator import Generator, GeneratorSC
+from models.line import Line
+from models.transformer import Transformer, TransformerMeta
+from storage.id_utils import norm_bus_id
+
+# ordem das seções em cada revisão (o comentário "BEGIN ... DATA" do cartão
+# de fim de seção, quando existe, tem precedência)
+# fmt: off
+SECTIONS: Dict[int, Tuple[str, ...]] = {
+    33: (
+        "bus", "load", "fixed shunt", "generator", "branch", "transformer", "area",
+        "two-terminal dc", "vsc dc", "impedance correction", "multi-terminal dc",
+        "multi-section line", "zone", "inter-area transfer", "owner", "facts",
+        "switched shunt", "gne", "induction machine",
+    ),
+    34: (
+        "system-wide", "bus", "load", "fixed shunt", "generator", "branch",
+        "system switching device", "transformer", "area", "two-terminal dc", "vsc dc",
+        "impedance correction", "multi-terminal dc", "multi-section line", "zone",
+        "inter-area transfer", "owner", "facts", "switched shunt", "gne", "induction machine",
+        "substation",
+    ),
+}
+# fmt: on
+
+# seções sem efeito na rede elétrica: puladas sem aviso (system-wide: parâmetros
+# de solução GENERAL, GAUSS, NEWTON, ..., RATING da v34)
+_DESCRIPTIVE = {"system-wide", "area", "zone", "owner", "inter-area transfer"}
+
+_BEGIN = re.compile(r"BEGIN\s+(.+?)\s+DATA", re.I)
+_QUOTED = re.compile(r"'[^']*'|\"[^\"]*\"")
+
+# IDE do PSS/E -> tipo de barra (4 = isolada, fica de fora)
+_BUS_TYPES = {1: BusType.PQ, 2: BusType.PV, 3: BusType.SLACK}
+
+# grupo vetorial (VECGRP, ex. "YNd1") -> ligação de cada enrolamento
+_WINDINGS = re.compile(r"^(YN|Y|D|ZN|Z)(yn|y|d|zn|z)", re.I)
+_CONNECTIONS = {"YN": ("Yg", True), "Y": ("Y", False), "D": ("D", False)}
+
+
+@dataclass
+class PsseRawImport:
+    buses: List[Bus] = field(default_factory=list)
+    lines: List[Line] = field(default_factory=list)  # linhas e Transformer
+    generators: List[Generator] = field(default_factory=list)
+    base_mva: float = 100.0
+    version: int = 33
+    title: str = ""
+    warnings: List[str] = field(default_factory=list)
+
+    def power_flow(self) -> PowerFlow:
+        power_flow = PowerFlow(base=self.base_mva)
+        for bus in self.buses:
+            power_flow.add_bus(bus)
+        for line in self.lines:
+            power_flow.add_connection(line)
+        return power_flow
+
+
+def _cut_comment(line: str) -> str:
+    """Corta o comentário: "/" fora de aspas até o fim da linha."""
+    position = 0
+    for quoted in _QUOTED.finditer(line):
+        slash = line.find("/", position, quoted.start())
+        if slash >= 0:
+            return line[:slash]
+        position = quoted.end()
+    slash = line.find("/", position)
+    return line[:slash] if slash >= 0 else line
+
+
+def _fields(line: str) -> List[Optional[str]]:
+    """Campos de um registro: vírgulas ou espaços, aspas simples, comentário após "/"."""
+    if "/" in line:
+        line = _cut_comment(line)
+    if "," in line:
+        if "'" in line:
+            row = next(csv.reader([line], quotechar="'", skipinitialspace=True))
+        else:
+            row = line.split(",")
+        return [value.strip() or None for value in row]
+    return [token.strip("'\"") for token in re.findall(r"'[^']*'|\"[^\"]*\"|\S+", line)]
+
+
+def _get(row: List[Optional[str]], k: int, default: float = 0.0) -> float:
+    if k < len(row) and row[k] is not None:
+        return float(row[k])
+    return default
+
+
+def _text(row: List[Optional[str]], k: int, default: str = "") -> str:
+    if k < len(row) and row[k] is not None:
+        return row[k].strip().strip("'\"").strip()
+    return default
+
+
+def _is_number(value: Optional[str]) -> bool:
+    try:
+        float(value or "")
+    except ValueError:
+        return False
+    return True
+
+
+def _is_end(row: List[Optional[str]]) -> bool:
+    return bool(row) and row[0] in ("0", "Q")
+
+
+@dataclass
+class _BusTotals:
+    p_load: float = 0.0
+    q_load: float = 0.0
+    g_shunt: float = 0.0
+    b_shunt: float = 0.0
+    p_gen: float = 0.0
+    q_gen: float = 0.0
+    q_max: float = 0.0
+    q_min: float = 0.0
+    v_set: Optional[float] = None
+    generators: List[Tuple[str, float, float]] = field(default_factory=list)  # (id, x1, mbase)
+
+
+class _Reader:
+    def __init__(self, file: TextIO) -> None:
+        self.__file = file
+        self.result = PsseRawImport()
+        self.sbase = 100.0
+        self.buses: Dict[str, Bus] = {}
+        self.base_kv: Dict[str, float] = {}
+        self.totals: Dict[str, _BusTotals] = {}
+        self.isolated: set[str] = set()
+        self.line_number = 0
+        self.finished = False
+
+    # ------------------------------------------------------------------
+    def __next_line(self) -> Optional[str]:
+        line = self.__file.readline()
+        if not line:
+            return None
+        self.line_number += 1
+        return line.rstrip("\r\n")
+
+    def __records(self) -> Iterator[Tuple[int, List[Optional[str]]]]:
+        """Registros da seção atual até o cartão "0"; guarda o nome da próxima seção."""
+        self.next_section: Optional[str] = None
+        while True:
+            line = self.__next_line()
+            if line is None:
+                self.finished = True
+                return
+            if not line.strip():
+                continue
+            row = _fields(line)
+            if _is_end(row):
+                if row[0] == "Q":
+                    self.finished = True
+                begin = _BEGIN.search(line)
+                if begin:
+                    self.next_section = " ".join(begin.group(1).lower().split())
+                return
+            yield self.line_number, row
+
+    def __continuation(self) -> List[Optional[str]]:
+        """Linha seguinte de um registro de várias linhas (sem testar o fim de seção)."""
+        line = self.__next_line()
+        if line is None:
+            raise ValueError("registro incompleto no fim do arquivo")
+        return _fields(line)
+
+    def __warn(self, line_number: int, message: str) -> None:
+        self.result.warnings.append(f"linha {line_number}: {message}")
+
+    def __bus_id(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        bus_id = norm_bus_id(abs(int(float(value))))
+        return None if bus_id in self.isolated else bus_id
+
+    def __known(self, line_number: int, *bus_ids: Optional[str]) -> bool:
+        for bus_id in bus_ids:
+            if bus_id is None or bus_id not in self.buses:
+                if bus_id is not None:
+                    self.__warn(line_number, f"barra {bus_id} inexistente; registro ignorado")
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    def read(self) -> PsseRawImport:
+        header = _fields(self.__next_line() or "")
+        self.sbase = _get(header, 1, 100.0)
+        version = int(_get(header, 2, 33))
+        if version not in SECTIONS:
+            self.result.warnings.append(f"revisão {version} não suportada; lida como 33")
+        self.result.version = version
+        self.result.base_mva = self.sbase
+        self.result.title = " ".join(filter(None, (self.__next_line(), self.__next_line()))).strip()
+
+        order = SECTIONS.get(version, SECTIONS[33])
+        position = 0
+        section: Optional[str] = order[0]
+        handlers = {
+            "bus": self.__bus,
+            "load": self.__load,
+            "fixed shunt": self.__fixed_shunt,
+            "generator": self.__generator,
+            "branch": self.__branch,
+            "non-transformer branch": self.__branch,
+            "system switching device": self.__switching_device,
+            "transformer": self.__transformer,
+            "switched shunt": self.__switched_shunt,
+        }
+        while not self.finished and section is not None:
+            handler = handlers.get(section)
+            ignored = 0
+            for line_number, row in self.__records():
+                if section == "system-wide" and _is_number(row[0]):
+                    # v34 sem o bloco de dados do sistema: o arquivo já começa nas barras
+                    position, section = order.index("bus"), "bus"
+                    handler = handlers[section]
+                if handler is None:
+                    ignored += 1
+                    continue
+                try:
+                    handler(line_number, row)
+                except (ValueError, IndexError, ZeroDivisionError) as e:
+                    self.__warn(line_number, f"registro de '{section}' inválido ({e}); ignorado")
+            if ignored and section not in _DESCRIPTIVE:
+                self.result.warnings.append(
+                    f"seção '{section}' não suportada: {ignored} linhas ignoradas"
+                )
+            if self.next_section is not None and self.next_section in order:
+                position = order.index(self.next_section)
+                section = self.next_section
+            else:
+                position += 1
+                section = order[position] if position < len(order) else None
+
+        self.__finish()
+        return self.result
+
+    # ------------------------------------------------------------------
+    # seções
+    # ------------------------------------------------------------------
+    def __bus(self, line_number: int, row: List[Optional[str]]) -> None:
+        # I, 'NAME', BASKV, IDE, AREA, ZONE, OWNER, VM, VA, ...
+        bus_id = norm_bus_id(int(float(row[0])))
+        ide = int(_get(row, 3, 1))
+        if ide == 4:
+            self.isolated.add(bus_id)
+            return
+        if ide not in _BUS_TYPES:
+            self.__warn(line_number, f"barra {bus_id} com IDE {ide}; tratada como PQ")
+        base_kv = _get(row, 2)
+        self.buses[bus_id] = Bus(
+            id=bus_id,
+            number=int(bus_id),
+            name=_text(row, 1) or None,
+            type=_BUS_TYPES.get(ide, BusType.PQ),
+            v=_get(row, 7, 1.0),
+            o=math.radians(_get(row, 8)),
+            v_rated=base_kv,
+        )
+        self.base_kv[bus_id] = base_kv
+        self.totals[bus_id] = _BusTotals()
+
+    def __load(self, line_number: int, row: List[Optional[str]]) -> None:
+        # I, 'ID', STATUS, AREA, ZONE, PL, QL, IP, IQ, YP, YQ, ...
+        bus_id = self.__bus_id(row[0])
+        if not self.__known(line_number, bus_id) or _get(row, 2, 1) == 0:
+            return
+        totals = self.totals[bus_id]
+        # corrente constante entra como potência constante na tensão nominal
+        totals.p_load += _get(row, 5) + _get(row, 7)
+        totals.q_load += _get(row, 6) + _get(row, 8)
+        # admitância constante (MW/Mvar em 1 pu; YQ como o BL do shunt fixo:
+        # negativo é indutivo, positivo é capacitivo)
+        totals.g_shunt += _get(row, 9) / self.sbase
+        totals.b_shunt += _get(row, 10) / self.sbase
+
+    def __fixed_shunt(self, line_number: int, row: List[Optional[str]]) -> None:
+        # I, 'ID', STATUS, GL, BL
+        bus_id = self.__bus_id(row[0])
+        if not self.__known(line_number, bus_id) or _get(row, 2, 1) == 0:
+            return
+        self.totals[bus_id].g_shunt += _get(row, 3) / self.sbase
+        self.totals[bus_id].b_shunt += _get(row, 4) / self.sbase
+
+    def __switched_shunt(self, line_number: int, row: List[Optional[str]]) -> None:
+        # v33: I, MODSW, ADJM, STAT, VSWHI, VSWLO, SWREM, RMPCT, 'RMIDNT', BINIT, ...
+        # v34: I, 'ID', MODSW, ADJM, STAT, VSWHI, VSWLO, SWREG, NREG, RMPCT, 'RMIDNT', BINIT, ...
+        # só o BINIT (Mvar em 1 pu) entra, como shunt fixo
+        status, binit = (3, 9) if self.result.version < 34 else (4, 11)
+        bus_id = self.__bus_id(row[0])
+        if not self.__known(line_number, bus_id) or _get(row, status, 1) == 0:
+            return
+        self.totals[bus_id].b_shunt += _get(row, binit) / self.sbase
+
+    def __generator(self, line_number: int, row: List[Optional[str]]) -> None:
+        # v33: I, 'ID', PG, QG, QT, QB, VS, IREG, MBASE, ZR, ZX, RT, XT, GTAP, STAT, ...
+        # v34: I, 'ID', PG, QG, QT, QB, VS, IREG, NREG, MBASE, ZR, ZX, RT, XT, GTAP, STAT, ...
+        mbase_at = 8 if self.result.version < 34 else 9
+        bus_id = self.__bus_id(row[0])
+        if not self.__known(line_number, bus_id) or _get(row, mbase_at + 6, 1) == 0:
+            return
+        totals = self.totals[bus_id]
+        totals.p_gen += _get(row, 2)
+        totals.q_gen += _get(row, 3)
+        totals.q_max += _get(row, 4, 9999.0)
+        totals.q_min += _get(row, 5, -9999.0)
+        totals.v_set = _get(row, 6, 1.0)
+        mbase = _get(row, mbase_at, self.sbase) or self.sbase
+        totals.generators.append((_text(row, 1, "1"), _get(row, mbase_at + 2, 1.0), mbase))
+
+    def __branch(self, line_number: int, row: List[Optional[str]]) -> None:
+        # v33: I, J, 'CKT', R, X, B, RATEA, RATEB, RATEC, GI, BI, GJ, BJ, ST, ...
+        # v34: I, J, 'CKT', R, X, B, 'NAME', RATE1..RATE12, GI, BI, GJ, BJ, ST, ...
+        shunts = 9 if self.result.version < 34 else 19
+        f, t = self.__bus_id(row[0]), self.__bus_id(row[1])
+        if not self.__known(line_number, f, t) or _get(row, shunts + 4, 1) == 0:
+            return
+        r, x = _get(row, 3), _get(row, 4)
+        if r == 0 and x == 0:
+            self.__warn(line_number, f"ramo {f}-{t} com impedância nula; ignorado")
+            return
+        self.result.lines.append(
+            Line.from_z(
+                tap_bus_id=f,
+                z_bus_id=t,
+                z=complex(r, x),
+                bc=_get(row, 5),
+                name=_text(row, 6) if self.result.version >= 34 else None,
+            )
+        )
+        # shunts nas pontas da linha (pu na base do sistema)
+        self.totals[f].g_shunt += _get(row, shunts)
+        self.totals[f].b_shunt += _get(row, shunts + 1)
+        self.totals[t].g_shunt += _get(row, shunts + 2)
+        self.totals[t].b_shunt += _get(row, shunts + 3)
+
+    def __switching_device(self, line_number: int, row: List[Optional[str]]) -> None:
+        # v34: I, J, 'CKT', X, RATE1..RATE12, STAT, NSTAT, METERED, STYPE, 'NAME'
+        # chave fechada = ramo de reatância X (padrão do PSS/E: 0,0001 pu)
+        f, t = self.__bus_id(row[0]), self.__bus_id(row[1])
+        if not self.__known(line_number, f, t) or _get(row, 16, 1) == 0:
+            return
+        self.result.lines.append(
+            Line.from_z(
+                tap_bus_id=f,
+                z_bus_id=t,
+                z=complex(0.0, _get(row, 3) or 1e-4),
+                name=_text(row, 20) or None,
+            )
+        )
+
+    def __transformer(self, line_number: int, row: List[Optional[str]]) -> None:
+        # 4 linhas (dois enrolamentos) ou 5 (três enrolamentos, K != 0):
+        # 1: I, J, K, 'CKT', CW, CZ, CM, MAG1, MAG2, NMETR, 'NAME', STAT, O1, F1, ..., 'VECGRP'
+        # 2: R1-2, X1-2, SBASE1-2, ...
+        # 3: WINDV1, NOMV1, ANG1, ...
+        # 4: WINDV2, NOMV2, ...
+        three_winding = _get(row, 2) != 0
+        rest = [self.__continuation() for _ in range(4 if three_winding else 3)]
+        if three_winding:
+            self.__warn(line_number, "transformador de três enrolamentos não suportado; ignorado")
+            return
+        self.__two_winding(line_number, row, *rest)
+
+    def __two_winding(
+        self,
+        line_number: int,
+        row: List[Optional[str]],
+        impedance: List[Optional[str]],
+        winding_1: List[Optional[str]],
+        winding_2: List[Optional[str]],
+    ) -> None:
+        f, t = self.__bus_id(row[0]), self.__bus_id(row[1])
+        if not self.__known(line_number, f, t) or _get(row, 11, 1) == 0:
+            return
+        cw, cz, cm = int(_get(row, 4, 1)), int(_get(row, 5, 1)), int(_get(row, 6, 1))
+
+        # impedância na base do sistema
+        r, x = _get(impedance, 0), _get(impedance, 1)
+        sbase_12 = _get(impedance, 2, self.sbase) or self.sbase
+        if cz == 3:  # R = perdas em W, X = |Z| em pu na base do enrolamento
+            r = r / (1e6 * sbase_12)
+            x = math.sqrt(max(x * x - r * r, 0.0))
+        if cz in (2, 3):
+            r, x = r * self.sbase / sbase_12, x * self.sbase / sbase_12
+        if r == 0 and x == 0:
+            self.__warn(line_number, f"transformador {f}-{t} com impedância nula; ignorado")
+            return
+
+        # relação de espiras em pu das tensões de base das barras
+        def ratio(windv: float, nomv: float, bus_id: str) -> float:
+            base_kv = self.base_kv[bus_id]
+            if cw == 2:
+                return windv / base_kv if base_kv else windv
+            if cw == 3:
+                return windv * nomv / base_kv if nomv and base_kv else windv
+            return windv
+
+        tap = ratio(_get(winding_1, 0, 1.0), _get(winding_1, 1), f) / ratio(
+            _get(winding_2, 0, 1.0), _get(winding_2, 1), t
+        )
+
+        # magnetização no lado do enrolamento 1 (CM = 2: perdas em W e corrente em pu,
+        # as duas na base do enrolamento; G e B vão juntos para a base do sistema)
+        g_mag, b_mag = _get(row, 7), _get(row, 8)
+        if cm == 2:
+            g_mag = g_mag / (1e6 * sbase_12)
+            b_mag = -math.sqrt(max(b_mag * b_mag - g_mag * g_mag, 0.0))
+            g_mag, b_mag = g_mag * sbase_12 / self.sbase, b_mag * sbase_12 / self.sbase
+        self.totals[f].g_shunt += g_mag
+        self.totals[f].b_shunt += b_mag
+
+        meta = TransformerMeta(
+            sn_mva=sbase_12,
+            hv_kv=_get(winding_1, 1) or self.base_kv[f],
+            lv_kv=_get(winding_2, 1) or self.base_kv[t],
+        )
+        vector_group = _WINDINGS.match(_text(row, 20))
+        if vector_group:
+            for side, code in zip(("hv", "lv"), vector_group.groups()):
+                code = code.upper().replace("Z", "Y")  # ziguezague: como estrela
+                conn, grounded = _CONNECTIONS[code]
+                setattr(meta, f"conn_{side}", conn)
+                setattr(meta, f"grounded_{side}", grounded)
+
+        self.result.lines.append(
+            Transformer.from_z(
+                tap_bus_id=f,
+                z_bus_id=t,
+                z=complex(r, x),
+                tap=tap,
+                phase=math.radians(_get(winding_1, 2)),
+                name=_text(row, 10) or None,
+                meta=meta,
+            )
+        )
+
+    # ------------------------------------------------------------------
+    def __finish(self) -> None:
+        """Passa os totais para as barras e cria um Generator por barra com geração."""
+        for bus_id, bus in self.buses.items():
+            totals = self.totals[bus_id]
+            bus.p_load, bus.q_load = totals.p_load, totals.q_load
+            bus.g_shunt, bus.b_shunt = totals.g_shunt, totals.b_shunt
+            bus.p_gen, bus.q_gen = totals.p_gen, totals.q_gen
+            bus.p_sch, bus.q_sch = bus.p_gen - bus.p_load, bus.q_gen - bus.q_load
+            bus.p, bus.q = bus.p_sch, bus.q_sch
+            if totals.generators:
+                bus.q_max, bus.q_min = totals.q_max, totals.q_min
+                bus.v = bus.v_sch = totals.v_set
+                self.result.generators.append(self.__generator_at(bus, totals))
+            elif bus.type is BusType.PV:
+                bus.type = BusType.PQ  # PV sem gerador em serviço
+            self.result.buses.append(bus)
+
+    def __generator_at(self, bus: Bus, totals: _BusTotals) -> Generator:
+        # máquinas da mesma barra em paralelo (a interface tem um gerador por barra);
+        # ZX (base da máquina) -> base do sistema. O RAW não traz X2/X0 (arquivo .seq):
+        # ficam iguais a X1, com o neutro isolado (máquina atrás de trafo elevador Δ)
+        admittance = sum(mbase / (self.sbase * x) for _, x, mbase in totals.generators if x)
+        x1 = 1.0 / admittance if admittance else GeneratorSC().x1_pu
+        names = ",".join(name for name, _, _ in totals.generators)
+        return Generator(
+            bus_id=bus.id,
+            name=f"G{bus.number} ({names})",
+            p_gen=totals.p_gen,
+            v_set=totals.v_set if totals.v_set is not None else bus.v,
+            q_min=totals.q_min,
+            q_max=totals.q_max,
+            sc=GeneratorSC(x1_pu=x1, x2_pu=x1, x0_pu=x1, grounded=False),
+        )
+
+
+def parse_psse_raw(file: TextIO) -> PsseRawImport:
+    return _Reader(file).read()
+
+
+def read_psse_raw(path: str) -> PsseRawImport:
+    with open(path, "r", encoding="latin-1") as file:
+        return parse_psse_raw(file)
@@ -1,196 +1,693 @@
+"""
+Projeto em JSON (esquema versionado), gravado e lido em fluxo.
+
+    save_json_file("rede.json", buses, lines, positions, generators, base_mva=100.0)
+    project = read_json_project("rede.json")
+    project.buses, project.lines, project.generators, project.positions
+
+Esquema (versão 2):
+    {
+    "format": "powersistemsimu", "version": 2, "layout": "records", "base_mva": 100.0,
+    "buses": [ {...}, ... ],        um objeto por elemento ("records")
+    "lines": [ ... ],
+    "generators": [ ... ]
+    }
+Com layout "arrays", cada seção é um objeto de colunas: {"id": [...], "v": [...], ...}.
+Arquivos sem "version" são da versão 1 (só buses e lines, um objeto por elemento).
+
+A gravação escreve um elemento (ou uma coluna) por vez, sem montar o documento;
+a leitura decodifica um elemento por vez de um buffer de tamanho fixo (no layout
+"arrays", um valor por vez de cada coluna, aplicado aos elementos já criados).
+Com o pacote orjson instalado, ele é usado para codificar e decodificar cada
+elemento.
+"""
+
 import json
-from typing import Tuple, cast
+import math
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from maths.power_flow import PowerFlow
 from models.bus import Bus, BusType
+from models.generator import Generator, GeneratorSC
 from models.line import Line
 from models.transformer import Transformer, TransformerMeta
 from storage.id_utils import norm_bus_id
 
-
-def save_json_file(
-    path: str, buses: list[Bus], lines: list[Line], positions: list[Tuple[float, float]]
+try:
+    import orjson
+except ImportError:  # opcional: só acelera
+    orjson = None
+
+FORMAT = "powersistemsimu"
+VERSION = 2
+LAYOUTS = ("records", "arrays")
+
+_CHUNK = 1 << 20  # caracteres lidos por vez
+_DELIMITERS = frozenset(",:]} \t\r\n")
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _finite(x: float) -> Optional[float]:
+    # infinito não existe em JSON: null (a leitura volta para o padrão do campo)
+    x = float(x)
+    return x if math.isfinite(x) else None
+
+
+def _pair(z: Optional[complex]) -> Optional[List[float]]:
+    return None if z is None else [z.real, z.imag]
+
+
+def _complex(value: Any) -> Optional[complex]:
+    return None if value is None else complex(value[0], value[1])
+
+
+def _float(record: Dict[str, Any], key: str, default: float) -> float:
+    value = record.get(key)
+    return default if value is None else float(value)
+
+
+def _meta_record(meta: TransformerMeta) -> Dict[str, Any]:
+    return {name: getattr(meta, name) for name in TransformerMeta.__dataclass_fields__}
+
+
+def _sc_record(sc: GeneratorSC) -> Dict[str, Any]:
+    return {name: getattr(sc, name) for name in GeneratorSC.__dataclass_fields__}
+
+
+# (chave, valor a partir do elemento): a mesma tabela serve aos dois layouts
+Getter = Callable[[Any], Any]
+
+_BUS_KEYS: List[Tuple[str, Getter]] = [
+    ("id", lambda b: b.id),
+    ("number", lambda b: b.number),
+    ("name", lambda b: b.name),
+    ("type", lambda b: b.type.value),
+    ("v", lambda b: b.v),
+    ("o", lambda b: b.o),
+    ("p_load", lambda b: b.p_load),
+    ("q_load", lambda b: b.q_load),
+    ("p_gen", lambda b: b.p_gen),
+    ("q_gen", lambda b: b.q_gen),
+    ("q_min", lambda b: _finite(b.q_min)),
+    ("q_max", lambda b: _finite(b.q_max)),
+    ("v_rated", lambda b: b.v_rated),
+    ("b_shunt", lambda b: b.b_shunt),
+    ("g_shunt", lambda b: b.g_shunt),
+]
+
+_LINE_KEYS: List[Tuple[str, Getter]] = [
+    ("id", lambda l: l.id),
+    ("name", lambda l: l.name),
+    ("kind", lambda l: "transformer" if isinstance(l, Transformer) else "line"),
+    ("tapBus", lambda l: l.tap_bus_id),
+    ("zBus", lambda l: l.z_bus_id),
+    ("g", lambda l: l.g),
+    ("b", lambda l: l.b),
+    ("bc", lambda l: l.bc),
+    ("tap", lambda l: l.tap),
+    ("phase", lambda l: l.phase),
+    ("z1", lambda l: _pair(l.z1)),
+    ("z2", lambda l: _pair(l.z2)),
+    ("z0", lambda l: _pair(l.z0)),
+    ("bc1", lambda l: l.bc1),
+    ("bc0", lambda l: l.bc0),
+    ("meta", lambda l: _meta_record(l.meta) if isinstance(l, Transformer) else None),
+]
+
+_GENERATOR_KEYS: List[Tuple[str, Getter]] = [
+    ("id", lambda g: g.id),
+    ("name", lambda g: g.name),
+    ("bus", lambda g: g.bus_id),
+    ("p_gen", lambda g: g.p_gen),
+    ("v_set", lambda g: g.v_set),
+    ("q_min", lambda g: _finite(g.q_min)),
+    ("q_max", lambda g: _finite(g.q_max)),
+    ("sc", lambda g: _sc_record(g.sc)),
+]
+
+
+# ----------------------------------------------------------------------
+# gravação
+# ----------------------------------------------------------------------
+def _write_section(
+    file: BinaryIO,
+    name: str,
+    elements: List[Any],
+    keys: List[Tuple[str, Getter]],
+    layout: str,
+    extra: Optional[Tuple[str, List[Any]]] = None,
 ) -> None:
-    buses_json = list[dict[str, object]]()
-    lines_json = list[dict[str, object]]()
-    for index, bus in enumerate(buses):
-        buses_json.append(
-            {
-                "id": bus.id,
-                "name": bus.name,
-                "v": bus.v,
-                "o": bus.o,
-                "p_load": bus.p_load,
-                "q_load": bus.q_load,
-                "p_gen": bus.p_gen,
-                "q_gen": bus.q_gen,
-                "q_min": bus.q_min,
-                "q_max": bus.q_max,
-                "type": bus.type.value,
-                "v_rated": bus.v_rated,
-                "b_shunt": bus.b_shunt,
-                "g_shunt": bus.g_shunt,
-                "position": positions[index],
-            }
-        )
-        payload = {
-            "id": line.id,
-            "name": line.name,
-            "b": line.b,
-            "g": line.g,
-            "bc": line.bc,
-            "tap": line.tap,
-            "tapBus": line.tap_bus_id,
-            "zBus": line.z_bus_id,
-        }
-
-        if isinstance(line, Transformer):
-            payload["kind"] = "transformer"
-            payload["meta"] = {
-                "sn_mva": line.meta.sn_mva,
-                "hv_kv": line.meta.hv_kv,
-                "lv_kv": line.meta.lv_kv,
-                "conn_hv": line.meta.conn_hv,
-                "conn_lv": line.meta.conn_lv,
-                "grounded_hv": line.meta.grounded_hv,
-                "grounded_lv": line.meta.grounded_lv,
-                "xn_hv_pu": line.meta.xn_hv_pu,
-                "xn_lv_pu": line.meta.xn_lv_pu,
-            }
-        else:
-            payload["kind"] = "line"
+    file.write(b'"' + name.encode() + b'":')
+    if layout == "arrays":
+        # uma coluna por vez na memória
+        columns = [(key, lambda get=get: [get(e) for e in elements]) for key, get in keys]
+        if extra:
+            columns.append((extra[0], lambda: extra[1]))
+        file.write(b"{\n")
+        for k, (key, values) in enumerate(columns):
+            file.write(_dumps(key) + b":" + _dumps(values()))
+            file.write(b",\n" if k < len(columns) - 1 else b"\n")
+        file.write(b"}")
+        return
+    file.write(b"[\n")
+    for k, element in enumerate(elements):
+        record = {key: get(element) for key, get in keys}
+        if extra:
+            record[extra[0]] = extra[1][k]
+        file.write(_dumps(record))
+        file.write(b",\n" if k < len(elements) - 1 else b"\n")
+    file.write(b"]")
 
-        lines_json.append(payload)
 
-    with open(path, "w") as f:
-        json.dump({"buses": buses_json, "lines": lines_json}, f, indent=4)
-    pass
+def save_json_file(
+    path: str,
+    buses: List[Bus],
+    lines: List[Line],
+    positions: List[Tuple[float, float]],
+    generators: Iterable[Generator] = (),
+    base_mva: float = 100.0,
+    layout: str = "records",
+) -> None:
+    if layout not in LAYOUTS:
+        raise ValueError(f"Layout JSON inválido: {layout!r} (use {LAYOUTS})")
+    positions = [[float(x), float(y)] for x, y in positions]
+    with open(path, "wb") as file:
+        header = {"format": FORMAT, "version": VERSION, "layout": layout, "base_mva": base_mva}
+        file.write(b"{\n")
+        for key, value in header.items():
+            file.write(_dumps(key) + b":" + _dumps(value) + b",\n")
+        _write_section(file, "buses", list(buses), _BUS_KEYS, layout, ("position", positions))
+        file.write(b",\n")
+        _write_section(file, "lines", list(lines), _LINE_KEYS, layout)
+        file.write(b",\n")
+        _write_section(file, "generators", list(generators), _GENERATOR_KEYS, layout)
+        file.write(b"\n}\n")
+
+
+# ----------------------------------------------------------------------
+# leitura
+# ----------------------------------------------------------------------
+class _JsonStream:
+    """Valores JSON um a um a partir de um arquivo texto, com buffer limitado."""
+
+    def __init__(self, file) -> None:
+        self.__file = file
+        self.__buffer = ""
+        self.__position = 0
+        self.__eof = False
+        self.__decoder = json.JSONDecoder()
+
+    def __fill(self) -> bool:
+        if self.__eof:
+            return False
+        chunk = self.__file.read(_CHUNK)
+        if not chunk:
+            self.__eof = True
+            return False
+        self.__buffer = self.__buffer[self.__position :] + chunk
+        self.__position = 0
+        return True
+
+    def peek(self) -> str:
+        """Próximo caractere que não é espaço ("" no fim do arquivo)."""
+        while True:
+            buffer, position = self.__buffer, self.__position
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            self.__position = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self.__fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "fim do arquivo"
+            raise ValueError(f"JSON inválido: esperado um de {chars!r}, encontrado {found}")
+        self.__position += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        if orjson is not None:
+            # caminho rápido: o valor ocupa o resto da linha (é como o save_json_file grava)
+            end = self.__buffer.find("\n", self.__position)
+            if end >= 0:
+                candidate = self.__buffer[self.__position : end].rstrip().rstrip(",")
+                try:
+                    value = orjson.loads(candidate)
+                except orjson.JSONDecodeError:
+                    pass
+                else:
+                    self.__position += len(candidate)
+                    return value
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+            except json.JSONDecodeError as e:
+                if self.__fill():
+                    continue
+                raise ValueError(f"JSON inválido: {e}") from None
+            # número cortado no fim do buffer ("-3.125" de "-3.125e-5") continua no
+            # próximo bloco: só aceita o valor com um delimitador depois dele
+            if (end == len(self.__buffer) or self.__buffer[end] not in _DELIMITERS) and (
+                self.__fill()
+            ):
+                continue
+            self.__position = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Elementos de um array JSON, um por vez."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.__position += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def values(self) -> Iterator[Any]:
+        """
+        Como items, para arrays com muitos valores na mesma linha (colunas do layout
+        "arrays"): sem o caminho rápido por linha e com o separador testado direto no
+        buffer; espaços e valores cortados no fim do buffer vão pelo caminho geral.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.__position += 1
+            return
+        scan = self.__decoder.scan_once
+        while True:
+            buffer, position = self.__buffer, self.__position
+            if position < len(buffer) and buffer[position] not in " \t\r\n":
+                try:
+                    value, end = scan(buffer, position)
+                except (StopIteration, json.JSONDecodeError):
+                    end = -1
+                if 0 <= end < len(buffer) - 1 and buffer[end] in ",]":
+                    self.__position = end + 1
+                    yield value
+                    if buffer[end] == "]":
+                        return
+                    continue
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def members(self) -> Iterator[str]:
+        """Chaves de um objeto JSON; o valor de cada uma deve ser lido antes da próxima."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.__position += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+
+def _bus_from(record: Dict[str, Any]) -> Bus:
+    bid = norm_bus_id(record.get("id", record.get("number")))
+    try:
+        number = int(bid)
+    except ValueError:
+        number = int(record.get("number", 0))
+    return Bus(
+        id=bid,
+        number=number,
+        name=record.get("name", bid),
+        v=_float(record, "v", 1.0),
+        o=_float(record, "o", 0.0),
+        p_load=_float(record, "p_load", 0.0),
+        q_load=_float(record, "q_load", 0.0),
+        p_gen=_float(record, "p_gen", 0.0),
+        q_gen=_float(record, "q_gen", 0.0),
+        q_min=_float(record, "q_min", float("-inf")),
+        q_max=_float(record, "q_max", float("inf")),
+        v_rated=_float(record, "v_rated", 0.0),
+        b_shunt=_float(record, "b_shunt", 0.0),
+        g_shunt=_float(record, "g_shunt", 0.0),
+        type=BusType(int(record.get("type", 0))),
+    )
 
 
-def read_json_file(path: str) -> Tuple[list[Bus], list[Line], list[Tuple[float, float]]]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def _line_from(record: Dict[str, Any]) -> Line:
+    kind = record.get("kind")
+    tap_id = norm_bus_id(record.get("tapBus"))
+    z_id = norm_bus_id(record.get("zBus"))
+    kwargs = dict(
+        id=record.get("id", ""),
+        b=_float(record, "b", 0.0),
+        g=_float(record, "g", 0.0),
+        bc=_float(record, "bc", 0.0),
+        tap=_float(record, "tap", 1.0),
+        phase=_float(record, "phase", 0.0),
+        tap_bus_id=tap_id,
+        z_bus_id=z_id,
+        z1=_complex(record.get("z1")),
+        z2=_complex(record.get("z2")),
+        z0=_complex(record.get("z0")),
+        bc1=record.get("bc1"),
+        bc0=record.get("bc0"),
+    )
 
-    powerFlow = PowerFlow()
-    positions: list[Tuple[float, float]] = []
+    # heurística didática: se tap != 1 e não vier kind, assume trafo
+    if kind == "transformer" or (kind is None and kwargs["tap"] != 1.0):
+        return Transformer(
+            name=record.get("name", "Transformer"), meta=_meta_from(record.get("meta")), **kwargs
+        )
+    return Line(name=record.get("name", "Line"), **kwargs)
+
+
+def _meta_from(meta: Any) -> TransformerMeta:
+    if not isinstance(meta, dict):
+        meta = {}
+    return TransformerMeta(
+        sn_mva=float(meta.get("sn_mva", 100.0)),
+        hv_kv=float(meta.get("hv_kv", 138.0)),
+        lv_kv=float(meta.get("lv_kv", 13.8)),
+        conn_hv=str(meta.get("conn_hv", "Y")),
+        conn_lv=str(meta.get("conn_lv", "Y")),
+        grounded_hv=bool(meta.get("grounded_hv", False)),
+        grounded_lv=bool(meta.get("grounded_lv", False)),
+        xn_hv_pu=float(meta.get("xn_hv_pu", 0.0)),
+        xn_lv_pu=float(meta.get("xn_lv_pu", 0.0)),
+    )
 
-    # -------------------------
-    # 1) BUSES
-    # -------------------------
-    for busJson in data.get("buses", []):
-        bid = norm_bus_id(busJson.get("id", busJson.get("number")))
 
+def _sc_from(sc: Any) -> GeneratorSC:
+    defaults = GeneratorSC()
+    if not isinstance(sc, dict):
+        return defaults
+    values = {}
+    for name in GeneratorSC.__dataclass_fields__:
+        default = getattr(defaults, name)
+        value = sc.get(name)
         try:
-            number = int(bid)
-        except Exception:
-            number = int(busJson.get("number", 0))
-
-        bus = Bus(
-            id=bid,
-            number=number,
-            name=busJson.get("name", bid),
-
-            v=float(busJson.get("v", 1.0)),
-            o=float(busJson.get("o", 0.0)),
-
-            p_load=float(busJson.get("p_load", 0.0)),
-            q_load=float(busJson.get("q_load", 0.0)),
-
-            p_gen=float(busJson.get("p_gen", 0.0)),
-            q_gen=float(busJson.get("q_gen", 0.0)),
+            values[name] = default if value is None else type(default)(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"JSON inválido: sc.{name} = {value!r}") from None
+    return GeneratorSC(**values)
+
+
+def _generator_from(record: Dict[str, Any]) -> Generator:
+    return Generator(
+        id=record.get("id"),
+        name=record.get("name", "G"),
+        bus_id=norm_bus_id(record.get("bus")),
+        p_gen=_float(record, "p_gen", 0.0),
+        v_set=_float(record, "v_set", 1.0),
+        q_min=_float(record, "q_min", float("-inf")),
+        q_max=_float(record, "q_max", float("inf")),
+        sc=_sc_from(record.get("sc")),
+    )
 
-            q_min=float(busJson.get("q_min", -1e9)),
-            q_max=float(busJson.get("q_max", +1e9)),
 
-            v_rated=float(busJson.get("v_rated", 0.0)),
+# ----------------------------------------------------------------------
+# layout "arrays": elementos criados pela coluna "id" e completados coluna a coluna
+# ----------------------------------------------------------------------
+Setter = Callable[[Any, Any], None]
 
-            b_shunt=float(busJson.get("b_shunt", 0.0)),
-            g_shunt=float(busJson.get("g_shunt", 0.0)),
 
-            type=BusType(int(busJson.get("type", 0))),
-        )
+def _set_float(attr: str, default: float) -> Setter:
+    def set_value(element: Any, value: Any) -> None:
+        setattr(element, attr, default if value is None else float(value))
+
+    return set_value
+
+
+def _set(attr: str, convert: Callable[[Any], Any] = lambda value: value) -> Setter:
+    def set_value(element: Any, value: Any) -> None:
+        if value is not None:
+            setattr(element, attr, convert(value))
+
+    return set_value
+
+
+def _set_bus_number(bus: Bus, value: Any) -> None:
+    # como em _bus_from: id numérico tem precedência sobre "number"
+    try:
+        int(bus.id)
+    except ValueError:
+        bus.number = int(value or 0)
+
+
+def _set_bus_type(bus: Bus, value: Any) -> None:
+    bus.type = BusType(int(value or 0))
+
+
+def _set_line_meta(line: Line, value: Any) -> None:
+    if isinstance(line, Transformer):
+        line.meta = _meta_from(value)
+
+
+_BUS_SETTERS: Dict[str, Setter] = {
+    "number": _set_bus_number,
+    "name": _set("name"),
+    "type": _set_bus_type,
+    "v": _set_float("v", 1.0),
+    "o": _set_float("o", 0.0),
+    "p_load": _set_float("p_load", 0.0),
+    "q_load": _set_float("q_load", 0.0),
+    "p_gen": _set_float("p_gen", 0.0),
+    "q_gen": _set_float("q_gen", 0.0),
+    "q_min": _set_float("q_min", float("-inf")),
+    "q_max": _set_float("q_max", float("inf")),
+    "v_rated": _set_float("v_rated", 0.0),
+    "b_shunt": _set_float("b_shunt", 0.0),
+    "g_shunt": _set_float("g_shunt", 0.0),
+    "position": _set("position"),
+}
+
+_LINE_SETTERS: Dict[str, Setter] = {
+    "name": _set("name"),
+    "tapBus": _set("tap_bus_id", norm_bus_id),
+    "zBus": _set("z_bus_id", norm_bus_id),
+    "g": _set_float("g", 0.0),
+    "b": _set_float("b", 0.0),
+    "bc": _set_float("bc", 0.0),
+    "tap": _set_float("tap", 1.0),
+    "phase": _set_float("phase", 0.0),
+    "z1": _set("z1", _complex),
+    "z2": _set("z2", _complex),
+    "z0": _set("z0", _complex),
+    "bc1": _set("bc1"),
+    "bc0": _set("bc0"),
+    "meta": _set_line_meta,
+}
+
+_GENERATOR_SETTERS: Dict[str, Setter] = {
+    "name": _set("name"),
+    "bus": _set("bus_id", norm_bus_id),
+    "p_gen": _set_float("p_gen", 0.0),
+    "v_set": _set_float("v_set", 1.0),
+    "q_min": _set_float("q_min", float("-inf")),
+    "q_max": _set_float("q_max", float("inf")),
+    "sc": lambda generator, value: setattr(generator, "sc", _sc_from(value)),
+}
+
+
+def _new_bus(element_id: Any) -> Bus:
+    return _bus_from({"id": element_id})
+
+
+def _new_line(element_id: Any) -> Line:
+    return Line(tap_bus_id="", z_bus_id="", id=None if element_id is None else str(element_id))
+
+
+def _new_generator(element_id: Any) -> Generator:
+    return Generator(bus_id="", id=element_id)
+
+
+def _as_transformer(line: Line, name: Optional[str] = None, meta: Any = None) -> Transformer:
+    return Transformer(
+        tap_bus_id=line.tap_bus_id,
+        z_bus_id=line.z_bus_id,
+        b=line.b,
+        g=line.g,
+        bc=line.bc,
+        tap=line.tap,
+        phase=line.phase,
+        name=name or line.name,
+        id=line.id,
+        z1=line.z1,
+        z2=line.z2,
+        z0=line.z0,
+        bc1=line.bc1,
+        bc0=line.bc0,
+        meta=_meta_from(meta),
+    )
+
 
-        # posição
-        pos = busJson.get("position", None)
-        if pos is not None:
-            bus.position = pos
-            try:
-                positions.append((float(pos[0]), float(pos[1])))
-            except Exception:
-                positions.append((0.0, 0.0))
+def _finish_bus(bus: Bus) -> None:
+    # campos derivados que o construtor calcula a partir de v, o e das potências
+    bus.v_sch, bus.o_sch = bus.v, bus.o
+    bus.p_sch, bus.q_sch = bus.p_gen - bus.p_load, bus.q_gen - bus.q_load
+    bus.p, bus.q = bus.p_sch, bus.q_sch
+
+
+_ARRAY_SECTIONS: Dict[str, Tuple[Callable[[Any], Any], Dict[str, Setter]]] = {
+    "buses": (_new_bus, _BUS_SETTERS),
+    "lines": (_new_line, _LINE_SETTERS),
+    "generators": (_new_generator, _GENERATOR_SETTERS),
+}
+
+
+def _read_array_section(stream: "_JsonStream", section: str, project: "JsonProject") -> None:
+    """
+    Seção no layout "arrays". Só a coluna "id" é decodificada inteira (cria os
+    elementos); as demais são lidas valor a valor e aplicadas direto aos elementos.
+    """
+    new, setters = _ARRAY_SECTIONS[section]
+    elements: Optional[List[Any]] = None
+    pending: List[Tuple[str, List[Any]]] = []  # colunas antes de "id" (arquivo editado à mão)
+    metas: Dict[int, Any] = {}  # "meta" de linhas que ainda não viraram trafo (antes de "kind")
+    seen = set()
+
+    def apply(column: str, values: Iterable[Any]) -> None:
+        assert elements is not None
+        setter = setters.get(column)
+        count = 0
+        for k, value in enumerate(values):
+            if k >= len(elements):
+                break
+            element = elements[k]
+            if section == "lines" and column == "kind" and value == "transformer":
+                name = element.name if "name" in seen else "Transformer"
+                element = elements[k] = _as_transformer(element, name, metas.pop(k, None))
+            elif section == "lines" and column == "meta" and not isinstance(element, Transformer):
+                if value is not None:
+                    metas[k] = value
+            elif section == "buses" and column == "position":
+                project.positions.append(_position(value))
+            if setter is not None:
+                setter(element, value)
+            count = k + 1
         else:
-            positions.append((0.0, 0.0))
-
-        powerFlow.add_bus(bus)
-
-    # Conjunto de ids existentes (pra validação rápida)
-    bus_ids = set(powerFlow.buses.keys())
-
-    # -------------------------
-    # 2) LINES / TRANSFORMERS
-    # -------------------------
-    for lineJson in data.get("lines", []):
-        kind = lineJson.get("kind", None)
-
-        tap_id = norm_bus_id(lineJson.get("tapBus"))
-        z_id   = norm_bus_id(lineJson.get("zBus"))
+            if count == len(elements):
+                seen.add(column)
+                return
+        raise ValueError(
+            f"JSON inválido: coluna {section}.{column} não tem {len(elements)} valores"
+        )
 
-        # valida antes de criar objeto
-        if tap_id not in bus_ids or z_id not in bus_ids:
+    for column in stream.members():
+        if elements is not None:
+            apply(column, stream.values())
+            continue
+        values = stream.value()
+        if not isinstance(values, list):
+            raise ValueError(f"JSON inválido: coluna {section}.{column} não é uma lista")
+        if column != "id":
+            pending.append((column, values))
+            continue
+        elements = [new(value) for value in values]
+        for held in pending:
+            apply(*held)
+        pending.clear()
+    if elements is None:  # seção sem "id": ids gerados, como no construtor
+        elements = [new(None) for _ in (pending[0][1] if pending else ())]
+        for held in pending:
+            apply(*held)
+
+    if section == "buses":
+        for bus in elements:
+            _finish_bus(bus)
+        if "position" not in seen:
+            project.positions.extend((0.0, 0.0) for _ in elements)
+    elif section == "lines" and "kind" not in seen:
+        # mesma heurística de _line_from para arquivos sem "kind"
+        elements = [
+            _as_transformer(line, line.name if "name" in seen else "Transformer", metas.get(k))
+            if line.tap != 1.0
+            else line
+            for k, line in enumerate(elements)
+        ]
+    getattr(project, section).extend(elements)
+
+
+def _position(value: Any) -> Tuple[float, float]:
+    try:
+        return (float(value[0]), float(value[1]))
+    except (TypeError, ValueError, IndexError):
+        return (0.0, 0.0)
+
+
+@dataclass
+class JsonProject:
+    buses: List[Bus] = field(default_factory=list)
+    lines: List[Line] = field(default_factory=list)
+    generators: List[Generator] = field(default_factory=list)
+    positions: List[Tuple[float, float]] = field(default_factory=list)
+    base_mva: float = 100.0
+    version: int = 1
+    layout: str = "records"
+
+
+def read_json_project(path: str) -> JsonProject:
+    project = JsonProject()
+    builders = {"buses": _bus_from, "lines": _line_from, "generators": _generator_from}
+
+    def add(section: str, record: Dict[str, Any]) -> None:
+        element = builders[section](record)
+        if section == "buses":
+            position = record.get("position")
+            if position is not None:
+                element.position = position
+            project.positions.append(_position(position))
+        getattr(project, section).append(element)
+
+    with open(path, "r", encoding="utf-8") as file:
+        stream = _JsonStream(file)
+        for key in stream.members():
+            if key not in builders:
+                value = stream.value()
+                if key == "version":
+                    project.version = int(value)
+                    if project.version > VERSION:
+                        raise ValueError(
+                            f"Projeto JSON versão {project.version} é mais novo que o "
+                            f"suportado ({VERSION})"
+                        )
+                elif key == "base_mva" and value is not None:
+                    project.base_mva = float(value)
+                elif key == "layout":
+                    project.layout = str(value)
+                continue
+            if stream.peek() == "[":
+                for record in stream.items():
+                    add(key, record)
+                continue
+            _read_array_section(stream, key, project)
+
+    # conexões e geradores só são validados no fim (as seções podem vir em qualquer ordem)
+    bus_ids = {bus.id for bus in project.buses}
+    for line in project.lines:
+        if line.tap_bus_id not in bus_ids or line.z_bus_id not in bus_ids:
             raise ValueError(
-                f"JSON inválido: conexão {lineJson.get('id','?')} referencia barra inexistente. "
-                f"tapBus={tap_id!r} zBus={z_id!r}. "
+                f"JSON inválido: conexão {line.id or '?'} referencia barra inexistente. "
+                f"tapBus={line.tap_bus_id!r} zBus={line.z_bus_id!r}. "
                 f"(buses carregadas={len(bus_ids)})"
             )
-
-        # heurística didática: se tap != 1 e não vier kind, assume trafo
-        is_trafo = (kind == "transformer") or (kind is None and float(lineJson.get("tap", 1.0)) != 1.0)
-
-        if is_trafo:
-            meta_json = lineJson.get("meta", {})
-            if not isinstance(meta_json, dict):
-                meta_json = {}
-
-            meta = TransformerMeta(
-                sn_mva=float(meta_json.get("sn_mva", 100.0)),
-                hv_kv=float(meta_json.get("hv_kv", 138.0)),
-                lv_kv=float(meta_json.get("lv_kv", 13.8)),
-                conn_hv=str(meta_json.get("conn_hv", "Y")),
-                conn_lv=str(meta_json.get("conn_lv", "Y")),
-                grounded_hv=bool(meta_json.get("grounded_hv", False)),
-                grounded_lv=bool(meta_json.get("grounded_lv", False)),
-                xn_hv_pu=float(meta_json.get("xn_hv_pu", 0.0)),
-                xn_lv_pu=float(meta_json.get("xn_lv_pu", 0.0)),
-            )
-
-            line = Transformer(
-                id=lineJson.get("id", ""),
-                name=lineJson.get("name", "Transformer"),
-                b=float(lineJson.get("b", 0.0)),
-                g=float(lineJson.get("g", 0.0)),
-                bc=float(lineJson.get("bc", 0.0)),
-                tap=float(lineJson.get("tap", 1.0)),
-                tap_bus_id=tap_id,
-                z_bus_id=z_id,
-                meta=meta,
-            )
-        else:
-            line = Line(
-                id=lineJson.get("id", ""),
-                name=lineJson.get("name", "Line"),
-                b=float(lineJson.get("b", 0.0)),
-                g=float(lineJson.get("g", 0.0)),
-                bc=float(lineJson.get("bc", 0.0)),
-                tap=float(lineJson.get("tap", 1.0)),
-                tap_bus_id=tap_id,
-                z_bus_id=z_id,
+    for generator in project.generators:
+        if generator.bus_id not in bus_ids:
+            raise ValueError(
+                f"JSON inválido: gerador {generator.id} referencia barra inexistente "
+                f"{generator.bus_id!r}"
             )
+    return project
 
-        powerFlow.add_connection(line)
-
-    return (
-        list(powerFlow.buses.values()),
-        list(powerFlow.connections.values()),
-        positions,
-    )
 
+def read_json_file(path: str) -> Tuple[List[Bus], List[Line], List[Tuple[float, float]]]:
+    project = read_json_project(path)
+    return project.buses, project.lines, project.positions
@@ -0,0 +1,420 @@
+"""
+Resultados em tabelas colunares (Parquet, Arrow IPC ou CSV), gravadas em blocos.
+
+    with open_table_sink("barras.parquet") as sink:
+        sink.write(bus_result_columns(buses))
+
+Um bloco é um dicionário nome -> array 1-D, todos com o mesmo comprimento; cada
+write acrescenta as linhas ao mesmo arquivo (um row group / record batch por
+bloco), então varreduras e séries no tempo são gravadas à medida que saem, sem
+juntar tudo na memória. Complexos viram pares _mag/_deg: os três formatos só
+guardam colunas reais.
+
+Parquet e Arrow usam o pyarrow se instalado, senão o polars (requirements.txt);
+sem nenhum dos dois, open_table_sink troca para um CSV com o mesmo nome
+(sink.path diz o arquivo de fato gravado).
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from models.bus import Bus
+from models.line import Line
+
+if TYPE_CHECKING:
+    from models.faults import (
+        FaultOutageSweepResult,
+        FaultParametricResult,
+        FaultStudyResult,
+        FaultSweepResult,
+        LineFaultSweepResult,
+    )
+
+Columns = Dict[str, np.ndarray]
+
+_PHASES = ("a", "b", "c")
+
+
+# ------------------------------------------------------------------
+# saídas
+# ------------------------------------------------------------------
+class TableSink(ABC):
+    """Destino das linhas; recebe um bloco de colunas (nome -> array) por vez."""
+
+    path: str = ""
+
+    @abstractmethod
+    def write(self, columns: Columns) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CsvTableSink(TableSink):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._header: Optional[List[str]] = None
+
+    def write(self, columns: Columns) -> None:
+        if self._header is None:
+            self._header = list(columns)
+            self._writer.writerow(self._header)
+        elif list(columns) != self._header:
+            raise ValueError(f"Colunas {list(columns)} diferentes do cabeçalho {self._header}.")
+        self._writer.writerows(zip(*(np.asarray(c).tolist() for c in columns.values())))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# ordem de preferência: o pyarrow escreve cada bloco direto no arquivo
+BACKENDS = ("pyarrow", "polars")
+
+
+def columnar_backend(what: str) -> str:
+    """Primeiro pacote de BACKENDS instalado; RuntimeError se nenhum."""
+    for backend in BACKENDS:
+        try:
+            __import__(backend)
+        except ImportError:
+            continue
+        return backend
+    raise RuntimeError(f"Exportar {what} requer o pacote polars (pip install polars) ou pyarrow.")
+
+
+class _ColumnarSink(TableSink):
+    """
+    Base de Parquet/Arrow: o esquema sai do 1º bloco e vale para os seguintes.
+
+    pyarrow: cada bloco vai direto para o arquivo (row group / record batch).
+    polars (não tem escrita incremental): cada bloco vira um .arrow temporário
+    ao lado do destino e o close junta as partes com scan_ipc + sink_*, em
+    streaming; a memória continua sendo a de um bloco.
+    """
+
+    what = ""
+
+    def __init__(self, path: str, backend: Optional[str] = None) -> None:
+        self.path = path
+        self.backend = backend or columnar_backend(self.what)
+        self._schema = None
+        self._writer = None
+        self._parts: List[str] = []
+        self._parts_dir: Optional[str] = None
+
+    @abstractmethod
+    def _open_pyarrow(self, schema): ...
+
+    @abstractmethod
+    def _sink_polars(self, frame) -> None: ...
+
+    def write(self, columns: Columns) -> None:
+        if self.backend == "pyarrow":
+            import pyarrow as pa
+
+            # blocos seguintes convertidos para o esquema do 1º (bloco vazio, int x float, ...)
+            table = pa.table(columns, schema=self._schema)
+            if self._writer is None:
+                self._schema = table.schema
+                self._writer = self._open_pyarrow(table.schema)
+            self._writer.write_table(table)
+            return
+
+        import polars as pl
+
+        frame = pl.DataFrame(columns, schema=self._schema)
+        if self._parts_dir is None:
+            self._schema = frame.schema
+            folder = os.path.dirname(os.path.abspath(self.path))
+            self._parts_dir = tempfile.mkdtemp(prefix=".partes-", dir=folder)
+        part = os.path.join(self._parts_dir, f"{len(self._parts):06d}.arrow")
+        frame.write_ipc(part)
+        self._parts.append(part)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._parts_dir is not None:
+            import polars as pl
+
+            try:
+                self._sink_polars(pl.concat([pl.scan_ipc(part) for part in self._parts]))
+            finally:
+                shutil.rmtree(self._parts_dir, ignore_errors=True)
+                self._parts_dir = None
+
+
+class ParquetTableSink(_ColumnarSink):
+    """Parquet: um row group por bloco com pyarrow; com polars, row groups do sink_parquet."""
+
+    what = "Parquet"
+
+    def _open_pyarrow(self, schema):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(self.path, schema)
+
+    def _sink_polars(self, frame) -> None:
+        frame.sink_parquet(self.path)
+
+
+class ArrowTableSink(_ColumnarSink):
+    """Arrow IPC (formato de arquivo / Feather v2): um record batch por bloco."""
+
+    what = "Arrow"
+
+    def _open_pyarrow(self, schema):
+        import pyarrow as pa
+
+        return pa.ipc.new_file(self.path, schema)
+
+    def _sink_polars(self, frame) -> None:
+        frame.sink_ipc(self.path)
+
+
+SINKS = {
+    ".csv": CsvTableSink,
+    ".parquet": ParquetTableSink,
+    ".pq": ParquetTableSink,
+    ".arrow": ArrowTableSink,
+    ".feather": ArrowTableSink,
+    ".ipc": ArrowTableSink,
+}
+
+
+def open_table_sink(path: str, fallback: bool = True) -> TableSink:
+    """
+    Sink pela extensão do arquivo (.parquet, .arrow/.feather ou .csv).
+
+    fallback=True: sem pyarrow nem polars, grava CSV no mesmo caminho com extensão .csv.
+    """
+    stem, ext = os.path.splitext(path)
+    sink_type = SINKS.get(ext.lower())
+    if sink_type is None:
+        raise ValueError(f"Formato de tabela não suportado: {ext!r} (use {', '.join(SINKS)}).")
+    try:
+        return sink_type(path)
+    except RuntimeError:
+        if not fallback or sink_type is CsvTableSink:
+            raise
+        return CsvTableSink(stem + ".csv")
+
+
+# ------------------------------------------------------------------
+# colunas dos resultados
+# ------------------------------------------------------------------
+def _polar(columns: Columns, prefix: str, values: np.ndarray) -> None:
+    columns[f"{prefix}_mag"] = np.abs(values)
+    columns[f"{prefix}_deg"] = np.degrees(np.angle(values))
+
+
+def _phases(columns: Columns, prefix: str, values: np.ndarray) -> None:
+    """values (..., 3) em fases a/b/c -> colunas {prefix}a_mag, {prefix}a_deg, ..."""
+    values = values.reshape(-1, 3)
+    for j, ph in enumerate(_PHASES):
+        _polar(columns, f"{prefix}{ph}", values[:, j])
+
+
+def _text(values: Iterable[str]) -> np.ndarray:
+    return np.array(list(values), dtype=object)
+
+
+def bus_result_columns(buses: Iterable[Bus]) -> Columns:
+    """Estado das barras depois do fluxo de potência (potências em MW/Mvar)."""
+    buses = list(buses)
+
+    def floats(attr: str) -> np.ndarray:
+        return np.array([getattr(bus, attr) for bus in buses], dtype=float)
+
+    return {
+        "bus_id": _text(bus.id for bus in buses),
+        "number": np.array([bus.number for bus in buses], dtype=np.int64),
+        "name": _text(bus.name for bus in buses),
+        "type": _text(bus.type.name for bus in buses),
+        "v_pu": floats("v"),
+        "angle_deg": np.degrees(floats("o")),
+        "p_mw": floats("p"),
+        "q_mvar": floats("q"),
+        "p_load_mw": floats("p_load"),
+        "q_load_mvar": floats("q_load"),
+        "p_gen_mw": floats("p_gen"),
+        "q_gen_mvar": floats("q_gen"),
+    }
+
+
+def branch_flow_columns(
+    buses: Iterable[Bus], connections: Iterable[Line], base_mva: float = 100.0
+) -> Columns:
+    """
+    Fluxos nos ramos a partir das tensões das barras (sequência positiva, o mesmo
+    quadripolo pi da Ybus do fluxo): potência saindo de cada ponta para o ramo,
+    perdas e módulo da corrente em pu.
+    """
+    from maths.sequence_branches import BranchPrimitives
+
+    buses = list(buses)
+    bus_index = {bus.id: k for k, bus in enumerate(buses)}
+    v = np.array([bus.v for bus in buses], dtype=float) * np.exp(
+        1j * np.array([bus.o for bus in buses], dtype=float)
+    )
+    branches = BranchPrimitives.from_connections(connections, bus_index)
+    v_f, v_t = v[branches.f], v[branches.t]
+    i_f = branches.yff[:, 1] * v_f + branches.yft[:, 1] * v_t
+    i_t = branches.ytf[:, 1] * v_f + branches.ytt[:, 1] * v_t
+    s_f = v_f * i_f.conj() * base_mva
+    s_t = v_t * i_t.conj() * base_mva
+    return {
+        "branch_id": _text(branches.ids),
+        "from_bus": _text(branches.from_bus),
+        "to_bus": _text(branches.to_bus),
+        "kind": np.where(branches.is_transformer, "transformer", "line").astype(object),
+        "p_from_mw": s_f.real,
+        "q_from_mvar": s_f.imag,
+        "p_to_mw": s_t.real,
+        "q_to_mvar": s_t.imag,
+        "p_loss_mw": (s_f + s_t).real,
+        "q_loss_mvar": (s_f + s_t).imag,
+        "i_from_pu": np.abs(i_f),
+        "i_to_pu": np.abs(i_t),
+    }
+
+
+def fault_study_columns(result: "FaultStudyResult") -> Columns:
+    """Uma falta: tensões de fase pós-falta em todas as barras (uma linha por barra)."""
+    assert result.v_abc is not None
+    spec = result.spec
+    n = len(result.bus_ids)
+    columns: Columns = {
+        "fault_bus": np.full(n, spec.bus_id, dtype=object),
+        "fault_type": np.full(n, spec.fault_type.name, dtype=object),
+        "phase": np.full(n, spec.phase, dtype=object),
+        "bus": _text(result.bus_ids),
+    }
+    _phases(columns, "v", result.v_abc)
+    return columns
+
+
+def fault_sweep_columns(result: "FaultSweepResult") -> Columns:
+    """Varredura de faltas: uma linha por barra x tipo de falta."""
+    blocks = []
+    n = len(result.bus_ids)
+    for fault_type, current in result.fault_current_pu.items():
+        columns: Columns = {
+            "bus": _text(result.bus_ids),
+            "fault_type": np.full(n, fault_type.name, dtype=object),
+            "phase": np.full(n, result.phases.get(fault_type, "A"), dtype=object),
+            "zf_re": np.full(n, complex(result.z_fault_pu).real),
+            "zf_im": np.full(n, complex(result.z_fault_pu).imag),
+        }
+        _polar(columns, "i", current)
+        columns["mva"] = result.mva[fault_type]
+        _phases(columns, "i", result.i_abc[fault_type])
+        blocks.append(columns)
+    return concat_columns(blocks)
+
+
+def line_fault_sweep_columns(result: "LineFaultSweepResult") -> Columns:
+    """Falta ao longo de uma linha: uma linha por posição."""
+    k = len(result.positions)
+    columns: Columns = {
+        "line_id": np.full(k, result.line_id, dtype=object),
+        "fault_type": np.full(k, result.fault_type.name, dtype=object),
+        "phase": np.full(k, result.phase, dtype=object),
+        "position": np.asarray(result.positions, dtype=float),
+    }
+    _polar(columns, "i", result.fault_current_pu)
+    _phases(columns, "i", result.i_abc)
+    return columns
+
+
+def parametric_sweep_columns(result: "FaultParametricResult") -> Columns:
+    """Barras x Zf x condições pré-falta: uma linha por combinação (ordem C dos arrays)."""
+    n, f, p = result.fault_current_pu.shape
+    bus, zf, case = np.unravel_index(np.arange(n * f * p), (n, f, p))
+    z_fault = np.asarray(result.z_fault_pu, dtype=complex)[zf]
+    columns: Columns = {
+        "bus": _text(result.bus_ids)[bus],
+        "fault_type": np.full(n * f * p, result.fault_type.name, dtype=object),
+        "phase": np.full(n * f * p, result.phase, dtype=object),
+        "zf_re": z_fault.real,
+        "zf_im": z_fault.imag,
+        "pre_fault": case.astype(np.int64),
+    }
+    _polar(columns, "v_pre", np.asarray(result.pre_fault_voltages)[bus, case])
+    _polar(columns, "i", result.fault_current_pu.reshape(-1))
+    columns["mva"] = result.mva.reshape(-1)
+    _phases(columns, "i", result.i_abc)
+    return columns
+
+
+def outage_sweep_columns(result: "FaultOutageSweepResult") -> Columns:
+    """
+    Tabela de contingências: uma linha por contingência x barra em falta.
+
+    outage: ids dos ramos retirados, separados por "+" ("" = caso base).
+    """
+    o, n = result.fault_current_pu.shape
+    case = np.repeat(np.arange(o), n)
+    columns: Columns = {
+        "case": case.astype(np.int64),
+        "outage": _text("+".join(outage) for outage in result.outages)[case],
+        "islanded": np.asarray(result.islanded, dtype=bool)[case],
+        "bus": np.tile(_text(result.bus_ids), o),
+        "fault_type": np.full(o * n, result.fault_type.name, dtype=object),
+        "phase": np.full(o * n, result.phase, dtype=object),
+    }
+    _polar(columns, "i", result.fault_current_pu.reshape(-1))
+    columns["mva"] = result.mva.reshape(-1)
+    _phases(columns, "i", result.i_abc)
+    return columns
+
+
+def concat_columns(blocks: Iterable[Columns]) -> Columns:
+    """Junta blocos com as mesmas colunas (na ordem do primeiro)."""
+    blocks = list(blocks)
+    if not blocks:
+        return {}
+    return {name: np.concatenate([block[name] for block in blocks]) for name in blocks[0]}
+
+
+def write_table(path: str, columns: Columns, fallback: bool = True) -> str:
+    """Grava um bloco só; retorna o caminho gravado (pode ter virado .csv)."""
+    with open_table_sink(path, fallback) as sink:
+        sink.write(columns)
+    return sink.path
+
+
+def save_power_flow_results(
+    path: str,
+    buses: Iterable[Bus],
+    connections: Iterable[Line],
+    base_mva: float = 100.0,
+    fallback: bool = True,
+) -> List[str]:
+    """
+    Barras e ramos do último fluxo em duas tabelas ao lado de path:
+    <nome>_buses.<ext> e <nome>_branches.<ext>. Retorna os caminhos gravados.
+    """
+    buses = list(buses)
+    stem, ext = os.path.splitext(path)
+    return [
+        write_table(f"{stem}_buses{ext}", bus_result_columns(buses), fallback),
+        write_table(
+            f"{stem}_branches{ext}", branch_flow_columns(buses, connections, base_mva), fallback
+        ),
+    ]
@@ -0,0 +1,463 @@
+"""
+Snapshot binário do projeto (.npz sem compressão), para reabrir redes grandes sem reparsear texto.
+
+    save_snapshot("rede.npz", buses, lines, positions, generators, base_mva=100.0, solved=True)
+    snap = load_snapshot("rede.npz")          # só lê o cabeçalho; os arrays são memmap
+    snap.buses["v"], snap.branches["g"]        # colunas numpy, direto do disco
+    Y = snap.ybus()                            # Ybus esparsa (CSC) gravada
+    buses, lines, generators, positions = snap.elements()
+
+Conteúdo (cada item é um .npy dentro do zip):
+    header      JSON: formato, versão, base, hash do conteúdo, arquivo de origem
+    buses       uma linha por barra (tensão/ângulo = estado resolvido se header["solved"])
+    branches    uma linha por Line/Transformer; tap_bus/z_bus são posições em buses
+    generators  uma linha por Generator; bus é posição em buses
+    positions   (n, 2) posições das barras no diagrama
+    ybus_*      Ybus de sequência positiva em CSC (data, indices, indptr)
+    ybus_perm   ordenação da fatoração (opcional): Y[p][:, p] fatora sem reordenar
+
+O .npz é gravado sem compressão, então cada membro está contíguo no arquivo:
+load_snapshot mapeia os membros com np.memmap a partir do deslocamento no zip
+(np.load(..., mmap_mode="r") ignora o mmap para .npz). O arquivo continua
+legível com np.load comum.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.bus import Bus, BusType
+from models.generator import Generator, GeneratorSC
+from models.line import Line
+from models.transformer import Transformer, TransformerMeta
+
+FORMAT = "powersistemsimu-snapshot"
+VERSION = 1
+
+# arrays que entram no hash do conteúdo (a rede); posições e Ybus ficam de fora
+_HASHED = ("buses", "branches", "generators")
+
+LINE, TRANSFORMER = 0, 1
+
+_BUS_FIELDS = [
+    ("number", "i8"),
+    ("type", "i1"),
+    ("v", "f8"),
+    ("o", "f8"),
+    ("p_load", "f8"),
+    ("q_load", "f8"),
+    ("p_gen", "f8"),
+    ("q_gen", "f8"),
+    ("q_min", "f8"),
+    ("q_max", "f8"),
+    ("v_rated", "f8"),
+    ("g_shunt", "f8"),
+    ("b_shunt", "f8"),
+]
+
+# z1/z2/z0 e bc1/bc0 ausentes (None) ficam como NaN
+_BRANCH_FIELDS = [
+    ("kind", "i1"),
+    ("tap_bus", "i8"),
+    ("z_bus", "i8"),
+    ("g", "f8"),
+    ("b", "f8"),
+    ("bc", "f8"),
+    ("tap", "f8"),
+    ("phase", "f8"),
+    ("z1", "c16"),
+    ("z2", "c16"),
+    ("z0", "c16"),
+    ("bc1", "f8"),
+    ("bc0", "f8"),
+    ("sn_mva", "f8"),
+    ("hv_kv", "f8"),
+    ("lv_kv", "f8"),
+    ("conn_hv", "U2"),
+    ("conn_lv", "U2"),
+    ("grounded_hv", "?"),
+    ("grounded_lv", "?"),
+    ("xn_hv_pu", "f8"),
+    ("xn_lv_pu", "f8"),
+]
+
+_GENERATOR_FIELDS = [
+    ("bus", "i8"),
+    ("p_gen", "f8"),
+    ("v_set", "f8"),
+    ("q_min", "f8"),
+    ("q_max", "f8"),
+    ("x1_pu", "f8"),
+    ("x2_pu", "f8"),
+    ("x0_pu", "f8"),
+    ("grounded", "?"),
+    ("xn_pu", "f8"),
+]
+
+
+def _text_fields(ids: List[str], names: List[str]) -> List[Tuple[str, str]]:
+    width = lambda values: f"U{max([len(v) for v in values] + [1])}"  # noqa: E731
+    return [("id", width(ids)), ("name", width(names))]
+
+
+def _or_nan(value: Optional[complex]) -> complex:
+    return float("nan") if value is None else value
+
+
+def _or_none(value: complex) -> Optional[complex]:
+    return None if np.isnan(value) else value
+
+
+# ----------------------------------------------------------------------
+# objetos -> arrays
+# ----------------------------------------------------------------------
+def compile_network(
+    buses: Sequence[Bus],
+    lines: Iterable[Line] = (),
+    generators: Iterable[Generator] = (),
+) -> Dict[str, np.ndarray]:
+    """Arrays buses/branches/generators (os mesmos gravados no snapshot)."""
+    bus_index = {bus.id: k for k, bus in enumerate(buses)}
+
+    out = np.empty(
+        len(buses),
+        dtype=_text_fields([b.id for b in buses], [b.name for b in buses]) + _BUS_FIELDS,
+    )
+    out["id"] = [b.id for b in buses]
+    out["name"] = [b.name for b in buses]
+    out["type"] = [b.type.value for b in buses]
+    for name, _ in _BUS_FIELDS:
+        if name != "type":
+            out[name] = [getattr(b, name) for b in buses]
+    arrays = {"buses": out}
+
+    lines = list(lines)
+    out = np.zeros(
+        len(lines),
+        dtype=_text_fields([l.id for l in lines], [l.name for l in lines]) + _BRANCH_FIELDS,
+    )
+    out["id"] = [l.id for l in lines]
+    out["name"] = [l.name for l in lines]
+    try:
+        out["tap_bus"] = [bus_index[l.tap_bus_id] for l in lines]
+        out["z_bus"] = [bus_index[l.z_bus_id] for l in lines]
+    except KeyError as e:
+        raise ValueError(f"Snapshot: conexão referencia barra inexistente {e}") from None
+    for name in ("g", "b", "bc", "tap", "phase"):
+        out[name] = [getattr(l, name) for l in lines]
+    for name in ("z1", "z2", "z0", "bc1", "bc0"):
+        out[name] = [_or_nan(getattr(l, name)) for l in lines]
+    is_transformer = [isinstance(l, Transformer) for l in lines]
+    out["kind"] = np.where(is_transformer, TRANSFORMER, LINE)
+    for k in np.flatnonzero(is_transformer).tolist():
+        meta = lines[k].meta
+        for name in TransformerMeta.__dataclass_fields__:
+            out[name][k] = getattr(meta, name)
+    arrays["branches"] = out
+
+    generators = [g for g in generators if g.bus_id in bus_index]
+    out = np.empty(
+        len(generators),
+        dtype=_text_fields([g.id for g in generators], [g.name for g in generators])
+        + _GENERATOR_FIELDS,
+    )
+    out["id"] = [g.id for g in generators]
+    out["name"] = [g.name for g in generators]
+    out["bus"] = [bus_index[g.bus_id] for g in generators]
+    for name in ("p_gen", "v_set", "q_min", "q_max"):
+        out[name] = [getattr(g, name) for g in generators]
+    for name in GeneratorSC.__dataclass_fields__:
+        out[name] = [getattr(g.sc, name) for g in generators]
+    arrays["generators"] = out
+    return arrays
+
+
+def content_hash(arrays: Dict[str, np.ndarray], base_mva: float) -> str:
+    """sha256 da rede (buses, branches, generators e base); independe de posições e Ybus."""
+    digest = hashlib.sha256(repr(float(base_mva)).encode())
+    for name in _HASHED:
+        array = np.ascontiguousarray(arrays[name])
+        digest.update(f"{name}:{array.dtype.descr}:{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _ybus_arrays(
+    buses: Sequence[Bus], lines: List[Line], ordering: bool
+) -> Dict[str, np.ndarray]:
+    """Ybus de sequência positiva (CSC), a mesma do PowerFlow, e a ordenação da LU."""
+    from maths.sequence_branches import BranchPrimitives, sequence_ybus
+
+    n = len(buses)
+    branches = BranchPrimitives.from_connections(lines, {b.id: k for k, b in enumerate(buses)})
+    shunt = np.array([complex(b.g_shunt, b.b_shunt) for b in buses], dtype=complex)
+    Y = sequence_ybus(branches, np.repeat(shunt[:, None], 3, axis=1))[1]
+    Y.sort_indices()
+    out = {"ybus_data": Y.data, "ybus_indices": Y.indices, "ybus_indptr": Y.indptr}
+
+    if ordering and n:
+        from scipy.sparse.linalg import splu
+
+        try:
+            lu = splu(
+                Y,
+                permc_spec="MMD_AT_PLUS_A",
+                diag_pivot_thresh=0.0,
+                options=dict(SymmetricMode=True),
+            )
+            out["ybus_perm"] = lu.perm_c.astype(np.int64)
+        except RuntimeError:
+            pass  # Ybus singular (ilha sem referência): sem ordenação gravada
+    return out
+
+
+def save_snapshot(
+    path: str,
+    buses: Sequence[Bus],
+    lines: Iterable[Line],
+    positions: Sequence[Tuple[float, float]],
+    generators: Iterable[Generator] = (),
+    base_mva: float = 100.0,
+    solved: bool = False,
+    source_path: Optional[str] = None,
+    ordering: bool = True,
+) -> str:
+    """Grava o snapshot e devolve o hash do conteúdo."""
+    buses, lines = list(buses), list(lines)
+    arrays = compile_network(buses, lines, generators)
+    digest = content_hash(arrays, base_mva)
+    arrays["positions"] = np.asarray(positions, dtype=np.float64).reshape(len(buses), 2)
+    arrays.update(_ybus_arrays(buses, lines, ordering))
+    header = {
+        "format": FORMAT,
+        "version": VERSION,
+        "base_mva": float(base_mva),
+        "solved": bool(solved),
+        "content_hash": digest,
+        "source_hash": file_hash(source_path) if source_path else None,
+    }
+    arrays["header"] = np.array(json.dumps(header))
+    with open(path, "wb") as file:
+        np.savez(file, **arrays)
+    return digest
+
+
+# ----------------------------------------------------------------------
+# leitura
+# ----------------------------------------------------------------------
+def _mapped_members(path: str) -> Dict[str, np.ndarray]:
+    """Cada .npy guardado (sem compressão) no zip como np.memmap somente leitura."""
+    members: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                members[name] = np.load(archive.open(info))
+                continue
+            # cabeçalho local do zip: 30 bytes + nome + extra (tamanhos nos bytes 26..30)
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", file.read(4))
+            file.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(file)
+            if dtype.hasobject:
+                raise ValueError(f"Snapshot: membro {name} com objetos Python")
+            if int(np.prod(shape)) == 0 or dtype.itemsize == 0:
+                members[name] = np.empty(shape, dtype=dtype)
+                continue
+            members[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=file.tell(),
+                shape=shape,
+                order="F" if fortran else "C",
+            )
+    return members
+
+
+class _PermutedLU:
+    """LU de Y[p][:, p] (fatorada na ordem natural); solve devolve x na ordem original."""
+
+    def __init__(self, lu, perm: np.ndarray) -> None:
+        self._lu = lu
+        self._perm = perm
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        x = np.empty(b.shape, dtype=complex)
+        x[self._perm] = self._lu.solve(np.asarray(b)[self._perm])
+        return x
+
+
+@dataclass
+class Snapshot:
+    path: str
+    header: dict
+    arrays: Dict[str, np.ndarray]
+
+    @property
+    def base_mva(self) -> float:
+        return self.header["base_mva"]
+
+    @property
+    def solved(self) -> bool:
+        return self.header["solved"]
+
+    @property
+    def content_hash(self) -> str:
+        return self.header["content_hash"]
+
+    @property
+    def buses(self) -> np.ndarray:
+        return self.arrays["buses"]
+
+    @property
+    def branches(self) -> np.ndarray:
+        return self.arrays["branches"]
+
+    @property
+    def generators(self) -> np.ndarray:
+        return self.arrays["generators"]
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self.arrays["positions"]
+
+    @property
+    def ybus_perm(self) -> Optional[np.ndarray]:
+        return self.arrays.get("ybus_perm")
+
+    def voltages(self) -> np.ndarray:
+        """V = |V|·e^{jθ} por barra (a solução do fluxo, se header["solved"])."""
+        return self.buses["v"] * np.exp(1j * self.buses["o"])
+
+    def ybus(self):
+        from scipy.sparse import csc_matrix
+
+        n = len(self.buses)
+        return csc_matrix(
+            (self.arrays["ybus_data"], self.arrays["ybus_indices"], self.arrays["ybus_indptr"]),
+            shape=(n, n),
+        )
+
+    def ybus_factorization(self):
+        """LU da Ybus com a ordenação gravada (sem recalcular); objeto com .solve(b)."""
+        from scipy.sparse.linalg import splu
+
+        Y = self.ybus()
+        perm = self.ybus_perm
+        if perm is None:
+            return splu(Y)
+        perm = np.asarray(perm)
+        lu = splu(Y[perm][:, perm].tocsc(), permc_spec="NATURAL", diag_pivot_thresh=0.0)
+        return _PermutedLU(lu, perm)
+
+    def verify(self) -> None:
+        """Recalcula o hash do conteúdo (lê os arrays inteiros); ValueError se não bater."""
+        if content_hash(self.arrays, self.base_mva) != self.content_hash:
+            raise ValueError(f"Snapshot corrompido: hash do conteúdo não confere ({self.path})")
+
+    def matches(
+        self,
+        buses: Sequence[Bus],
+        lines: Iterable[Line] = (),
+        generators: Iterable[Generator] = (),
+        base_mva: float = 100.0,
+    ) -> bool:
+        """A rede em memória é a do snapshot? (False: a solução/Ybus gravadas estão velhas)"""
+        arrays = compile_network(buses, lines, generators)
+        return content_hash(arrays, base_mva) == self.content_hash
+
+    def is_current(self, source_path: str) -> bool:
+        """O snapshot foi gerado a partir deste arquivo, no estado atual dele?"""
+        source = self.header.get("source_hash")
+        if source is None or not os.path.exists(source_path):
+            return False
+        return file_hash(source_path) == source
+
+    def elements(self) -> Tuple[List[Bus], List[Line], List[Generator], List[Tuple[float, float]]]:
+        """Objetos do modelo (para a interface), na ordem gravada."""
+        b = self.buses
+        columns = {name: b[name].tolist() for name in b.dtype.names}
+        bus_ids = columns["id"]
+        buses = [
+            Bus(
+                id=bus_ids[k],
+                number=columns["number"][k],
+                name=columns["name"][k],
+                type=BusType(columns["type"][k]),
+                **{name: columns[name][k] for name, _ in _BUS_FIELDS[2:]},
+            )
+            for k in range(len(b))
+        ]
+
+        br = self.branches
+        columns = {name: br[name].tolist() for name in br.dtype.names}
+        meta_names = list(TransformerMeta.__dataclass_fields__)
+        lines: List[Line] = []
+        for k in range(len(br)):
+            kwargs = dict(
+                id=columns["id"][k],
+                name=columns["name"][k],
+                tap_bus_id=bus_ids[columns["tap_bus"][k]],
+                z_bus_id=bus_ids[columns["z_bus"][k]],
+                **{name: columns[name][k] for name in ("g", "b", "bc", "tap", "phase")},
+                **{name: _or_none(columns[name][k]) for name in ("z1", "z2", "z0", "bc1", "bc0")},
+            )
+            if columns["kind"][k] == TRANSFORMER:
+                meta = TransformerMeta(**{name: columns[name][k] for name in meta_names})
+                lines.append(Transformer(meta=meta, **kwargs))
+            else:
+                lines.append(Line(**kwargs))
+
+        g = self.generators
+        columns = {name: g[name].tolist() for name in g.dtype.names}
+        sc_names = list(GeneratorSC.__dataclass_fields__)
+        generators = [
+            Generator(
+                id=columns["id"][k],
+                name=columns["name"][k],
+                bus_id=bus_ids[columns["bus"][k]],
+                **{name: columns[name][k] for name in ("p_gen", "v_set", "q_min", "q_max")},
+                sc=GeneratorSC(**{name: columns[name][k] for name in sc_names}),
+            )
+            for k in range(len(g))
+        ]
+        positions = [tuple(p) for p in self.positions.tolist()]
+        return buses, lines, generators, positions
+
+
+def load_snapshot(path: str, mmap: bool = True) -> Snapshot:
+    """Abre o snapshot; ValueError se não for um snapshot ou se a versão for mais nova."""
+    if mmap:
+        arrays = _mapped_members(path)
+    else:
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+    if "header" not in arrays:
+        raise ValueError(f"Arquivo não é um snapshot: {path}")
+    header = json.loads(str(arrays.pop("header")[()]))
+    if header.get("format") != FORMAT:
+        raise ValueError(f"Arquivo não é um snapshot: {path}")
+    if header.get("version", 0) > VERSION:
+        raise ValueError(
+            f"Snapshot versão {header['version']} é mais novo que o suportado ({VERSION})"
+        )
+    return Snapshot(path=path, header=header, arrays=arrays)
@@ -1,10 +1,15 @@
-from typing import Tuple
+from typing import TYPE_CHECKING, Iterable, Tuple
 
 from maths.power_flow import PowerFlow
 from models.bus import Bus
+from models.generator import Generator
 from models.line import Line
 from storage.read_tables_ieee import read_power_flow_from_ieee
-from storage.read_write_json import read_json_file, save_json_file
+from storage.read_write_json import JsonProject, read_json_file, read_json_project, save_json_file
+
+if TYPE_CHECKING:
+    from storage.psse_raw import PsseRawImport
+    from storage.snapshot import Snapshot
 
 
 class StorageFacade:
@@ -13,15 +18,74 @@ class StorageFacade:
     def read_ieee_file(path: str) -> PowerFlow:
         return read_power_flow_from_ieee(path)
 
+    @staticmethod
+    def read_matpower_file(path: str) -> PowerFlow:
+        from storage.matpower import power_flow_from_matpower, read_matpower
+
+        return power_flow_from_matpower(read_matpower(path))
+
+    @staticmethod
+    def save_matpower_file(
+        path: str,
+        buses: list[Bus],
+        lines: list[Line],
+        base_mva: float = 100.0,
+    ) -> None:
+        from storage.matpower import case_from_elements, write_matpower
+
+        write_matpower(path, case_from_elements(buses, lines, base_mva))
+
+    @staticmethod
+    def read_psse_file(path: str) -> "PsseRawImport":
+        from storage.psse_raw import read_psse_raw
+
+        return read_psse_raw(path)
+
+    @staticmethod
+    def read_snapshot_file(path: str) -> "Snapshot":
+        from storage.snapshot import load_snapshot
+
+        return load_snapshot(path)
+
+    @staticmethod
+    def save_snapshot_file(
+        path: str,
+        buses: list[Bus],
+        lines: list[Line],
+        positions: list[Tuple[float, float]],
+        generators: Iterable[Generator] = (),
+        base_mva: float = 100.0,
+    ) -> None:
+        from storage.snapshot import save_snapshot
+
+        save_snapshot(path, buses, lines, positions, generators, base_mva)
+
+    @staticmethod
+    def save_results_files(
+        path: str,
+        buses: list[Bus],
+        lines: list[Line],
+        base_mva: float = 100.0,
+    ) -> list[str]:
+        from storage.results_export import save_power_flow_results
+
+        return save_power_flow_results(path, buses, lines, base_mva)
+
     @staticmethod
     def read_json_file(path: str) -> Tuple[list[Bus], list[Line], list[Tuple[float, float]]]:
         return read_json_file(path)
 
+    @staticmethod
+    def read_json_project(path: str) -> JsonProject:
+        return read_json_project(path)
+
     @staticmethod
     def save_json_file(
         path: str,
         buses: list[Bus],
         lines: list[Line],
         positions: list[Tuple[float, float]],
+        generators: Iterable[Generator] = (),
+        base_mva: float = 100.0,
     ) -> None:
-        return save_json_file(path, buses, lines, positions)
+        return save_json_file(path, buses, lines, positions, generators, base_mva)
@@ -1,30 +1,49 @@
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 from PySide6.QtWidgets import (
     QGraphicsView,
     QGraphicsScene,
 )
-from PySide6.QtGui import QPainter, QMouseEvent, QContextMenuEvent
+from PySide6.QtGui import QBrush, QPainter, QPixmap, QMouseEvent, QContextMenuEvent
 from PySide6.QtCore import QRectF, Qt, QPoint
 
 from controllers.simulator_controller import ElementEvent, SimulatorController
 from models.bus import Bus
 from models.line import Line
-from models.network_element import NetworkElement
+from models.network_element import ChangeSet, NetworkElement
+from models.transformer import Transformer
 from storage.storage import StorageFacade
 from view.bus_widget import BusWidget
-from view.link_line_item import LinkLineItem
+from view.link_line_item import LinkLineItem, TransformerLineItem
 from view.line_table import LineTable
 from PySide6.QtWidgets import QFileDialog, QMenu
 import traceback
 from PySide6.QtWidgets import QMessageBox
 
+if TYPE_CHECKING:
+    from storage.psse_raw import PsseRawImport
+
+# Nível de detalhe (escala da view): abaixo destes valores some o texto / a grade
+LABELS_MIN_SCALE = 0.5
+GRID_MIN_SCALE = 0.4
+GRID_SIZE = 20
+
+
 class BoardView(QGraphicsView):
     def __init__(self):
         super().__init__()
-        self.setScene(QGraphicsScene(self))
+        scene = QGraphicsScene(self)
+        # BSP: a cena é quase estática (só as barras arrastadas mudam de lugar)
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.setScene(scene)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setBackgroundBrush(Qt.GlobalColor.white)
 
+        # Grade desenhada uma vez num ladrilho; o fundo fica em cache durante o pan
+        self.__grid_brush = BoardView.__make_grid_brush()
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self._detail_visible = True
+        self._grid_visible = True
+
         # Permite o QGraphicsView receber teclado (Del/Backspace)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
@@ -50,90 +69,189 @@ class BoardView(QGraphicsView):
         # self.setSceneRect(0, 0, 600, 400)
         self.simulator_widgets = dict[str, object]()
         simulatorInstance = SimulatorController.instance()
-        simulatorInstance.listen(self.circuitListener)
+        simulatorInstance.listen(
+            self.circuitListener,
+            events=(ElementEvent.CREATED, ElementEvent.DELETED),
+            on_batch=self.apply_changes,
+        )
 
-    def drawBackground(self, painter: QPainter, rect: QRectF):
+    @staticmethod
+    def __make_grid_brush() -> QBrush:
+        tile = QPixmap(GRID_SIZE, GRID_SIZE)
+        tile.fill(Qt.GlobalColor.white)
+        painter = QPainter(tile)
         painter.setPen(Qt.GlobalColor.lightGray)
-        super().drawBackground(painter, rect)
+        painter.drawLine(0, 0, GRID_SIZE - 1, 0)
+        painter.drawLine(0, 0, 0, GRID_SIZE - 1)
+        painter.end()
+        return QBrush(tile)
 
-        # Define grid spacing
-        gridSize = 20
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        # O pincel com textura é repetido pelo Qt (origem em (0, 0) da cena),
+        # em vez de uma drawLine por linha da grade a cada quadro.
+        if self._grid_visible:
+            painter.fillRect(rect, self.__grid_brush)
+        else:
+            painter.fillRect(rect, Qt.GlobalColor.white)
 
-        # Get the visible area of the scene
-        left = int(rect.left()) - (int(rect.left()) % gridSize)
-        top = int(rect.top()) - (int(rect.top()) % gridSize)
+    def update_level_of_detail(self) -> None:
+        """Liga/desliga textos, grade e antialiasing conforme a escala atual da view."""
+        scale = self.transform().m11()
 
-        # Draw vertical lines
-        for x in range(left, int(rect.right()), gridSize):
-            painter.drawLine(x, rect.top(), x, rect.bottom())
+        grid_visible = scale >= GRID_MIN_SCALE
+        if grid_visible != self._grid_visible:
+            self._grid_visible = grid_visible
+            self.resetCachedContent()
 
-        # Draw horizontal lines
-        for y in range(top, int(rect.bottom()), gridSize):
-            painter.drawLine(rect.left(), y, rect.right(), y)
+        detail_visible = scale >= LABELS_MIN_SCALE
+        if detail_visible != self._detail_visible:
+            self._detail_visible = detail_visible
+            # muitas linhas finas: sem antialiasing o quadro afastado sai bem mais barato
+            self.setRenderHint(QPainter.RenderHint.Antialiasing, detail_visible)
+            for widget in self.simulator_widgets.values():
+                widget.set_detail_visible(detail_visible)
 
     # Listens to the simulator events and updates the board
     def circuitListener(self, element: NetworkElement, event: ElementEvent):
         # Adds node component to the board
         if event is ElementEvent.CREATED and isinstance(element, Bus):
-            widget = BusWidget(50, 50, element)
-            self.scene().addItem(widget)
-            self.simulator_widgets[element.id] = widget
+            self.__add_bus_widget(element)
             return
 
         # Adds line between two components in the board
         # TODO bug: somethimes not creating wire or TL when there is a block selected
         if event is ElementEvent.CREATED and isinstance(element, Line):
-            sourceWidget = self.simulator_widgets[element.tap_bus_id].link
-            targetWidget = self.simulator_widgets[element.z_bus_id].link
-            line = LinkLineItem(sourceWidget, targetWidget, element)
-            self.scene().addItem(line)
-            self.simulator_widgets[element.id] = line
+            self.__add_line_item(element)
             return
 
         if event is ElementEvent.DELETED:
-            widget = self.simulator_widgets[element.id]
-            self.scene().removeItem(widget)
-            del self.simulator_widgets[element.id]
+            self.__remove_widget(element.id)
             return
 
+    def apply_changes(self, changes: ChangeSet) -> None:
+        """Aplica um lote do controller (importação, limpar projeto) em uma só passada."""
+        scene = self.scene()
+        index_method = scene.itemIndexMethod()
+        # sem índice durante a inserção em massa; o índice é reconstruído uma vez no fim
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.setUpdatesEnabled(False)
+        try:
+            for element_id in changes.deleted:
+                self.__remove_widget(element_id)
+            # barras antes das linhas: LinkLineItem precisa dos BusWidget das pontas
+            for element in changes.created.values():
+                if isinstance(element, Bus):
+                    self.__add_bus_widget(element)
+            for element in changes.created.values():
+                if isinstance(element, Line):
+                    self.__add_line_item(element)
+        finally:
+            scene.setItemIndexMethod(index_method)
+            self.setUpdatesEnabled(True)
+
+    def __add_bus_widget(self, bus: Bus) -> None:
+        widget = BusWidget(50, 50, bus)
+        widget.set_detail_visible(self._detail_visible)
+        self.scene().addItem(widget)
+        self.simulator_widgets[bus.id] = widget
+
+    def __add_line_item(self, line: Line) -> None:
+        sourceWidget = self.simulator_widgets[line.tap_bus_id].link
+        targetWidget = self.simulator_widgets[line.z_bus_id].link
+        item_type = TransformerLineItem if isinstance(line, Transformer) else LinkLineItem
+        item = item_type(sourceWidget, targetWidget, line)
+        item.set_detail_visible(self._detail_visible)
+        self.scene().addItem(item)
+        self.simulator_widgets[line.id] = item
+
+    def __remove_widget(self, element_id: str) -> None:
+        # geradores não têm widget próprio na board
+        widget = self.simulator_widgets.pop(element_id, None)
+        if widget is not None:
+            self.scene().removeItem(widget)
+
     def import_ieee(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import IEEE File", "", "IEEE Files (*.txt);;All Files (*)"
+            self,
+            "Import IEEE File",
+            "",
+            "IEEE Files (*.txt);;MATPOWER Files (*.m);;PSS/E RAW Files (*.raw);;All Files (*)",
         )
         if not file_path:
             return
-        SimulatorController.instance().clear_state()
+        raw = None
 
         try:
-            power_flow = StorageFacade.read_ieee_file(file_path)
-            for bus in power_flow.buses.values():
-                SimulatorController.instance().addBus(bus)
-            for line in power_flow.connections.values():
-                SimulatorController.instance().addConnection(line)
-
+            raw = self.load_network_file(file_path)
         except Exception as e:
             traceback.print_exc()
             QMessageBox.critical(self, "Erro ao importar JSON", f"{type(e).__name__}: {e}")
             print(f"Error importing JSON file: {e}")
-        pass
+
+        if raw is not None and raw.warnings:
+            # registros fora do modelo não impedem a importação, mas o usuário precisa saber
+            shown = "\n".join(raw.warnings[:20])
+            more = len(raw.warnings) - 20
+            if more > 0:
+                shown += f"\n... e mais {more}"
+            QMessageBox.warning(self, "Importação PSS/E", shown)
 
         SimulatorController.instance().sync_bus_number_pool()
 
 
+    def load_network_file(self, file_path: str) -> "PsseRawImport | None":
+        """
+        Troca a rede do controller pela do arquivo (.raw, .m ou CDF). Devolve a importação
+        PSS/E (com os avisos) ou None.
+        """
+        ctrl = SimulatorController.instance()
+        raw = None
+        # limpar + importar num lote só: a board e as tabelas atualizam uma vez
+        with ctrl.batch():
+            ctrl.clear_state()
+            if file_path.lower().endswith(".raw"):
+                raw = StorageFacade.read_psse_file(file_path)
+                ctrl.power_base_mva = raw.base_mva
+                ctrl.add_many(buses=raw.buses, lines=raw.lines, generators=raw.generators)
+            else:
+                if file_path.lower().endswith(".m"):
+                    power_flow = StorageFacade.read_matpower_file(file_path)
+                else:
+                    power_flow = StorageFacade.read_ieee_file(file_path)
+                # shunts já em pu na base do arquivo (baseMVA / cartão de título)
+                ctrl.power_base_mva = power_flow.base
+                ctrl.add_many(
+                    buses=power_flow.buses.values(),
+                    lines=power_flow.connections.values(),
+                )
+        return raw
+
     def import_json(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import JSON File", "", "JSON Files (*.json);;All Files (*)"
+            self,
+            "Import JSON File",
+            "",
+            "JSON Files (*.json);;Snapshot Files (*.npz);;All Files (*)",
         )
         if not file_path:
             return
 
-        SimulatorController.instance().clear_state()
+        ctrl = SimulatorController.instance()
         try:
-            buses, lines, positions = StorageFacade.read_json_file(file_path)
-            for bus in buses:
-                SimulatorController.instance().addBus(bus)
-            for line in lines:
-                SimulatorController.instance().addConnection(line)
+            with ctrl.batch():
+                ctrl.clear_state()
+                if file_path.lower().endswith(".npz"):
+                    snapshot = StorageFacade.read_snapshot_file(file_path)
+                    buses, lines, generators, positions = snapshot.elements()
+                    ctrl.power_base_mva = snapshot.base_mva
+                    ctrl.add_many(buses=buses, lines=lines, generators=generators)
+                else:
+                    project = StorageFacade.read_json_project(file_path)
+                    buses, positions = project.buses, project.positions
+                    ctrl.power_base_mva = project.base_mva
+                    ctrl.add_many(
+                        buses=buses, lines=project.lines, generators=project.generators
+                    )
 
             for index, bus in enumerate(buses):
                 bus_widget = self.simulator_widgets[bus.id]
@@ -152,16 +270,69 @@ class BoardView(QGraphicsView):
         if not file_path:
             return
 
+        ctrl = SimulatorController.instance()
+        buses = ctrl.buses
         positions = list[Tuple[float, float]]()
-        for element in self.simulator_widgets.values():
-            if isinstance(element, BusWidget):
-                positions.append((element.x(), element.y()))
-        StorageFacade.save_json_file(
-            file_path,
-            buses=SimulatorController.instance().buses,
-            lines=SimulatorController.instance().connections,
-            positions=positions,
+        for bus in buses:
+            widget = self.simulator_widgets.get(bus.id)
+            positions.append((widget.x(), widget.y()) if widget is not None else (0.0, 0.0))
+        try:
+            StorageFacade.save_json_file(
+                file_path,
+                buses=buses,
+                lines=ctrl.connections,
+                positions=positions,
+                generators=ctrl.generators,
+                base_mva=ctrl.power_base_mva,
+            )
+        except Exception as e:
+            traceback.print_exc()
+            QMessageBox.critical(self, "Erro ao salvar JSON", f"{type(e).__name__}: {e}")
+
+    def export_snapshot(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Snapshot", "", "Snapshot Files (*.npz);;All Files (*)"
+        )
+        if not file_path:
+            return
+
+        ctrl = SimulatorController.instance()
+        buses = ctrl.buses
+        positions = list[Tuple[float, float]]()
+        for bus in buses:
+            widget = self.simulator_widgets.get(bus.id)
+            positions.append((widget.x(), widget.y()) if widget is not None else (0.0, 0.0))
+        try:
+            StorageFacade.save_snapshot_file(
+                file_path,
+                buses=buses,
+                lines=ctrl.connections,
+                positions=positions,
+                generators=ctrl.generators,
+                base_mva=ctrl.power_base_mva,
+            )
+        except Exception as e:
+            traceback.print_exc()
+            QMessageBox.critical(self, "Erro ao salvar snapshot", f"{type(e).__name__}: {e}")
+
+    def export_matpower(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export to MATPOWER", "", "MATPOWER Files (*.m);;All Files (*)"
         )
+        if not file_path:
+            return
+
+        ctrl = SimulatorController.instance()
+        try:
+            StorageFacade.save_matpower_file(
+                file_path,
+                buses=ctrl.buses,
+                lines=ctrl.connections,
+                base_mva=ctrl.power_base_mva,
+            )
+        except Exception as e:
+            traceback.print_exc()
+            QMessageBox.critical(self, "Erro ao exportar MATPOWER", f"{type(e).__name__}: {e}")
 
     def wheelEvent(self, event):
         # Zoom suave: roda pra cima => aproxima
@@ -183,6 +354,7 @@ class BoardView(QGraphicsView):
             self._zoom -= 1
 
         self.scale(factor, factor)
+        self.update_level_of_detail()
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.MiddleButton:
@@ -220,6 +392,7 @@ class BoardView(QGraphicsView):
     def reset_view(self):
         self.resetTransform()
         self._zoom = 0
+        self.update_level_of_detail()
 
 
     def keyPressEvent(self, event):
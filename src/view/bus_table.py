@@ -1,69 +1,39 @@
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QTableWidget,
+    QTableView,
+    QHeaderView,
 )
 
-from controllers.simulator_controller import ElementEvent, SimulatorController
-from models.bus import Bus
-from models.network_element import NetworkElement
-from view.bus_table_row import BusTableRow
+from view.bus_table_model import BUS_TYPES, TYPE_COLUMN, BusTableModel
+from view.combo_box_delegate import ComboBoxDelegate
 
 
 class BusTable(QWidget):
     def __init__(self):
         super().__init__()
-        self.simulatorInstance = SimulatorController.instance()
-        self.simulatorInstance.listen(self.circuitListener)
         layout = QVBoxLayout(self)
         self.setLayout(layout)
 
-        self.fields = [
-            "name",
-            "number",
-            "type",
-            "v",
-            "o",
-            "p",
-            "q",
-            "p_load",
-            "q_load",
-            "p_gen",
-            "q_gen",
-            "q_min",
-            "q_max",
-            "shunt_b",
-            "shunt_g",
-        ]
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self.fields))
-        self.table.setHorizontalHeaderLabels(self.fields)
+        # Modelo/view: só as linhas visíveis são desenhadas, sem widget por célula
+        self.model = BusTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(TYPE_COLUMN, ComboBoxDelegate(BUS_TYPES, self.table))
+        self.table.setEditTriggers(
+            QTableView.EditTrigger.DoubleClicked
+            | QTableView.EditTrigger.SelectedClicked
+            | QTableView.EditTrigger.EditKeyPressed
+            | QTableView.EditTrigger.AnyKeyPressed
+        )
         self.table.horizontalHeader().setStretchLastSection(True)
+        # altura fixa: a view não mede as linhas uma a uma
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         layout.addWidget(self.table)
 
-        self.items: list[str] = []
-        for bus in self.simulatorInstance.buses:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            bus_row = BusTableRow(bus)
-            widgets = bus_row.get_widgets()
-            for col, widget in enumerate(widgets):
-                self.table.setCellWidget(row, col, widget)
-            self.items.append(bus.id)
-
-    def circuitListener(self, element: NetworkElement, event: ElementEvent):
-        if event is ElementEvent.CREATED and isinstance(element, Bus):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            bus_row = BusTableRow(element)
-            widgets = bus_row.get_widgets()
-            for col, widget in enumerate(widgets):
-                self.table.setCellWidget(row, col, widget)
-            self.items.append(element.id)
-
-        if event is ElementEvent.DELETED and isinstance(element, Bus):
-            for i, bus_id in enumerate(self.items):
-                if bus_id == element.id:
-                    self.table.removeRow(i)
-                    self.items.pop(i)
-                    break
+    def select_bus(self, bus_id: str) -> None:
+        row = self.model.row_of(bus_id)
+        if row is None:
+            return
+        self.table.selectRow(row)
+        self.table.scrollTo(self.model.index(row, 0))
@@ -0,0 +1,99 @@
+from math import pi
+from typing import Any, Callable
+
+from PySide6.QtCore import Qt
+
+from models.bus import Bus, BusType
+from models.network_element import NetworkElement
+from view.element_table_model import ElementTableModel, ModelIndex, format_cell
+
+_DEG_TO_RAD = pi / 180.0
+_RAD_TO_DEG = 180.0 / pi
+_INF = float("inf")
+
+
+def _blank(value: float, default: float) -> float | None:
+    # Campos opcionais ficam em branco quando têm o valor padrão (como nos TextField antigos)
+    return None if value == default else value
+
+
+# (cabeçalho, leitura, argumento de Bus.copy_with, tipo do valor editado)
+# A leitura devolve o valor exibido (None = célula vazia); argumento None = somente leitura.
+_COLUMNS: list[tuple[str, Callable[[Bus], Any], str | None, type | None]] = [
+    ("name", lambda b: b.name, "name", str),
+    ("number", lambda b: b.number, "number", int),
+    ("type", lambda b: b.type.name, "type", BusType),
+    ("v", lambda b: b.v, "v", float),
+    ("o", lambda b: b.o * _RAD_TO_DEG, "o", float),
+    ("p", lambda b: b.p, None, None),
+    ("q", lambda b: b.q, None, None),
+    ("p_load", lambda b: _blank(b.p_load, 0), "p_load", float),
+    ("q_load", lambda b: _blank(b.q_load, 0), "q_load", float),
+    ("p_gen", lambda b: _blank(b.p_gen, 0), "p_gen", float),
+    ("q_gen", lambda b: _blank(b.q_gen, 0), "q_gen", float),
+    ("q_min", lambda b: _blank(b.q_min, -_INF), "q_min", float),
+    ("q_max", lambda b: _blank(b.q_max, _INF), "q_max", float),
+    ("shunt_b", lambda b: _blank(b.b_shunt, 0), "b_shunt", float),
+    ("shunt_g", lambda b: _blank(b.g_shunt, 0), "g_shunt", float),
+]
+
+TYPE_COLUMN = 2
+BUS_TYPES = [t.name for t in (BusType.SLACK, BusType.PV, BusType.PQ)]
+
+
+def _parse(text: str, kind: type) -> Any:
+    # None = entrada vazia/inválida: mantém o valor atual (mesmo comportamento do copy_with)
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        if kind is BusType:
+            return BusType[text]
+        return kind(text)
+    except (KeyError, ValueError):
+        return None
+
+
+class BusTableModel(ElementTableModel):
+    """Barras do SimulatorController; uma edição vira updateElement(bus.copy_with(...))."""
+
+    headers = [c[0] for c in _COLUMNS]
+
+    def initial_elements(self) -> list[NetworkElement]:
+        return list(self.ctrl.buses)
+
+    def accepts(self, element: NetworkElement) -> bool:
+        return isinstance(element, Bus)
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return format_cell(_COLUMNS[index.column()][1](self._elements[index.row()]))
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() > TYPE_COLUMN:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def flags(self, index: ModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and _COLUMNS[index.column()][2] is not None:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: ModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        _, _, field, kind = _COLUMNS[index.column()]
+        if field is None or kind is None:
+            return False
+
+        parsed = _parse(str(value), kind)
+        if parsed is None:
+            return False
+        if field == "o":
+            parsed *= _DEG_TO_RAD
+
+        bus: Bus = self._elements[index.row()]
+        # updateElement emite UPDATED -> apply_changes atualiza a linha
+        self.ctrl.updateElement(bus.copy_with(**{field: parsed}))
+        return True
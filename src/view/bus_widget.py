@@ -27,6 +27,7 @@ class BusWidget(QGraphicsRectItem):
         self.bus: Bus = bus
         self.element = bus 
         self._gen_icon = None
+        self._detail_visible = True
         self.setBrush(Qt.GlobalColor.gray)
         self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsSelectable, True)
@@ -42,7 +43,11 @@ class BusWidget(QGraphicsRectItem):
 
         self.label = QGraphicsSimpleTextItem(self.__label, parent=self)
         self.label.setPos(x, y + 10)
-        SimulatorController.instance().listen(self.circuitListener)
+        # pan/zoom reaproveitam o texto já rasterizado
+        self.label.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self._unsubscribe = SimulatorController.instance().listen(
+            self.circuitListener, element_id=bus.id, events=(ElementEvent.UPDATED,)
+        )
 
         self.label.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
 
@@ -83,6 +88,7 @@ class BusWidget(QGraphicsRectItem):
         if has and self._gen_icon is None:
             self._gen_icon = GeneratorItem(self)
             self._gen_icon.setAcceptedMouseButtons(Qt.LeftButton)  # não rouba clique direito
+            self._gen_icon.setVisible(self._detail_visible)
             return
 
         if (not has) and self._gen_icon is not None:
@@ -92,8 +98,22 @@ class BusWidget(QGraphicsRectItem):
 
 
     def itemChange(self, change, value):
+        # A barra moveu: só as linhas ligadas a ela recalculam as pontas (nada no paint).
+        if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
+            for line in self.link.lines:
+                line.updatePosition()
+        # A BoardView descarta o widget ao removê-lo da cena: cancela a inscrição.
+        elif change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged and value is None:
+            self._unsubscribe()
         return super().itemChange(change, value)
 
+    def set_detail_visible(self, visible: bool) -> None:
+        # nível de detalhe da BoardView: longe demais texto e ícone não são legíveis
+        self._detail_visible = visible
+        self.label.setVisible(visible)
+        if self._gen_icon is not None:
+            self._gen_icon.setVisible(visible)
+
     def _pick_element_item(self, item):
         """
         Sobe na hierarquia (parentItem) até achar um item que tenha .element.
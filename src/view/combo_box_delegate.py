@@ -0,0 +1,31 @@
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtWidgets import QComboBox, QStyledItemDelegate, QStyleOptionViewItem, QWidget
+
+
+class ComboBoxDelegate(QStyledItemDelegate):
+    """Editor de lista fixa para uma coluna (o QComboBox só existe enquanto a célula é editada)."""
+
+    def __init__(self, options: list[str], parent=None):
+        super().__init__(parent)
+        self.options = options
+
+    def createEditor(
+        self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> QWidget:
+        editor = QComboBox(parent)
+        editor.addItems(self.options)
+        # grava assim que o usuário escolhe (sem esperar o foco sair)
+        editor.activated.connect(lambda *_: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex | QPersistentModelIndex) -> None:
+        assert isinstance(editor, QComboBox)
+        i = editor.findText(str(index.data(Qt.ItemDataRole.EditRole)))
+        if i >= 0:
+            editor.setCurrentIndex(i)
+
+    def setModelData(
+        self, editor: QWidget, model: QAbstractItemModel, index: QModelIndex | QPersistentModelIndex
+    ) -> None:
+        assert isinstance(editor, QComboBox)
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
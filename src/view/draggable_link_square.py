@@ -17,6 +17,8 @@ class DraggableLinkSquare(QGraphicsRectItem):
         self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsSelectable, True)
         self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsFocusable, True)
         self.drag_line = None
+        # linhas ligadas a este ponto; a barra avisa cada uma quando se move
+        self.lines: list = []
 
     def mousePressEvent(self, event):
         self.startPos = event.scenePos()
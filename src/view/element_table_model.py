@@ -0,0 +1,141 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Iterable, Iterator
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+
+from controllers.simulator_controller import ElementEvent, SimulatorController
+from models.network_element import ChangeSet, NetworkElement
+
+ModelIndex = QModelIndex | QPersistentModelIndex
+
+
+def contiguous_blocks(rows: Iterable[int]) -> Iterator[tuple[int, int]]:
+    """Agrupa índices em blocos (first, last), do último para o primeiro (remoção segura)."""
+    ordered = sorted(rows, reverse=True)
+    i = 0
+    while i < len(ordered):
+        last = first = ordered[i]
+        i += 1
+        while i < len(ordered) and ordered[i] == first - 1:
+            first = ordered[i]
+            i += 1
+        yield first, last
+
+
+def format_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    return str(value)
+
+
+class _AbstractModelMeta(ABCMeta, type(QAbstractTableModel)):
+    """
+    ABCMeta junto do metaclass do Qt. O tp_new do Shiboken não passa por object.__new__,
+    que é quem recusa classes com métodos abstratos; a recusa fica aqui.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        if cls.__abstractmethods__:
+            missing = ", ".join(sorted(cls.__abstractmethods__))
+            raise TypeError(f"{cls.__name__} é abstrata: falta implementar {missing}")
+        return super().__call__(*args, **kwargs)
+
+
+class ElementTableModel(QAbstractTableModel, metaclass=_AbstractModelMeta):
+    """
+    Base dos modelos de tabela que espelham elementos do SimulatorController.
+
+    Guarda só a lista de elementos e o índice id -> linha; a view pede os dados
+    das linhas visíveis, então o custo de abrir/rolar não cresce com a rede.
+    Subclasses definem `headers`, `accepts`, `data` e (se editável) `setData`.
+    """
+
+    headers: list[str] = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ctrl = SimulatorController.instance()
+        self._elements: list[NetworkElement] = [e for e in self.initial_elements() if self.accepts(e)]
+        self._rows: dict[str, int] = {e.id: i for i, e in enumerate(self._elements)}
+
+        unsubscribe = self.ctrl.listen(self.circuit_listener, on_batch=self.apply_changes)
+        self.destroyed.connect(lambda *_: unsubscribe())
+
+    # ---------------- subclasses ----------------
+    @abstractmethod
+    def initial_elements(self) -> list[NetworkElement]: ...
+
+    @abstractmethod
+    def accepts(self, element: NetworkElement) -> bool: ...
+
+    # ---------------- Qt ----------------
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._elements)
+
+    def columnCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    # ---------------- acesso ----------------
+    def element_at(self, row: int) -> NetworkElement:
+        return self._elements[row]
+
+    def row_of(self, element_id: str) -> int | None:
+        return self._rows.get(element_id)
+
+    def refresh_rows(self, rows: Iterable[int]) -> None:
+        rows = list(rows)
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), 0),
+                self.index(max(rows), len(self.headers) - 1),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole],
+            )
+
+    # ---------------- eventos do controller ----------------
+    def circuit_listener(self, element: NetworkElement, event: ElementEvent) -> None:
+        changes = ChangeSet()
+        changes.record(element, event)
+        self.apply_changes(changes)
+
+    def apply_changes(self, changes: ChangeSet) -> None:
+        removed = [i for i, e in changes.deleted.items() if i in self._rows and self.accepts(e)]
+
+        if removed:
+            if len(removed) == len(self._elements):
+                self.beginResetModel()
+                self._elements = []
+                self._rows = {}
+                self.endResetModel()
+            else:
+                for first, last in contiguous_blocks(self._rows[i] for i in removed):
+                    self.beginRemoveRows(QModelIndex(), first, last)
+                    del self._elements[first : last + 1]
+                    self.endRemoveRows()
+                self._rows = {e.id: i for i, e in enumerate(self._elements)}
+
+        # depois das remoções: apagar e recriar o mesmo id (limpar + importar) é uma troca
+        rows = self._rows
+        created = [e for e in changes.created.values() if e.id not in rows and self.accepts(e)]
+        updated = [e for e in changes.updated.values() if e.id in rows and self.accepts(e)]
+
+        if created:
+            first = len(self._elements)
+            self.beginInsertRows(QModelIndex(), first, first + len(created) - 1)
+            for offset, element in enumerate(created):
+                self._elements.append(element)
+                self._rows[element.id] = first + offset
+            self.endInsertRows()
+
+        if updated:
+            for element in updated:
+                self._elements[self._rows[element.id]] = element
+            self.refresh_rows(self._rows[e.id] for e in updated)
@@ -3,13 +3,11 @@ from __future__ import annotations
 from typing import Optional
 from math import sqrt
 
-import numpy as np
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QPushButton,
     QHeaderView,
     QInputDialog,
@@ -17,6 +15,7 @@ from PySide6.QtWidgets import (
 
 from models.bus import Bus
 from models.faults import FaultStudyResult
+from view.fault_result_model import FaultResultModel
 
 
 class FaultResultDialog(QDialog):
@@ -57,28 +56,6 @@ class FaultResultDialog(QDialog):
         desc_label = QLabel(self.result.spec.description, self)
         layout.addWidget(desc_label)
 
-        table = QTableWidget(self)
-        table.setColumnCount(10)
-        table.setHorizontalHeaderLabels(
-            [
-                "Barra",
-                "Va (pu)",
-                "Vb (pu)",
-                "Vc (pu)",
-                "Ia (pu)",
-                "Ib (pu)",
-                "Ic (pu)",
-                "Ia (kA)",
-                "Ib (kA)",
-                "Ic (kA)",
-            ]
-        )
-
-        def fmt_polar(z: complex) -> str:
-            mag = float(np.abs(z))
-            ang = float(np.rad2deg(np.angle(z)))
-            return f"{mag:.4f} ∠ {ang:.2f}°"
-
         def ibase_ka_for_bus(bus_id: str) -> Optional[float]:
             # override > 0: usa o valor digitado pelo usuário para todas as barras
             if self._vbase_override_kv > 0.0:
@@ -101,39 +78,9 @@ class FaultResultDialog(QDialog):
 
             return self._s_base_mva / (sqrt(3) * v_kv)
 
-        buses_res = list(self.result.buses.values())
-        table.setRowCount(len(buses_res))
-
-        for row, bus_result in enumerate(buses_res):
-            if bus_result.v_abc is not None:
-                Va, Vb, Vc = bus_result.v_abc
-            else:
-                Va, Vb, Vc = (bus_result.v_pu, 0 + 0j, 0 + 0j)
-
-            if bus_result.i_abc is not None:
-                Ia, Ib, Ic = bus_result.i_abc
-            else:
-                Ia, Ib, Ic = (bus_result.i_pu, 0 + 0j, 0 + 0j)
-
-            table.setItem(row, 0, QTableWidgetItem(str(bus_result.bus_id)))
-            table.setItem(row, 1, QTableWidgetItem(fmt_polar(Va)))
-            table.setItem(row, 2, QTableWidgetItem(fmt_polar(Vb)))
-            table.setItem(row, 3, QTableWidgetItem(fmt_polar(Vc)))
-            table.setItem(row, 4, QTableWidgetItem(fmt_polar(Ia)))
-            table.setItem(row, 5, QTableWidgetItem(fmt_polar(Ib)))
-            table.setItem(row, 6, QTableWidgetItem(fmt_polar(Ic)))
-
-            ibase = ibase_ka_for_bus(bus_result.bus_id)
-            if ibase is None:
-                table.setItem(row, 7, QTableWidgetItem("—"))
-                table.setItem(row, 8, QTableWidgetItem("—"))
-                table.setItem(row, 9, QTableWidgetItem("—"))
-            else:
-                table.setItem(row, 7, QTableWidgetItem(fmt_polar(Ia * ibase)))
-                table.setItem(row, 8, QTableWidgetItem(fmt_polar(Ib * ibase)))
-                table.setItem(row, 9, QTableWidgetItem(fmt_polar(Ic * ibase)))
-
-        table.resizeColumnsToContents()
+        table = QTableView(self)
+        table.setModel(FaultResultModel(self.result, ibase_ka_for_bus, table))
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         header = table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(table)
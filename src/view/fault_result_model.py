@@ -0,0 +1,86 @@
+import cmath
+from math import degrees
+from typing import Callable, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from models.faults import FaultStudyResult
+from view.element_table_model import ModelIndex
+
+HEADERS = [
+    "Barra",
+    "Va (pu)",
+    "Vb (pu)",
+    "Vc (pu)",
+    "Ia (pu)",
+    "Ib (pu)",
+    "Ic (pu)",
+    "Ia (kA)",
+    "Ib (kA)",
+    "Ic (kA)",
+]
+
+
+def fmt_polar(z: complex) -> str:
+    mag, ang = cmath.polar(z)
+    return f"{mag:.4f} ∠ {degrees(ang):.2f}°"
+
+
+class FaultResultModel(QAbstractTableModel):
+    """
+    Resultado de falta por barra (somente leitura).
+
+    As células são formatadas sob demanda em data(), direto dos arrays do
+    resultado (sem montar result.buses): só as linhas visíveis custam alguma
+    coisa, mesmo com milhares de barras.
+    """
+
+    def __init__(
+        self,
+        result: FaultStudyResult,
+        ibase_ka_for_bus: Callable[[str], Optional[float]],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.result = result
+        self._ibase_ka_for_bus = ibase_ka_for_bus
+        # falta no meio de linha: nenhuma barra recebe a corrente de falta
+        spec = result.spec
+        self._fault_row = -1 if spec.line_id is not None else result.bus_ids.index(spec.bus_id)
+
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.result.bus_ids)
+
+    def columnCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return str(section + 1)
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        row = index.row()
+        bus_id = self.result.bus_ids[row]
+        column = index.column()
+        if column == 0:
+            return str(bus_id)
+
+        if column <= 3:
+            return fmt_polar(self.result.v_abc[row, column - 1])
+
+        phase = (column - 4) % 3
+        current = self.result.i_abc_fault[phase] if row == self._fault_row else 0j
+
+        if column <= 6:
+            return fmt_polar(current)
+
+        ibase = self._ibase_ka_for_bus(bus_id)
+        if ibase is None:
+            return "—"
+        return fmt_polar(current * ibase)
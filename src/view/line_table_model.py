@@ -0,0 +1,147 @@
+from typing import Any
+
+from PySide6.QtCore import Qt
+
+from models.bus import Bus
+from models.line import Line
+from models.network_element import ChangeSet, NetworkElement
+from view.element_table_model import ElementTableModel, ModelIndex, format_cell
+
+FROM, TO, MODE, R, X, G, B, BC, TAP = range(9)
+MODES = ["Z", "Y"]
+
+
+class LineTableModel(ElementTableModel):
+    """
+    Linhas (sem transformadores) do SimulatorController.
+
+    A coluna sem título escolhe se a impedância é editada como Z (r, x) ou Y (g, b);
+    essa escolha é só da tabela, guardada por id de linha.
+    """
+
+    headers = ["from", "to", "", "r", "x", "g", "b", "bc", "tap"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.__modes: dict[str, str] = {}
+
+    def initial_elements(self) -> list[NetworkElement]:
+        return list(self.ctrl.connections)
+
+    def accepts(self, element: NetworkElement) -> bool:
+        return type(element) is Line
+
+    @staticmethod
+    def __z(line: Line) -> complex:
+        # Mostra o que o cálculo realmente usa
+        if line.z1 is not None:
+            return line.z1
+        return 0j if abs(line.y) < 1e-12 else 1 / line.y
+
+    def __bus_name(self, bus_id: str) -> str:
+        # data() não pode lançar exceção (é chamado pelo Qt); durante deleteBus a barra
+        # some antes das linhas ligadas a ela
+        try:
+            return self.ctrl.get_bus_by_id(bus_id).name
+        except ValueError:
+            return bus_id
+
+    def __mode(self, line: Line) -> str:
+        return self.__modes.get(line.id, "Z")
+
+    def __value(self, line: Line, column: int) -> Any:
+        if column in (FROM, TO):
+            return self.__bus_name(line.tap_bus_id if column == FROM else line.z_bus_id)
+        if column == MODE:
+            return self.__mode(line)
+        if column in (R, X):
+            z = self.__z(line)
+            return z.real if column == R else z.imag
+        if column in (G, B):
+            y = line.y1  # adm. usada na sequência positiva
+            return y.real if column == G else y.imag
+        if column == BC:
+            return line.bc if line.bc != 0.0 else None
+        return line.tap if line.tap != 1.0 else None
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return format_cell(self.__value(self._elements[index.row()], index.column()))
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() > MODE:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def flags(self, index: ModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if not index.isValid():
+            return flags
+        column = index.column()
+        mode = self.__mode(self._elements[index.row()])
+        if column in (MODE, BC, TAP) or (mode == "Z" and column in (R, X)) or (mode == "Y" and column in (G, B)):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        elif column not in (FROM, TO):
+            flags &= ~Qt.ItemFlag.ItemIsEnabled
+        return flags
+
+    def setData(self, index: ModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        line: Line = self._elements[index.row()]
+        column = index.column()
+
+        if column == MODE:
+            if value not in MODES:
+                return False
+            self.__modes[line.id] = value
+            self.refresh_rows([index.row()])
+            return True
+
+        try:
+            number = float(str(value).strip())
+        except ValueError:
+            return False  # vazio/inválido: mantém o valor atual
+
+        if column == BC:
+            new_line = line.copyWith(bc=number)
+        elif column == TAP:
+            new_line = line.copyWith(tap=number)
+        else:
+            new_line = self.__with_impedance(line, column, number)
+
+        # updateElement emite UPDATED -> apply_changes atualiza a linha
+        self.ctrl.updateElement(new_line)
+        return True
+
+    def __with_impedance(self, line: Line, column: int, number: float) -> Line:
+        # Vamos calcular SEMPRE y (g+jb) e z (r+jx) e manter coerentes
+        if column in (R, X):
+            z = self.__z(line)
+            z = complex(number, z.imag) if column == R else complex(z.real, number)
+            y = 0j if abs(z) < 1e-12 else (1 / z)
+        else:
+            y = line.y1
+            y = complex(number, y.imag) if column == G else complex(y.real, number)
+            z = 0j if abs(y) < 1e-12 else (1 / y)
+
+        # Se z2/z0 não foram definidos (None), mantém iguais ao positivo (didático)
+        new_z2 = line.z2 if line.z2 is not None else z
+        new_z0 = line.z0 if line.z0 is not None else (3 * z)
+        return line.copyWith(g=y.real, b=y.imag, z1=z, z2=new_z2, z0=new_z0)
+
+    def apply_changes(self, changes: ChangeSet) -> None:
+        super().apply_changes(changes)
+
+        for element_id, element in changes.deleted.items():
+            if self.accepts(element):
+                self.__modes.pop(element_id, None)
+
+        # Nomes de barra aparecem nas colunas from/to
+        renamed = {i for i, e in changes.updated.items() if isinstance(e, Bus)}
+        if renamed:
+            self.refresh_rows(
+                row
+                for row, line in enumerate(self._elements)
+                if line.tap_bus_id in renamed or line.z_bus_id in renamed
+            )
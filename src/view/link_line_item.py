@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
     QGraphicsLineItem, QGraphicsItem
 )
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QGraphicsSimpleTextItem, QApplication
+from PySide6.QtWidgets import QGraphicsSimpleTextItem, QApplication, QStyleOptionGraphicsItem
 from PySide6.QtGui import QPen
 
 from PySide6.QtGui import QPainter
@@ -16,6 +16,10 @@ from models.line import Line
 from models.network_element import NetworkElement
 
 
+# Abaixo desta escala o símbolo do transformador vira só a linha
+GLYPH_MIN_LEVEL_OF_DETAIL = 0.5
+
+
 class LinkLineItem(QGraphicsLineItem):
     def __init__(
         self,
@@ -39,7 +43,15 @@ class LinkLineItem(QGraphicsLineItem):
         self.nameLabel = QGraphicsSimpleTextItem(self.__label)
         self.nameLabel.setBrush(Qt.red)
         self.nameLabel.setParentItem(self)
-        SimulatorController.instance().listen(self.circuitListener)
+        self.nameLabel.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+        # as barras chamam updatePosition() quando se movem (ver BusWidget.itemChange)
+        self.sourceNodeDraggableLink.lines.append(self)
+        self.targetNodeDraggableLink.lines.append(self)
+        self.updatePosition()
+        self._unsubscribe = SimulatorController.instance().listen(
+            self.circuitListener, element_id=line.id, events=(ElementEvent.UPDATED,)
+        )
 
     def updatePosition(self):
         p1 = self.sourceNodeDraggableLink.sceneBoundingRect().center()
@@ -49,21 +61,17 @@ class LinkLineItem(QGraphicsLineItem):
             self.center = p1 + (p2 - p1) / 2
             self.nameLabel.setPos(self.center.x(), self.center.y())
 
-    def paint(self, painter, option, widget):
-        self.updatePosition()
-        super().paint(painter, option, widget)
-
-        # Se for transformador: desenha duas "bobinas" no meio
-        if isinstance(self.__line, Transformer):
-            ln = QGraphicsLineItem.line(self)
-            mx = (ln.x1() + ln.x2()) / 2.0
-            my = (ln.y1() + ln.y2()) / 2.0
-
-            r = 6  # raio visual
-            # duas elipses lado a lado
-            painter.drawEllipse(mx - 2*r, my - r, 2*r, 2*r)
-            painter.drawEllipse(mx,       my - r, 2*r, 2*r)
+    def itemChange(self, change, value):
+        # A BoardView descarta o item ao removê-lo da cena: cancela a inscrição.
+        if change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged and value is None:
+            self._unsubscribe()
+            for link in (self.sourceNodeDraggableLink, self.targetNodeDraggableLink):
+                if self in link.lines:
+                    link.lines.remove(self)
+        return super().itemChange(change, value)
 
+    def set_detail_visible(self, visible: bool) -> None:
+        self.nameLabel.setVisible(visible)
 
     def circuitListener(self, element: NetworkElement, event: ElementEvent):
         if (
@@ -105,3 +113,34 @@ class LinkLineItem(QGraphicsLineItem):
             label = "TR\n" + label
             label += f"\n{self.__line.meta.conn_hv}-{self.__line.meta.conn_lv}"
         return label
+
+
+class TransformerLineItem(LinkLineItem):
+    """
+    Transformador na board. Só ele sobrescreve paint(): as linhas comuns ficam
+    no paint nativo do QGraphicsLineItem (milhares de itens sem chamar Python).
+    """
+
+    GLYPH_RADIUS = 6  # raio visual
+
+    def boundingRect(self):
+        # as bobinas saem da espessura da linha; sem isso sobram rastros ao arrastar
+        r = TransformerLineItem.GLYPH_RADIUS
+        return super().boundingRect().adjusted(-2 * r, -r, 2 * r, r)
+
+    def paint(self, painter, option, widget):
+        super().paint(painter, option, widget)
+
+        # desenha duas "bobinas" no meio (só com zoom suficiente)
+        if (
+            QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+            >= GLYPH_MIN_LEVEL_OF_DETAIL
+        ):
+            ln = QGraphicsLineItem.line(self)
+            mx = (ln.x1() + ln.x2()) / 2.0
+            my = (ln.y1() + ln.y2()) / 2.0
+
+            r = TransformerLineItem.GLYPH_RADIUS
+            # duas elipses lado a lado
+            painter.drawEllipse(mx - 2*r, my - r, 2*r, 2*r)
+            painter.drawEllipse(mx,       my - r, 2*r, 2*r)
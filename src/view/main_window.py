@@ -59,11 +59,23 @@ class MainWindow(QMainWindow):
         projectExportPDF.triggered.connect(self.export_pdf)
         project.addAction(projectExportPDF)
 
+        projectExportResults = QAction("Export Results", project)
+        projectExportResults.triggered.connect(self.export_results)
+        project.addAction(projectExportResults)
+
         projectImportIeee = QAction("Open IEEE ", project)
         projectImportIeee.setShortcut(QKeySequence("Ctrl+I"))
         projectImportIeee.triggered.connect(self.import_project_from_ieee)
         project.addAction(projectImportIeee)
 
+        projectSaveSnapshot = QAction("Save Snapshot", project)
+        projectSaveSnapshot.triggered.connect(self.save_project_to_snapshot)
+        project.addAction(projectSaveSnapshot)
+
+        projectExportMatpower = QAction("Export MATPOWER", project)
+        projectExportMatpower.triggered.connect(self.export_project_to_matpower)
+        project.addAction(projectExportMatpower)
+
         view = toolbar.addMenu("View")
         viewBars = QAction("Bars", view)
         viewBars.triggered.connect(self.show_bus_window)
@@ -171,6 +183,8 @@ class MainWindow(QMainWindow):
     def show_bus_window(self):
         networkWindow = QMainWindow(parent=self)
         networkWindow.setWindowTitle("Bus Table")
+        # fechar a janela destrói a tabela (e as inscrições no controller)
+        networkWindow.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         centralWidget = QWidget()
         layout = QVBoxLayout(centralWidget)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -187,6 +201,7 @@ class MainWindow(QMainWindow):
     def show_line_window(self):
         lineWindow = QMainWindow(parent=self)
         lineWindow.setWindowTitle("Line Table")
+        lineWindow.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         centralWidget = QWidget()
         layout = QVBoxLayout(centralWidget)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -254,6 +269,39 @@ class MainWindow(QMainWindow):
     def import_project_from_ieee(self):
         self.board.import_ieee()
 
+    def save_project_to_snapshot(self):
+        self.board.export_snapshot()
+
+    def export_project_to_matpower(self):
+        self.board.export_matpower()
+
+    def export_pdf(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export PDF", "relatorio_fluxo_potencia.pdf", "PDF Files (*.pdf);;All Files (*)"
+        )
+        if not file_path:
+            return
+        try:
+            SimulatorController.instance().exportPdfReport(os.path.abspath(file_path))
+        except Exception as e:
+            QMessageBox.critical(self, "Erro ao exportar PDF", f"{type(e).__name__}: {e}")
+
+    def export_results(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Results",
+            "resultados.parquet",
+            "Parquet (*.parquet);;Arrow IPC (*.arrow);;CSV (*.csv)",
+        )
+        if not file_path:
+            return
+        try:
+            paths = SimulatorController.instance().exportResultTables(os.path.abspath(file_path))
+        except Exception as e:
+            QMessageBox.critical(self, "Erro ao exportar resultados", f"{type(e).__name__}: {e}")
+            return
+        QMessageBox.information(self, "Export Results", "\n".join(paths))
+
     def add_transformer(self):
         ctrl = SimulatorController.instance()
         buses = ctrl.buses
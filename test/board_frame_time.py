@@ -0,0 +1,132 @@
+"""
+Mede o tempo de quadro da BoardView com um diagrama grande (grade de barras).
+
+- monta N barras (padrão 3000) em grade, com linhas entre vizinhas
+- redesenha parado e durante pan em três escalas: 1.0, 0.3 e "tudo na tela"
+- arrasta uma barra (atualização das linhas ligadas via itemChange)
+
+Uso:
+    python test/board_frame_time.py            # usa QT_QPA_PLATFORM=offscreen se não houver display
+    python test/board_frame_time.py --buses 5000
+
+Retorna código 1 se algum orçamento for estourado.
+"""
+
+import builtins
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+if os.name != "nt" and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# ------------------------------------------------------------------
+# Orçamento em ms por quadro (render por software; ajuste quando a meta mudar)
+# ------------------------------------------------------------------
+INTERACTIVE_BUDGET_MS = 33.0  # ~30 quadros/s com zoom de trabalho
+OVERVIEW_BUDGET_MS = 250.0  # diagrama inteiro na tela
+SPACING = 150
+
+
+def _build(n_buses: int):
+    from controllers.simulator_controller import SimulatorController
+    from models.bus import Bus, BusType
+    from models.line import Line
+    from view.board_view import BoardView
+
+    side = int(math.ceil(math.sqrt(n_buses)))
+    buses = [
+        Bus(name=f"B{i}", number=i + 1, type=BusType.PV if i % 5 == 0 else BusType.PQ)
+        for i in range(n_buses)
+    ]
+    lines = []
+    for i in range(n_buses):
+        if (i + 1) % side and i + 1 < n_buses:
+            lines.append(Line(buses[i], buses[i + 1], g=1.0, b=-10.0))
+        if i + side < n_buses:
+            lines.append(Line(buses[i], buses[i + side], g=1.0, b=-10.0))
+
+    view = BoardView()
+    view.resize(1280, 800)
+    view.show()
+    SimulatorController.instance().add_many(buses=buses, lines=lines)
+    for i, bus in enumerate(buses):
+        view.simulator_widgets[bus.id].setPos((i % side) * SPACING, (i // side) * SPACING)
+    return view, buses, lines, side
+
+
+def _frame_ms(view, frames: int, pan: int = 0) -> float:
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        if pan:
+            bar = view.horizontalScrollBar()
+            bar.setValue(bar.value() + pan)
+        view.viewport().repaint()
+    return (time.perf_counter() - t0) / frames * 1000.0
+
+
+def main() -> int:
+    n_buses = 3000
+    if "--buses" in sys.argv:
+        n_buses = int(sys.argv[sys.argv.index("--buses") + 1])
+
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication([])
+
+    # o controller imprime cada elemento criado; silencia durante a montagem
+    _print = builtins.print
+    builtins.print = lambda *a, **k: None
+    try:
+        view, buses, lines, side = _build(n_buses)
+        app.processEvents()
+    finally:
+        builtins.print = _print
+
+    center = side * SPACING / 2
+    results: list[tuple[str, float, float]] = []
+
+    view.centerOn(center, center)
+    results.append(("escala 1.0, parado", _frame_ms(view, 20), INTERACTIVE_BUDGET_MS))
+    results.append(("escala 1.0, pan", _frame_ms(view, 20, pan=40), INTERACTIVE_BUDGET_MS))
+
+    view.resetTransform()
+    view.scale(0.3, 0.3)
+    view.update_level_of_detail()
+    view.centerOn(center, center)
+    results.append(("escala 0.3, parado", _frame_ms(view, 10), INTERACTIVE_BUDGET_MS))
+    results.append(("escala 0.3, pan", _frame_ms(view, 10, pan=20), INTERACTIVE_BUDGET_MS))
+
+    widget = view.simulator_widgets[buses[side + 1].id]
+    t0 = time.perf_counter()
+    for _ in range(30):
+        widget.setPos(widget.pos().x() + 1, widget.pos().y())
+        view.viewport().repaint()
+    drag_ms = (time.perf_counter() - t0) / 30 * 1000.0
+    results.append(("escala 0.3, arrastando barra", drag_ms, INTERACTIVE_BUDGET_MS))
+
+    view.fitInView(view.scene().itemsBoundingRect())
+    view.update_level_of_detail()
+    results.append(("tudo na tela, parado", _frame_ms(view, 5), OVERVIEW_BUDGET_MS))
+
+    print(f"{n_buses} barras, {len(lines)} linhas")
+    failures = []
+    for label, ms, budget in results:
+        flag = "" if ms <= budget else "  <-- acima do orçamento"
+        print(f"  {label:30s} {ms:7.1f} ms/quadro (orçamento {budget:.0f} ms){flag}")
+        if ms > budget:
+            failures.append(label)
+
+    if failures:
+        print("\nFALHOU:", ", ".join(failures))
+        return 1
+
+    print("\nOK: dentro do orçamento.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Importação pela BoardView (o mesmo caminho do menu, sem o diálogo de arquivo): a base
+do controller vem do arquivo importado.
+"""
+
+import os
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+if os.name != "nt" and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")  # runPowerFlow desenha o perfil de tensão
+
+from PySide6.QtWidgets import QApplication
+
+from controllers.simulator_controller import SimulatorController
+from storage.ieee_cdf import read_ieee_cdf
+from storage.matpower import BS, GS, PD, PG, QD, QG, QMAX, QMIN, case_from_cdf, format_matpower
+
+ROOT = Path(__file__).resolve().parent.parent
+TMP = tempfile.mkdtemp()
+
+
+def __solve(view, path: str) -> dict[str, float]:
+    ctrl = SimulatorController.instance()
+    view.load_network_file(path)
+    ctrl.runPowerFlow()
+    return {bus.id: bus.v for bus in ctrl.buses}
+
+
+def __test_matpower_base() -> None:
+    """O mesmo caso em baseMVA 100 e 50 (MW/Mvar pela metade): mesmas tensões."""
+    from view.board_view import BoardView
+
+    case = case_from_cdf(read_ieee_cdf(str(ROOT / "assets/ieee_examples/ieee14cdf.txt")))
+    half = replace(case, base_mva=50.0, bus=case.bus.copy(), gen=case.gen.copy())
+    half.bus[:, [PD, QD, GS, BS]] /= 2
+    half.gen[:, [PG, QG, QMAX, QMIN]] /= 2
+
+    paths = []
+    for name, mpc in (("base100", case), ("base50", half)):
+        paths.append(os.path.join(TMP, f"{name}.m"))
+        with open(paths[-1], "w") as file:
+            file.write(format_matpower(mpc))
+
+    view = BoardView()
+    v100 = __solve(view, paths[0])
+    assert SimulatorController.instance().power_base_mva == 100.0
+    v50 = __solve(view, paths[1])
+    assert SimulatorController.instance().power_base_mva == 50.0
+    error = max(abs(v50[bus_id] - v) for bus_id, v in v100.items())
+    assert error < 1e-9, error
+
+    view.load_network_file(str(ROOT / "assets/ieee_examples/ieee14cdf.txt"))
+    assert SimulatorController.instance().power_base_mva == 100.0  # cartão de título
+    print(f"baseMVA 50 x 100: tensões iguais (diferença máxima {error:.1e} pu)")
+
+
+if __name__ == "__main__":
+    app = QApplication.instance() or QApplication([])
+    os.chdir(TMP)  # perfil_tensao.png
+    __test_matpower_base()
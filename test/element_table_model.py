@@ -0,0 +1,62 @@
+"""
+Tabelas de barras/linhas abertas enquanto a rede é trocada num lote só
+(limpar + importar, como BoardView.import_ieee/import_json).
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+if os.name != "nt" and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from controllers.simulator_controller import SimulatorController
+from models.line import Line
+from storage.storage import StorageFacade
+from view.bus_table_model import BusTableModel
+from view.line_table_model import LineTableModel
+
+IEEE14 = Path(__file__).resolve().parent.parent / "assets/ieee_examples/ieee14cdf.txt"
+
+
+def __import(ctrl: SimulatorController) -> None:
+    power_flow = StorageFacade.read_ieee_file(str(IEEE14))
+    with ctrl.batch():
+        ctrl.clear_state()
+        ctrl.add_many(buses=power_flow.buses.values(), lines=power_flow.connections.values())
+
+
+def __test_reimport() -> None:
+    """Reimportar recria os mesmos ids de barra: troca, não remoção."""
+    ctrl = SimulatorController.instance()
+    __import(ctrl)
+    buses, lines = BusTableModel(), LineTableModel()
+    for _ in range(2):
+        __import(ctrl)
+        assert buses.rowCount() == len(ctrl.buses) == 14, buses.rowCount()
+        plain = [c for c in ctrl.connections if type(c) is Line]  # trafos têm tabela própria
+        assert lines.rowCount() == len(plain) == 17, lines.rowCount()
+        assert [buses.element_at(i) for i in range(14)] == ctrl.buses
+    print(f"reimportação: {buses.rowCount()} barras e {lines.rowCount()} linhas na tabela")
+
+
+def __test_replace_one() -> None:
+    """Apagar e recriar uma barra só, com as outras linhas da tabela ficando."""
+    ctrl = SimulatorController.instance()
+    __import(ctrl)
+    model = BusTableModel()
+    bus = ctrl.buses[3]
+    with ctrl.batch():
+        ctrl.deleteBus(bus.id)
+        ctrl.add_many(buses=[bus])
+    assert model.rowCount() == len(ctrl.buses) == 14 and model.row_of(bus.id) is not None
+    print(f"barra {bus.id} apagada e recriada no mesmo lote: continua na tabela")
+
+
+if __name__ == "__main__":
+    app = QApplication.instance() or QApplication([])
+    __test_reimport()
+    __test_replace_one()
@@ -0,0 +1,199 @@
+import io
+import math
+import os
+import re
+import time
+
+from models.transformer import Transformer
+from storage.ieee_cdf import power_flow_from_cdf, read_ieee_cdf
+from storage.psse_raw import parse_psse_raw, read_psse_raw
+
+ASSETS = os.path.join(os.path.dirname(__file__), "../assets")
+RAW_14 = os.path.join(ASSETS, "psse_examples/ieee14_v33.raw")
+RAW_14_V34 = os.path.join(ASSETS, "psse_examples/ieee14_v34.raw")
+
+
+def __test_against_cdf() -> None:
+    """O ieee14_v33.raw é o ieee14cdf.txt convertido: o fluxo tem que dar o mesmo resultado."""
+    raw = read_psse_raw(RAW_14)
+    assert raw.version == 33 and raw.base_mva == 100.0 and not raw.warnings, raw.warnings
+    assert len(raw.buses) == 14 and len(raw.lines) == 20 and len(raw.generators) == 5
+
+    transformers = [line for line in raw.lines if isinstance(line, Transformer)]
+    assert [t.tap for t in transformers] == [0.978, 0.969, 0.932]
+    assert all(t.meta.conn_hv == "Yg" and t.meta.conn_lv == "D" for t in transformers)
+    # ZX = 0.25 pu na base da máquina (100 MVA) = base do sistema
+    assert all(abs(g.sc.x1_pu - 0.25) < 1e-12 for g in raw.generators)
+
+    power_flow = raw.power_flow()
+    power_flow.solve(max_iterations=20)
+    cdf = read_ieee_cdf(os.path.join(ASSETS, "ieee_examples/ieee14cdf.txt"))
+    expected = power_flow_from_cdf(cdf)
+    expected.solve(max_iterations=20)
+    for a, b in zip(expected.buses.values(), power_flow.buses.values()):
+        assert a.type == b.type and abs(a.v - b.v) < 1e-9 and abs(a.o - b.o) < 1e-9, a.id
+    print("ieee14_v33.raw: mesmo fluxo de potência do ieee14cdf.txt")
+
+
+def __test_v34() -> None:
+    """
+    ieee14_v34.raw: o mesmo caso na revisão 34 (dados do sistema, ramos com NAME e 12
+    ratings, NREG dos geradores, shunt da barra 9 como shunt chaveado) mais a barra 15
+    vazia, ligada à 9 por um disjuntor fechado; o disjuntor 14-15 está aberto.
+    """
+    raw = read_psse_raw(RAW_14_V34)
+    assert raw.version == 34 and not raw.warnings, raw.warnings
+    assert len(raw.buses) == 15 and len(raw.lines) == 21 and len(raw.generators) == 5
+    assert raw.lines[0].name == "L1-2" and raw.lines[17].name == "BRK 9-15"
+    assert raw.lines[17].z1 == 1e-4j and raw.buses[8].b_shunt == 0.19
+    assert all(abs(g.sc.x1_pu - 0.25) < 1e-12 for g in raw.generators)
+
+    power_flow = raw.power_flow()
+    power_flow.solve(max_iterations=20)
+    expected = read_psse_raw(RAW_14).power_flow()
+    expected.solve(max_iterations=20)
+    buses = list(power_flow.buses.values())
+    for a, b in zip(expected.buses.values(), buses):
+        assert a.type == b.type and abs(a.v - b.v) < 1e-6 and abs(a.o - b.o) < 1e-6, a.id
+    assert abs(buses[14].v - buses[8].v) < 1e-9  # disjuntor sem corrente
+
+    # v34 sem o bloco de dados do sistema: começa direto nas barras
+    lines = open(RAW_14_V34).read().splitlines()
+    end = next(k for k, line in enumerate(lines) if "END OF SYSTEM-WIDE DATA" in line)
+    raw = parse_psse_raw(io.StringIO("\n".join(lines[:3] + lines[end + 1 :])))
+    assert len(raw.buses) == 15 and len(raw.lines) == 21 and not raw.warnings, raw.warnings
+    print("ieee14_v34.raw: mesmo fluxo do ieee14_v33.raw (com e sem dados do sistema)")
+
+
+def __test_constant_admittance() -> None:
+    """O shunt de 19 Mvar da barra 9 como carga de admitância constante (YQ) dá o mesmo fluxo."""
+    text = open(RAW_14).read()
+    shunt = "     9,'1 ',1,     0.000,    19.000\n"
+    load_9 = "    29.500,    16.600,     0.000,     0.000,     0.000,     0.000,"
+    assert shunt in text and load_9 in text
+    text = text.replace(shunt, "")
+    text = text.replace(load_9, load_9[:-11] + "    19.000,")
+    # YQ < 0: indutivo
+    text = text.replace(
+        "0 / END OF LOAD DATA",
+        "    14,'2 ',1,1,1,0.0,0.0,0.0,0.0,2.5,-10.0,1,1,0\n0 / END OF LOAD DATA",
+    )
+    raw = parse_psse_raw(io.StringIO(text))
+    assert not raw.warnings, raw.warnings
+    assert raw.buses[8].b_shunt == 0.19
+    assert (raw.buses[13].g_shunt, raw.buses[13].b_shunt) == (0.025, -0.1)
+    raw.buses[13].g_shunt = raw.buses[13].b_shunt = 0.0
+
+    power_flow = raw.power_flow()
+    power_flow.solve(max_iterations=20)
+    expected = read_psse_raw(RAW_14).power_flow()
+    expected.solve(max_iterations=20)
+    for a, b in zip(expected.buses.values(), power_flow.buses.values()):
+        assert abs(a.v - b.v) < 1e-12 and abs(a.o - b.o) < 1e-12, a.id
+    print("YP/YQ: admitância constante com o sinal do BL (YQ > 0 capacitivo)")
+
+
+def __test_magnetizing() -> None:
+    """CM = 2 com SBASE1-2 != SBASE: perdas e corrente na base do enrolamento (50 MVA)."""
+    text = open(RAW_14).read()
+    record = (
+        "     4,     7,     0,'1 ',1,1,1, 0.00000E+0, 0.00000E+0,2,'            ',1,   1,1.0000,"
+    )
+    impedance = " 0.00000E+00, 2.09120E-01,   100.00\n"
+    assert text.count(record) == 1 and text.count(impedance) == 1
+    cm_2 = record.replace("1,1,1, 0.00000E+0, 0.00000E+0", "1,1,2, 5.0E+4, 5.0E-3")
+    text = text.replace(record, cm_2)
+    text = text.replace(impedance, impedance.replace("100.00", " 50.00"))
+    raw = parse_psse_raw(io.StringIO(text))
+    assert not raw.warnings, raw.warnings
+
+    # 50 kW e 0,5 % de corrente em 50 MVA: G = 0,001 e B = -sqrt(0,005² - 0,001²) pu
+    g, b = 0.001 * 50 / 100, -math.sqrt(0.005**2 - 0.001**2) * 50 / 100
+    bus_4 = raw.buses[3]
+    assert abs(bus_4.g_shunt - g) < 1e-15 and abs(bus_4.b_shunt - b) < 1e-15, bus_4.b_shunt
+    assert raw.lines[-3].z1 == 0.20912j  # CZ = 1: X continua na base do sistema
+    print(f"magnetização CM = 2: G = {g:.6f}, B = {b:.6f} pu na base do sistema")
+
+
+def __test_unsupported_records() -> None:
+    """Registros quebrados ou fora do modelo viram avisos; o resto do arquivo é lido."""
+    text = open(RAW_14).read()
+    text = text.replace(
+        "0 / END OF BUS DATA",
+        "    15,'ISOLADA',  1.0000,4,   1,   1,   1,1.00000,   0.0000\n0 / END OF BUS DATA",
+    )
+    text = text.replace(
+        "0 / END OF LOAD DATA",
+        "    15,'1 ',1,1,1,10.0,5.0\n     5,'2 ',1,1,1,abc,1.0\n0 / END OF LOAD DATA",
+    )
+    three_winding = (
+        "     4,     7,     9,'3 ',1,1,1,0,0,2,'T3',1,1,1.0\n"
+        "0.0,0.2,100,0.0,0.2,100,0.0,0.2,100,1.0,0.0\n"
+        "1.0,0,0\n1.0,0,0\n1.0,0,0\n"
+    )
+    end = "0 / END OF TRANSFORMER DATA"
+    text = text.replace(end, three_winding + end)
+    text = text.replace(
+        "0 / END OF FACTS DEVICE DATA",
+        "'FACTS 1',    5,     0,1,0.0,0.0,1.0\n0 / END OF FACTS DEVICE DATA",
+    )
+    raw = parse_psse_raw(io.StringIO(text))
+    for warning in raw.warnings:
+        print(f"  aviso: {warning}")
+    assert len(raw.warnings) == 3, raw.warnings
+    assert len(raw.buses) == 14 and len(raw.lines) == 20
+    assert raw.buses[4].p_load == 7.6  # a carga inválida da barra 5 não entrou
+
+
+def __synthetic_raw(copies: int) -> str:
+    """O caso de 14 barras repetido, com as barras renumeradas (cópia k: +100·k)."""
+    lines = open(RAW_14).read().splitlines()
+    head, body = lines[:3], lines[3:]
+    ends = [k for k, line in enumerate(body) if line.startswith("0 /")]
+    # quantos números de barra no começo de cada linha, por seção (trafo: só a 1ª de 4)
+    buses_per_line = [1, 1, 1, 1, 2, 2]
+    out = list(head)
+    start = 0
+    for section, end in enumerate(ends):
+        records = body[start:end]
+        if section < len(buses_per_line):
+            count = buses_per_line[section]
+            for copy in range(copies):
+                for k, line in enumerate(records):
+                    if section == 5 and k % 4:
+                        out.append(line)
+                        continue
+                    fields = line.split(",")
+                    for j in range(count):
+                        fields[j] = f"{int(fields[j]) + 100 * copy:6d}"
+                    out.append(",".join(fields))
+        else:
+            out.extend(records)
+        out.append(body[end])
+        start = end + 1
+    out.extend(body[start:])
+    return "\n".join(out) + "\n"
+
+
+def __benchmark_20k() -> None:
+    text = __synthetic_raw(1500)
+    t0 = time.perf_counter()
+    raw = parse_psse_raw(io.StringIO(text))
+    elapsed = time.perf_counter() - t0
+    # as cópias não se ligam: 1500 barras de referência, o que basta para a leitura
+    assert len(raw.buses) == 21_000 and not raw.warnings
+    mb = len(text) / 1e6
+    print(
+        f"sintético: {len(raw.buses)} barras, {len(raw.lines)} ramos, {mb:.1f} MB "
+        f"em {elapsed:.2f} s"
+    )
+    assert re.fullmatch(r"G\d+ \(1\)", raw.generators[-1].name)
+
+
+if __name__ == "__main__":
+    __test_against_cdf()
+    __test_v34()
+    __test_constant_admittance()
+    __test_magnetizing()
+    __test_unsupported_records()
+    __benchmark_20k()
@@ -0,0 +1,124 @@
+import math
+import os
+import time
+
+import numpy as np
+
+from models.bus import BusType
+from models.transformer import Transformer
+from storage.id_utils import norm_bus_id
+from storage.ieee_cdf import parse_ieee_cdf, power_flow_from_cdf, read_ieee_cdf
+from storage.read_tables_ieee import read_power_flow_from_ieee
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "../assets/ieee_examples")
+
+
+# Valores copiados dos cartões de cada arquivo
+SIZES = {  # barras, ramos, transformadores (tipo 1-4 ou relação de espiras preenchida)
+    "ieee14cdf.txt": (14, 20, 3),
+    "ieee14cdf_class.txt": (14, 20, 3),
+    "ieee30cdf.txt": (30, 41, 4),
+    "ieee57cdf.txt": (57, 80, 17),
+    "ieee118cdf.txt": (118, 186, 9),
+    "ieee300cdf.txt": (300, 411, 107),
+}
+BUS_CARDS = [  # arquivo, número, tipo, v, ângulo em graus, p_load, q_load, p_gen, q_gen
+    ("ieee14cdf.txt", 14, BusType.PQ, 1.036, -16.04, 14.9, 5.0, 0.0, 0.0),
+    ("ieee14cdf_class.txt", 2, BusType.PV, 1.045, -4.98, 21.7, 12.7, 40.0, 43.46),
+    ("ieee30cdf.txt", 30, BusType.PQ, 0.992, -17.94, 10.6, 1.9, 0.0, 0.0),
+    ("ieee57cdf.txt", 1, BusType.SLACK, 1.04, 0.0, 55.0, 17.0, 128.9, -16.1),
+    ("ieee118cdf.txt", 118, BusType.PQ, 0.949, 21.92, 33.0, 15.0, 0.0, 0.0),
+    ("ieee300cdf.txt", 9533, BusType.PQ, 1.0402, -18.24, 1.19, 0.41, 0.0, 0.0),
+]
+BRANCH_CARDS = [  # arquivo, de, para, r, x, b, tap (colunas 77-82, inclusive a parte inteira)
+    ("ieee14cdf.txt", 4, 7, 0.0, 0.20912, 0.0, 0.978),
+    ("ieee14cdf_class.txt", 1, 2, 0.01938, 0.05917, 0.0528, 1.0),
+    ("ieee57cdf.txt", 21, 20, 0.0, 0.7767, 0.0, 1.043),
+    ("ieee300cdf.txt", 9005, 9051, 0.01578, 0.37486, 0.0, 1.0435),
+]
+
+
+def __test_cards(name: str) -> None:
+    """PowerFlow da leitura em bloco x valores fixos tirados do arquivo."""
+    power_flow = read_power_flow_from_ieee(os.path.join(EXAMPLES, name))
+    lines = list(power_flow.connections.values())
+    transformers = sum(isinstance(line, Transformer) for line in lines)
+    assert (len(power_flow.buses), len(lines), transformers) == SIZES[name], transformers
+
+    for _, number, bus_type, v, angle, *powers in (c for c in BUS_CARDS if c[0] == name):
+        bus = power_flow.buses[norm_bus_id(number)]
+        assert bus.number == number and bus.type == bus_type, (name, number)
+        assert [bus.v, bus.p_load, bus.q_load, bus.p_gen, bus.q_gen] == [v, *powers]
+        assert math.isclose(math.degrees(bus.o), angle, abs_tol=1e-12), (name, number)
+
+    ends = {(line.tap_bus_id, line.z_bus_id): line for line in lines}
+    for _, f, t, r, x, b, tap in (c for c in BRANCH_CARDS if c[0] == name):
+        line = ends[norm_bus_id(f), norm_bus_id(t)]
+        assert (line.z1, line.bc, line.tap) == (complex(r, x), b, tap), (name, f, t)
+        assert isinstance(line, Transformer) == (tap != 1.0), (name, f, t)
+    print(f"{name}: {len(power_flow.buses)} barras, {len(lines)} ramos ({transformers} trafos)")
+
+
+def __test_bus_type_1() -> None:
+    """Tipo 1 (PQ com limite de tensão) entra como PQ."""
+    with open(os.path.join(EXAMPLES, "ieee14cdf.txt"), "rb") as file:
+        lines = file.read().splitlines()
+    card = lines[15]  # barra 14, tipo 0
+    lines[15] = card[:24] + b" 1" + card[26:]
+    case = parse_ieee_cdf(b"\n".join(lines))
+    assert case.buses["type"][13] == 1
+    assert power_flow_from_cdf(case).buses["14"].type == BusType.PQ
+
+
+def __test_300_bus() -> None:
+    path = os.path.join(EXAMPLES, "ieee300cdf.txt")
+    case = read_ieee_cdf(path)
+    assert len(case.buses) == 300 and len(case.branches) == 411
+    assert case.title["case_id"] == "IEEE 300-BUS TEST SYSTEM"
+
+    # o defasador e os taps com parte inteira (coluna 77) entram no PowerFlow
+    shifter = case.branches[case.branches["angle"] != 0]
+    print(f"300 barras: {len(shifter)} defasador(es), ângulo {shifter['angle'].tolist()}")
+    tap_from, tap_to = case.branch_ends()
+    assert (case.buses["number"][tap_from] == case.branches["tap_bus"]).all()
+    assert case.branches["ratio"].max() > 1.0
+
+    t0 = time.perf_counter()
+    for _ in range(20):
+        read_ieee_cdf(path)
+    print(f"ieee300cdf.txt: {(time.perf_counter() - t0) / 20 * 1e3:.2f} ms por leitura")
+
+
+def __benchmark_50k() -> None:
+    """Arquivo sintético: os cartões do caso de 300 barras repetidos até ~50 mil barras."""
+    with open(os.path.join(EXAMPLES, "ieee300cdf.txt"), "rb") as file:
+        lines = file.read().splitlines()
+    bus_end = lines.index(next(line for line in lines if line.startswith(b"-999")))
+    branch_end = next(i for i in range(bus_end + 2, len(lines)) if lines[i].startswith(b"-999"))
+    copies = 50_000 // (bus_end - 2) + 1
+    data = b"\n".join(
+        lines[:2]
+        + lines[2:bus_end] * copies
+        + lines[bus_end : bus_end + 2]
+        + lines[bus_end + 2 : branch_end] * copies
+        + lines[branch_end:]
+    )
+
+    t0 = time.perf_counter()
+    case = parse_ieee_cdf(data)
+    bulk = time.perf_counter() - t0
+
+    mb = len(data) / 1e6
+    print(
+        f"sintético: {len(case.buses)} barras, {len(case.branches)} ramos, {mb:.1f} MB em "
+        f"{bulk * 1e3:.0f} ms ({mb / bulk:.0f} MB/s)"
+    )
+    assert np.array_equal(case.buses["v"][:300], case.buses["v"][-300:])
+
+
+if __name__ == "__main__":
+    for name in SIZES:
+        __test_cards(name)
+    __test_bus_type_1()
+    __test_300_bus()
+    __benchmark_50k()
@@ -0,0 +1,185 @@
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import storage.read_write_json as read_write_json
+from models.generator import GeneratorSC
+from models.transformer import Transformer
+from storage.ieee_cdf import read_ieee_cdf
+from storage.matpower import BUS_I, F_BUS, GEN_BUS, T_BUS, MatpowerCase, case_from_cdf
+from storage.matpower import power_flow_from_matpower
+from storage.psse_raw import read_psse_raw
+from storage.read_write_json import read_json_project, save_json_file
+
+ASSETS = os.path.join(os.path.dirname(__file__), "../assets")
+TMP = tempfile.mkdtemp()
+
+# versão 1 (sem "version"), como o editor gravava: indentado, sem geradores
+LEGACY = {
+    "buses": [
+        {"id": "1", "name": "Slack", "v": 1.02, "o": 0.0, "type": 3, "position": [0, 0]},
+        {"id": "2", "name": "Carga", "p_load": 50.0, "q_load": 20.0, "position": [120.5, 40]},
+    ],
+    "lines": [
+        {"id": "C_1", "name": "L1", "g": 1.0, "b": -10.0, "bc": 0.02, "tap": 1.0,
+         "tapBus": "1", "zBus": "2", "kind": "line"},
+        {"id": "C_2", "name": "T1", "g": 0.0, "b": -20.0, "tap": 0.98, "tapBus": "1", "zBus": "2"},
+    ],
+}  # fmt: skip
+
+
+def __test_round_trip() -> None:
+    """Todos os tipos de elemento (trafo com TransformerMeta, gerador com GeneratorSC)."""
+    raw = read_psse_raw(os.path.join(ASSETS, "psse_examples/ieee14_v33.raw"))
+    positions = [(1.5 * k, -2.0 * k) for k in range(len(raw.buses))]
+    backends = [("orjson", read_write_json.orjson), ("json", None)]
+    for backend, module in backends if read_write_json.orjson else backends[1:]:
+        read_write_json.orjson = module
+        for layout in read_write_json.LAYOUTS:
+            path = os.path.join(TMP, f"ieee14_{layout}.json")
+            save_json_file(path, raw.buses, raw.lines, positions, raw.generators, 100.0, layout)
+            json.load(open(path))  # JSON padrão, legível por qualquer leitor
+            project = read_json_project(path)
+            assert project.version == 2 and project.positions == positions
+            for a, b in zip(raw.buses, project.buses):
+                for attr in ("id", "name", "type", "v", "o", "p_load", "q_max", "b_shunt"):
+                    assert getattr(a, attr) == getattr(b, attr), (a.id, attr)
+            for a, b in zip(raw.lines, project.lines):
+                assert type(a) is type(b)
+                for attr in ("id", "tap_bus_id", "z_bus_id", "g", "b", "bc", "tap", "z1"):
+                    assert getattr(a, attr) == getattr(b, attr), (a.id, attr)
+                if isinstance(a, Transformer):
+                    assert a.meta == b.meta
+            for a, b in zip(raw.generators, project.generators):
+                assert (a.id, a.bus_id, a.p_gen, a.q_min, a.sc) == (
+                    b.id, b.bus_id, b.p_gen, b.q_min, b.sc
+                )  # fmt: skip
+            print(f"{backend}/{layout}: ida e volta sem diferença ({os.path.getsize(path)} bytes)")
+    read_write_json.orjson = backends[0][1]
+
+
+def __test_legacy() -> None:
+    path = os.path.join(TMP, "legacy.json")
+    with open(path, "w") as file:
+        json.dump(LEGACY, file, indent=4)
+    project = read_json_project(path)
+    assert project.version == 1 and not project.generators
+    assert project.positions == [(0.0, 0.0), (120.5, 40.0)]
+    assert [type(line).__name__ for line in project.lines] == ["Line", "Transformer"]
+    assert project.buses[1].p_load == 50.0 and project.lines[1].tap == 0.98
+    print("versão 1: lida (trafo reconhecido pelo tap)")
+
+
+def __test_arrays_edge_cases() -> None:
+    """Blocos pequenos (valores cortados entre blocos), colunas fora de ordem e erros."""
+    raw = read_psse_raw(os.path.join(ASSETS, "psse_examples/ieee14_v33.raw"))
+    path = os.path.join(TMP, "ieee14_arrays.json")
+    save_json_file(path, raw.buses, raw.lines, [(0.5, -1.25)] * 14, raw.generators, 100.0, "arrays")
+    expected = read_json_project(path)
+    chunk, read_write_json._CHUNK = read_write_json._CHUNK, 7
+    try:
+        for layout in read_write_json.LAYOUTS:
+            small = os.path.join(TMP, f"small_{layout}.json")
+            save_json_file(
+                small, raw.buses, raw.lines, expected.positions, raw.generators, 100.0, layout
+            )
+            project = read_json_project(small)
+            assert [(b.id, b.v, b.o) for b in project.buses] == [
+                (b.id, b.v, b.o) for b in expected.buses
+            ]
+            assert [(l.id, l.z1, type(l)) for l in project.lines] == [
+                (l.id, l.z1, type(l)) for l in expected.lines
+            ]
+    finally:
+        read_write_json._CHUNK = chunk
+
+    # arquivo editado à mão: colunas antes do "id", "meta" antes de "kind", sc nulo,
+    # coluna com tamanho errado
+    document = json.load(open(path))
+    document["buses"] = {"v": document["buses"].pop("v"), **document["buses"]}
+    lines = document["lines"]
+    k = lines["kind"].index("transformer")
+    lines["meta"][k] = {**lines["meta"][k], "conn_hv": "D", "sn_mva": 50.0}
+    document["lines"] = {"meta": lines.pop("meta"), **lines}
+    document["generators"]["sc"][0] = {"x1_pu": None}
+    json.dump(document, open(path, "w"))
+    project = read_json_project(path)
+    assert [b.v for b in project.buses] == [b.v for b in expected.buses]
+    assert project.buses[0].v_sch == project.buses[0].v
+    assert (project.lines[k].meta.conn_hv, project.lines[k].meta.sn_mva) == ("D", 50.0)
+    assert [type(l) for l in project.lines] == [type(l) for l in expected.lines]
+    assert project.generators[0].sc.x1_pu == GeneratorSC().x1_pu
+    del document["lines"]["kind"]  # sem "kind": trafo pelo tap, "meta" ainda vale
+    json.dump(document, open(path, "w"))
+    assert read_json_project(path).lines[k].meta.conn_hv == "D"
+    document["lines"]["tap"].pop()
+    json.dump(document, open(path, "w"))
+    try:
+        read_json_project(path)
+    except ValueError as e:
+        print(f"  coluna curta: {e}")
+    else:
+        raise AssertionError("esperava ValueError")
+    print("arrays: blocos de 7 caracteres, colunas fora de ordem e sc nulo")
+
+
+def __benchmark_70k() -> None:
+    """Caso de 300 barras repetido até ~70 mil barras: tempo e pico de memória."""
+    case = case_from_cdf(read_ieee_cdf(os.path.join(ASSETS, "ieee_examples/ieee300cdf.txt")))
+    copies = 234
+
+    def tile(matrix: np.ndarray, columns: list[int]) -> np.ndarray:
+        out = np.tile(matrix, (copies, 1))
+        for column in columns:
+            out[:, column] += np.repeat(np.arange(copies) * 10_000, len(matrix))
+        return out
+
+    power_flow = power_flow_from_matpower(
+        MatpowerCase(
+            base_mva=case.base_mva,
+            bus=tile(case.bus, [BUS_I]),
+            gen=tile(case.gen, [GEN_BUS]),
+            branch=tile(case.branch, [F_BUS, T_BUS]),
+        )
+    )
+    buses = list(power_flow.buses.values())
+    lines = list(power_flow.connections.values())
+    positions = [(float(k % 300), float(k // 300)) for k in range(len(buses))]
+
+    def peak(function) -> float:
+        tracemalloc.start()
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 1e6
+
+    for layout in read_write_json.LAYOUTS:
+        path = os.path.join(TMP, f"big_{layout}.json")
+        t0 = time.perf_counter()
+        save_json_file(path, buses, lines, positions, layout=layout)
+        t1 = time.perf_counter()
+        project = read_json_project(path)
+        t2 = time.perf_counter()
+        assert len(project.buses) == len(buses) and len(project.lines) == len(lines)
+        del project
+        save_peak = peak(lambda: save_json_file(path, buses, lines, positions, layout=layout))
+        read_peak = peak(lambda: read_json_project(path))
+        # referência: só o documento decodificado de uma vez, sem os objetos do modelo
+        document_peak = peak(lambda: json.load(open(path)))
+        print(
+            f"{layout}: {len(buses)} barras, {len(lines)} ramos, "
+            f"{os.path.getsize(path) / 1e6:.1f} MB; gravação {t1 - t0:.2f} s "
+            f"(pico {save_peak:.1f} MB), leitura {t2 - t1:.2f} s (pico {read_peak:.1f} MB "
+            f"com os objetos; json.load do documento: {document_peak:.1f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    __test_round_trip()
+    __test_legacy()
+    __test_arrays_edge_cases()
+    __benchmark_70k()
@@ -0,0 +1,134 @@
+import os
+import time
+
+import numpy as np
+
+from storage.ieee_cdf import power_flow_from_cdf, read_ieee_cdf
+from storage.matpower import (
+    BUS_I,
+    F_BUS,
+    GEN_BUS,
+    T_BUS,
+    MatpowerCase,
+    case_from_cdf,
+    format_matpower,
+    parse_matpower,
+    power_flow_from_matpower,
+)
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "../assets/ieee_examples")
+
+# case9 do MATPOWER (WSCC 9 barras), como vem na distribuição
+CASE9 = """function mpc = case9
+%CASE9    Power flow data for 9 bus, 3 generator case.
+mpc.version = '2';
+mpc.baseMVA = 100;
+%% bus data
+%	bus_i	type	Pd	Qd	Gs	Bs	area	Vm	Va	baseKV	zone	Vmax	Vmin
+mpc.bus = [
+	1	3	0	0	0	0	1	1	0	345	1	1.1	0.9;
+	2	2	0	0	0	0	1	1	0	345	1	1.1	0.9;
+	3	2	0	0	0	0	1	1	0	345	1	1.1	0.9;
+	4	1	0	0	0	0	1	1	0	345	1	1.1	0.9;
+	5	1	90	30	0	0	1	1	0	345	1	1.1	0.9;
+	6	1	0	0	0	0	1	1	0	345	1	1.1	0.9;
+	7	1	100	35	0	0	1	1	0	345	1	1.1	0.9;
+	8	1	0	0	0	0	1	1	0	345	1	1.1	0.9;
+	9	1	125	50	0	0	1	1	0	345	1	1.1	0.9;
+];
+%% generator data
+mpc.gen = [
+	1	72.3	27.03	300	-300	1.04	100	1	250	10	0	0	0	0	0	0	0	0	0	0	0;
+	2	163	6.54	300	-300	1.025	100	1	300	10	0	0	0	0	0	0	0	0	0	0	0;
+	3	85	-10.95	300	-300	1.025	100	1	270	10	0	0	0	0	0	0	0	0	0	0	0;
+];
+%% branch data
+mpc.branch = [
+	1	4	0	0.0576	0	250	250	250	0	0	1	-360	360;
+	4	5	0.017	0.092	0.158	250	250	250	0	0	1	-360	360;
+	5	6	0.039	0.17	0.358	150	150	150	0	0	1	-360	360;
+	3	6	0	0.0586	0	300	300	300	0	0	1	-360	360;
+	6	7	0.0119	0.1008	0.209	150	150	150	0	0	1	-360	360;
+	7	8	0.0085	0.072	0.149	250	250	250	0	0	1	-360	360;
+	8	2	0	0.0625	0	250	250	250	0	0	1	-360	360;
+	8	9	0.032	0.161	0.306	250	250	250	0	0	1	-360	360;
+	9	4	0.01	0.085	0.176	250	250	250	0	0	1	-360	360;
+];
+%% generator cost data
+mpc.gencost = [
+	2	1500	0	3	0.11	5	150;
+	2	2000	0	3	0.085	1.2	600;
+	2	3000	0	3	0.1225	1	335;
+];
+"""
+
+
+def __test_round_trip(name: str) -> None:
+    """CDF -> MATPOWER -> texto -> MATPOWER -> PowerFlow: mesmos números do CDF direto."""
+    cdf = read_ieee_cdf(os.path.join(EXAMPLES, name))
+    case = case_from_cdf(cdf)
+    back = parse_matpower(format_matpower(case))
+    for key in ("bus", "gen", "branch"):
+        assert np.array_equal(getattr(case, key), getattr(back, key)), (name, key)
+    assert back.bus_name == case.bus_name
+
+    expected = power_flow_from_cdf(cdf)
+    power_flow = power_flow_from_matpower(back)
+    for a, b in zip(expected.buses.values(), power_flow.buses.values()):
+        for attr in ("id", "type", "v", "o", "p_load", "q_load", "p_gen", "q_gen", "b_shunt"):
+            x, y = getattr(a, attr), getattr(b, attr)
+            # Bs passa por MW na base do sistema e volta dividido por ela
+            assert abs(x - y) < 1e-12 if isinstance(x, float) else x == y, (name, a.id, attr)
+    for a, b in zip(expected.connections.values(), power_flow.connections.values()):
+        for attr in ("tap_bus_id", "z_bus_id", "g", "b", "bc", "tap", "phase"):
+            assert getattr(a, attr) == getattr(b, attr), (name, a.tap_bus_id, attr)
+    print(f"{name}: ida e volta pelo MATPOWER sem diferença")
+
+
+def __test_case9() -> None:
+    case = parse_matpower(CASE9)
+    assert case.gen.shape == (3, 21) and case.gencost.shape == (3, 7)
+    power_flow = power_flow_from_matpower(case)
+    power_flow.solve(max_iterations=20)
+    v = [round(bus.v, 4) for bus in power_flow.buses.values()]
+    print(f"case9: V = {v}")
+    # solução do runpf do MATPOWER
+    assert v == [1.04, 1.025, 1.025, 1.0258, 1.0127, 1.0324, 1.0159, 1.0258, 0.9956]
+
+
+def __benchmark_70k() -> None:
+    """O caso de 300 barras repetido (barras renumeradas) até ~70 mil barras."""
+    case = case_from_cdf(read_ieee_cdf(os.path.join(EXAMPLES, "ieee300cdf.txt")))
+    copies = 234
+
+    def tile(matrix: np.ndarray, columns: list[int]) -> np.ndarray:
+        out = np.tile(matrix, (copies, 1))
+        for column in columns:
+            out[:, column] += np.repeat(np.arange(copies) * 10_000, len(matrix))
+        return out
+
+    big = MatpowerCase(
+        base_mva=case.base_mva,
+        bus=tile(case.bus, [BUS_I]),
+        gen=tile(case.gen, [GEN_BUS]),
+        branch=tile(case.branch, [F_BUS, T_BUS]),
+    )
+    t0 = time.perf_counter()
+    text = format_matpower(big)
+    t1 = time.perf_counter()
+    back = parse_matpower(text)
+    t2 = time.perf_counter()
+    tap_bus, z_bus = back.branch_ends()
+    t3 = time.perf_counter()
+    assert np.array_equal(back.branch, big.branch)
+    print(
+        f"{len(big.bus)} barras, {len(big.branch)} ramos, {len(text) / 1e6:.1f} MB: "
+        f"escrita {t1 - t0:.2f} s, leitura {t2 - t1:.2f} s, índices dos ramos {t3 - t2:.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    for size in (14, 30, 57, 118, 300):
+        __test_round_trip(f"ieee{size}cdf.txt")
+    __test_case9()
+    __benchmark_70k()
@@ -0,0 +1,211 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from maths.fault_batch import BatchFaultRunner, CsvFaultSink, study_grid
+from maths.short_circuit import ShortCircuitSession
+from models.faults import FaultType
+from storage.psse_raw import read_psse_raw
+from storage.results_export import (
+    ArrowTableSink,
+    ParquetTableSink,
+    branch_flow_columns,
+    bus_result_columns,
+    fault_sweep_columns,
+    open_table_sink,
+    outage_sweep_columns,
+    parametric_sweep_columns,
+    save_power_flow_results,
+)
+
+ASSETS = os.path.join(os.path.dirname(__file__), "../assets")
+TMP = tempfile.mkdtemp()
+# Parquet/Arrow só são conferidos com os pacotes instalados (lidos com o próprio backend)
+BACKENDS = [name for name in ("pyarrow", "polars") if importlib.util.find_spec(name)]
+
+
+def __read(path: str, backend: str | None = None) -> dict[str, np.ndarray]:
+    """Tabela gravada -> colunas numpy (CSV pelo módulo csv, sem pandas)."""
+    if path.endswith(".csv"):
+        import csv
+
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        return {name: np.array(column) for name, column in zip(rows[0], zip(*rows[1:]))}
+    backend = backend or BACKENDS[0]
+    if backend == "polars":
+        import polars as pl
+
+        frame = pl.read_parquet(path) if path.endswith(".parquet") else pl.read_ipc(path)
+        return {name: frame[name].to_numpy() for name in frame.columns}
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if path.endswith(".parquet"):
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return {name: table[name].to_numpy() for name in table.column_names}
+
+
+def __solved_ieee14():
+    raw = read_psse_raw(os.path.join(ASSETS, "psse_examples/ieee14_v33.raw"))
+    power_flow = raw.power_flow()
+    power_flow.solve(max_iterations=20)
+    return power_flow
+
+
+def __test_power_flow_tables() -> None:
+    """Fluxos nos ramos + shunt da barra fecham a injeção calculada pelo fluxo."""
+    power_flow = __solved_ieee14()
+    buses = list(power_flow.buses.values())
+    lines = list(power_flow.connections.values())
+    flows = branch_flow_columns(buses, lines, power_flow.base)
+    index = {bus.id: k for k, bus in enumerate(buses)}
+    p = np.array([bus.v**2 * bus.g_shunt * power_flow.base for bus in buses])
+    q = np.array([-(bus.v**2) * bus.b_shunt * power_flow.base for bus in buses])
+    f = np.array([index[b] for b in flows["from_bus"]])
+    t = np.array([index[b] for b in flows["to_bus"]])
+    np.add.at(p, f, flows["p_from_mw"])
+    np.add.at(p, t, flows["p_to_mw"])
+    np.add.at(q, f, flows["q_from_mvar"])
+    np.add.at(q, t, flows["q_to_mvar"])
+    assert np.abs(p - [bus.p for bus in buses]).max() < 1e-6
+    assert np.abs(q - [bus.q for bus in buses]).max() < 1e-6
+
+    for ext in (".parquet", ".arrow", ".csv") if BACKENDS else (".csv",):
+        paths = save_power_flow_results(os.path.join(TMP, "ieee14" + ext), buses, lines)
+        back = __read(paths[1])
+        assert list(back) == list(flows) and len(back["branch_id"]) == len(lines)
+        assert list(back["from_bus"]) == list(flows["from_bus"])
+        assert np.allclose(back["p_loss_mw"].astype(float), flows["p_loss_mw"])
+        v = __read(paths[0])["v_pu"].astype(float)
+        assert np.array_equal(v, [bus.v for bus in buses])  # repr do float: exato até no CSV
+    print(f"ieee14: fluxos fecham com as injeções; perdas {flows['p_loss_mw'].sum():.3f} MW")
+
+
+def __test_chunks(backend: str) -> None:
+    """Blocos acrescentados ao mesmo arquivo, inclusive um vazio, nos dois formatos."""
+    buses = list(__solved_ieee14().buses.values())
+    for sink_type, ext in ((ParquetTableSink, ".parquet"), (ArrowTableSink, ".arrow")):
+        path = os.path.join(TMP, f"serie_{backend}{ext}")
+        with sink_type(path, backend) as sink:
+            for step in range(5):  # "série no tempo": uma fotografia das barras por passo
+                sink.write({"step": np.full(len(buses), step), **bus_result_columns(buses)})
+            sink.write({"step": np.zeros(0, dtype=np.int64), **bus_result_columns([])})
+        back = __read(path, backend)
+        assert len(back["step"]) == 5 * len(buses)
+        assert list(back["step"]) == list(np.repeat(np.arange(5), len(buses)))
+        assert list(back["bus_id"][: len(buses)]) == [bus.id for bus in buses]
+        assert not [name for name in os.listdir(TMP) if name.startswith(".partes-")]
+    print(f"{backend}: 6 blocos por arquivo, Parquet e Arrow, lidos de volta")
+
+
+def __test_fallback() -> None:
+    """Sem pyarrow e sem polars: o mesmo nome em .csv (ou RuntimeError sem fallback)."""
+    buses = list(__solved_ieee14().buses.values())
+    saved = {name: sys.modules.get(name) for name in ("pyarrow", "polars")}
+    sys.modules.update(dict.fromkeys(saved))  # import -> ImportError
+    try:
+        sink = open_table_sink(os.path.join(TMP, "sem_backend.parquet"))
+        with sink:
+            sink.write(bus_result_columns(buses))
+        assert sink.path.endswith("sem_backend.csv")
+        try:
+            open_table_sink(os.path.join(TMP, "sem_backend.arrow"), fallback=False)
+        except RuntimeError as e:
+            print(f"  sem fallback: {e}")
+        else:
+            raise AssertionError("esperava RuntimeError sem backend")
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                del sys.modules[name]
+            else:
+                sys.modules[name] = module
+    assert len(__read(sink.path)["bus_id"]) == len(buses)
+    print(f"sem backend colunar -> {os.path.basename(sink.path)}")
+
+
+def __test_fault_tables() -> None:
+    power_flow = __solved_ieee14()
+    session = ShortCircuitSession(power_flow)
+    n = len(power_flow.buses)
+
+    sweep = session.sweep(z_fault_pu=0.01j)
+    columns = fault_sweep_columns(sweep)
+    assert len(columns["bus"]) == n * len(sweep.mva)
+    bus = sweep.bus_ids[4]
+    row = np.flatnonzero((columns["bus"] == bus) & (columns["fault_type"] == "LINE_TO_LINE"))
+    current, mva = sweep.at(bus, FaultType.LINE_TO_LINE)
+    assert abs(columns["i_mag"][row[0]] - abs(current)) < 1e-12 and columns["mva"][row[0]] == mva
+
+    n1 = session.outage_sweep(FaultType.SINGLE_LINE_TO_GROUND, z_fault_pu=0.01j)
+    path = os.path.join(TMP, "contingencias.arrow" if BACKENDS else "contingencias.csv")
+    with open_table_sink(path) as sink:
+        sink.write(outage_sweep_columns(n1))
+    back = __read(path)
+    assert len(back["case"]) == len(n1.outages) * n
+    j = n1.case(*n1.outages[2])
+    mva = back["mva"][back["case"].astype(int) == j].astype(float)
+    assert np.allclose(mva, n1.mva[j])
+
+    parametric = session.parametric(FaultType.THREE_PHASE, z_fault_pu=[0j, 0.05j, 0.1j])
+    columns = parametric_sweep_columns(parametric)
+    assert len(columns["bus"]) == parametric.mva.size
+    assert np.array_equal(columns["mva"], parametric.mva.reshape(-1))
+    print(
+        f"faltas: varredura {n * len(sweep.mva)} linhas, N-1 {len(back['case'])} linhas, "
+        f"paramétrica {len(columns['bus'])} linhas"
+    )
+
+
+def __test_batch_runner() -> None:
+    """BatchFaultRunner continua gravando nos sinks (agora os de results_export)."""
+    session = ShortCircuitSession(__solved_ieee14())
+    studies = study_grid(list(session.solver.bus_index), [(FaultType.THREE_PHASE, "A")])
+    path = os.path.join(TMP, "lote.parquet" if BACKENDS else "lote_v.csv")
+    t0 = time.perf_counter()
+    with open_table_sink(path) as sink:
+        rows = BatchFaultRunner(session.solver, workers=1, block=4).run(studies, sink)
+    elapsed = time.perf_counter() - t0
+    assert len(__read(path)["study"]) == rows == len(studies) ** 2
+    with CsvFaultSink(os.path.join(TMP, "lote.csv")) as sink:
+        BatchFaultRunner(session.solver, workers=1, voltages=False).run(studies, sink)
+    assert len(__read(sink.path)["study"]) == len(studies)
+
+    # gerador: os estudos são puxados bloco a bloco, não todos antes da primeira gravação
+    pulled = []
+
+    def generate():
+        for study in studies:
+            pulled.append(study)
+            yield study
+
+    class Sink(CsvFaultSink):
+        def write(self, columns):
+            assert len(pulled) <= len(columns["study"]) + 1
+            pulled.clear()
+            super().write(columns)
+
+    with Sink(os.path.join(TMP, "lote_gerador.csv")) as sink:
+        BatchFaultRunner(session.solver, workers=1, block=4, voltages=False).run(generate(), sink)
+    back = __read(sink.path)
+    assert list(back["fault_bus"]) == [study.bus_id for study in studies]
+    assert list(back["study"].astype(int)) == list(range(len(studies)))
+    print(f"lote: {rows} linhas (falta x barra) em {elapsed * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    __test_power_flow_tables()
+    for backend in BACKENDS:
+        __test_chunks(backend)
+    if not BACKENDS:
+        print("pyarrow/polars ausentes: Parquet e Arrow não conferidos")
+    __test_fallback()
+    __test_fault_tables()
+    __test_batch_runner()
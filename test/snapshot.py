@@ -0,0 +1,111 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from models.transformer import Transformer
+from storage.ieee_cdf import read_ieee_cdf
+from storage.matpower import (
+    BUS_I,
+    F_BUS,
+    GEN_BUS,
+    T_BUS,
+    MatpowerCase,
+    case_from_cdf,
+    power_flow_from_matpower,
+)
+from storage.psse_raw import read_psse_raw
+from storage.snapshot import load_snapshot, save_snapshot
+
+ASSETS = os.path.join(os.path.dirname(__file__), "../assets")
+TMP = tempfile.mkdtemp()
+
+
+def __test_round_trip() -> None:
+    """Barras, linhas, trafos (com TransformerMeta) e geradores voltam iguais do snapshot."""
+    source = os.path.join(ASSETS, "psse_examples/ieee14_v33.raw")
+    raw = read_psse_raw(source)
+    power_flow = raw.power_flow()
+    power_flow.solve(max_iterations=20)
+    positions = [(10.0 * k, -5.0 * k) for k in range(len(raw.buses))]
+    path = os.path.join(TMP, "ieee14.npz")
+    save_snapshot(
+        path, raw.buses, raw.lines, positions, raw.generators, raw.base_mva, True, source
+    )
+
+    snap = load_snapshot(path)
+    snap.verify()
+    assert snap.solved and snap.is_current(source)
+    buses, lines, generators, back_positions = snap.elements()
+    assert back_positions == positions
+    for a, b in zip(raw.buses, buses):
+        for attr in ("id", "name", "number", "type", "v", "o", "p_load", "q_load", "b_shunt"):
+            assert getattr(a, attr) == getattr(b, attr), (a.id, attr)
+    for a, b in zip(raw.lines, lines):
+        assert type(a) is type(b)
+        for attr in ("id", "tap_bus_id", "z_bus_id", "g", "b", "bc", "tap", "z1", "z0"):
+            assert getattr(a, attr) == getattr(b, attr), (a.id, attr)
+        if isinstance(a, Transformer):
+            assert a.meta == b.meta
+    for a, b in zip(raw.generators, generators):
+        assert (a.bus_id, a.name, a.p_gen, a.sc) == (b.bus_id, b.name, b.p_gen, b.sc)
+
+    # Ybus e ordenação gravadas: as mesmas do PowerFlow, fatoração sem reordenar
+    Y1 = power_flow.get_ybus_sparse_sequences()[0]
+    assert abs(snap.ybus() - Y1).max() == 0
+    lu = snap.ybus_factorization()
+    rhs = np.ones(len(buses), dtype=complex)
+    assert np.abs(Y1 @ lu.solve(rhs) - rhs).max() < 1e-10
+    assert np.allclose(snap.voltages(), list(power_flow.get_bus_voltages_complex_pu().values()))
+
+    # rede alterada depois do snapshot: o cache fica velho
+    assert snap.matches(buses, lines, generators, raw.base_mva)
+    buses[3].p_load += 1.0
+    assert not snap.matches(buses, lines, generators, raw.base_mva)
+    print("ieee14_v33.raw: ida e volta pelo snapshot sem diferença; alteração detectada")
+
+
+def __benchmark_10k() -> None:
+    """Caso de 300 barras repetido (barras renumeradas) até ~10 mil barras."""
+    case = case_from_cdf(read_ieee_cdf(os.path.join(ASSETS, "ieee_examples/ieee300cdf.txt")))
+    copies = 34
+
+    def tile(matrix: np.ndarray, columns: list[int]) -> np.ndarray:
+        out = np.tile(matrix, (copies, 1))
+        for column in columns:
+            out[:, column] += np.repeat(np.arange(copies) * 10_000, len(matrix))
+        return out
+
+    big = MatpowerCase(
+        base_mva=case.base_mva,
+        bus=tile(case.bus, [BUS_I]),
+        gen=tile(case.gen, [GEN_BUS]),
+        branch=tile(case.branch, [F_BUS, T_BUS]),
+    )
+    power_flow = power_flow_from_matpower(big)
+    buses = list(power_flow.buses.values())
+    lines = list(power_flow.connections.values())
+    positions = [(float(k % 100), float(k // 100)) for k in range(len(buses))]
+    path = os.path.join(TMP, "big.npz")
+
+    t0 = time.perf_counter()
+    save_snapshot(path, buses, lines, positions, base_mva=power_flow.base)
+    t1 = time.perf_counter()
+    snap = load_snapshot(path)
+    t2 = time.perf_counter()
+    Y = snap.ybus()
+    t3 = time.perf_counter()
+    snap.elements()
+    t4 = time.perf_counter()
+    assert Y.shape == (len(buses), len(buses)) and snap.ybus_perm is not None
+    print(
+        f"{len(buses)} barras, {len(lines)} ramos, {os.path.getsize(path) / 1e6:.1f} MB: "
+        f"gravação {t1 - t0:.2f} s, abertura {(t2 - t1) * 1e3:.1f} ms, "
+        f"Ybus {(t3 - t2) * 1e3:.1f} ms, objetos do modelo {t4 - t3:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    __test_round_trip()
+    __benchmark_10k()
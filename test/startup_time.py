@@ -0,0 +1,117 @@
+"""
+Mede o tempo de inicialização do aplicativo e compara com um orçamento.
+
+- perfil de import (python -X importtime): módulos mais caros até a 1a janela
+- tempo até a primeira janela (POWERSIM_STARTUP_PROBE=1 em src/main.py)
+- módulos pesados que NÃO podem ser carregados antes da 1a janela
+
+Uso:
+    python test/startup_time.py            # usa QT_QPA_PLATFORM=offscreen se não houver display
+    python test/startup_time.py --runs 5
+
+Retorna código 1 se algum orçamento for estourado (serve para CI/acompanhamento).
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# ------------------------------------------------------------------
+# Orçamento (ajuste aqui quando a meta mudar)
+# ------------------------------------------------------------------
+FIRST_WINDOW_BUDGET_MS = 1500.0   # processo iniciado -> janela exibida
+IMPORT_BUDGET_MS = 900.0          # soma dos imports até a janela
+FORBIDDEN_AT_STARTUP = ("numpy", "scipy", "matplotlib", "reportlab", "qdarktheme")
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _run_once(src_dir: Path) -> tuple[float, list[tuple[str, int, int]], list[str]]:
+    env = dict(os.environ)
+    env["POWERSIM_STARTUP_PROBE"] = "1"
+    if os.name != "nt" and not env.get("DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py"],
+        cwd=src_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    first_window_ms = float("nan")
+    heavy: list[str] = []
+    for line in proc.stdout.splitlines():
+        if line.startswith("startup: first_window_ms="):
+            first_window_ms = float(line.split("=", 1)[1])
+        elif line.startswith("startup: heavy_modules="):
+            value = line.split("=", 1)[1].strip()
+            heavy = [m for m in value.split(",") if m]
+
+    # (módulo, self_us, cumulative_us) apenas para imports de nível superior
+    imports: list[tuple[str, int, int]] = []
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m is None:
+            continue
+        self_us, cumulative_us, indent, module = int(m[1]), int(m[2]), m[3], m[4]
+        if len(indent) <= 1:
+            imports.append((module, self_us, cumulative_us))
+
+    if proc.returncode != 0 and first_window_ms != first_window_ms:
+        print(proc.stderr[-2000:])
+        raise RuntimeError(f"main.py terminou com código {proc.returncode}")
+
+    return first_window_ms, imports, heavy
+
+
+def main() -> int:
+    runs = 3
+    if "--runs" in sys.argv:
+        runs = int(sys.argv[sys.argv.index("--runs") + 1])
+
+    src_dir = Path(__file__).resolve().parent.parent / "src"
+
+    best_ms = float("inf")
+    best_imports: list[tuple[str, int, int]] = []
+    heavy: list[str] = []
+    for _ in range(runs):
+        ms, imports, heavy = _run_once(src_dir)
+        if ms < best_ms:
+            best_ms, best_imports = ms, imports
+
+    total_import_ms = sum(c for _, _, c in best_imports) / 1000.0
+
+    print("Imports mais caros até a primeira janela (cumulativo):")
+    for module, _, cumulative in sorted(best_imports, key=lambda t: -t[2])[:15]:
+        print(f"  {cumulative / 1000.0:8.1f} ms  {module}")
+
+    print()
+    print(f"Tempo até a primeira janela: {best_ms:8.1f} ms (orçamento {FIRST_WINDOW_BUDGET_MS:.0f} ms)")
+    print(f"Tempo total de imports:      {total_import_ms:8.1f} ms (orçamento {IMPORT_BUDGET_MS:.0f} ms)")
+
+    failures = []
+    if best_ms > FIRST_WINDOW_BUDGET_MS:
+        failures.append("tempo até a primeira janela acima do orçamento")
+    if total_import_ms > IMPORT_BUDGET_MS:
+        failures.append("tempo de imports acima do orçamento")
+    eager = [m for m in heavy if m in FORBIDDEN_AT_STARTUP]
+    if eager:
+        failures.append(f"módulos pesados carregados na inicialização: {', '.join(eager)}")
+
+    if failures:
+        print("\nFALHOU:")
+        for f in failures:
+            print("  -", f)
+        return 1
+
+    print("\nOK: dentro do orçamento.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
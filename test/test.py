@@ -1,9 +1,27 @@
+import time
+
 import numpy as np
 
 from models.y_bus_square_matrix import YBusSquareMatrix
 from models.z_bus_square_matrix import ZBusSquareMatrix
 
 
+def build_y(n: int, ground: list[tuple[int, complex]], branches: list[tuple[int, int, complex]]):
+    y = YBusSquareMatrix(log_print=False)
+    for i in range(n):
+        y.add_bus(str(i + 1))
+    for bus, z in ground:
+        y.add_value(bus, bus, 1 / z)
+    for source, target, z in branches:
+        y.connect_bus_to_bus(1 / z, source, target)
+    return y
+
+
+def compare(z: ZBusSquareMatrix, y: YBusSquareMatrix) -> float:
+    diff = z.z_matrix - np.array(y.z_matrix, dtype=complex)
+    return float(np.mean(np.abs(diff) ** 2))
+
+
 def main():
     z_1 = complex(0, 1.2)  # De 1 para 0, z(pu) = j1.2
     z_3 = complex(0, 1.5)  # De 3 para 0, z(pu) = j1.5
@@ -24,32 +42,46 @@ def main():
 
     z.connect_bus_to_bus(z_2_3, bus2, bus3)  # De 2 para 3, z(pu) = j0.15
 
-    y = YBusSquareMatrix(log_print=False)
-
-    bus1 = y.add_bus(1 / z_1)  # De 1 para 0, z(pu) = j1.2
-
-    bus2 = y.add_bus(0)  # De 2 para 0, z(pu) = 0
-
-    bus3 = y.add_bus(1 / z_3)  # De 3 para 0, z(pu) = j1.5
-
-    y.connect_bus_to_bus(1 / z_1_2, bus1, bus2)  # De 1 para 2, z(pu) = j0.2
-
-    y.connect_bus_to_bus(1 / z_1_3, bus1, bus3)  # De 1 para 3, z(pu) = j0.3
-
-    y.connect_bus_to_bus(1 / z_2_3, bus2, bus3)  # De 2 para 3, z(pu) = j0.15
+    y = build_y(3, [(bus1, z_1), (bus3, z_3)], [(bus1, bus2, z_1_2), (bus1, bus3, z_1_3), (bus2, bus3, z_2_3)])
 
     print(f"Z from z = \n{z.z_matrix}")
-    print(f"Z from y = \n{y.z_matrix}")
-    diff: list[list[complex | float]] = z.z_matrix - y.z_matrix  # type: ignore
-    avg_sq_error = np.mean(np.abs(diff) ** 2)  # type: ignore
+    print(f"Z from y = \n{np.array(y.z_matrix)}")
+    avg_sq_error = compare(z, y)
     print(f"Average Squared Error between Z matrices = {avg_sq_error}")
+    assert avg_sq_error < 1e-20
 
-    print(f"Y from z = \n{z.y_matrix}")
-    print(f"Y from y = \n{y.y_matrix}")
-    print(f"Y difference = \n{z.y_matrix - y.y_matrix}")  # type: ignore
-    diff = z.y_matrix - y.y_matrix  # type: ignore
-    avg_sq_error = np.mean(np.abs(diff) ** 2)  # type: ignore
+    diff = z.y_matrix - np.array(y.y_matrix, dtype=complex)
+    avg_sq_error = float(np.mean(np.abs(diff) ** 2))
     print(f"Average Squared Error between Y matrices = {avg_sq_error}")
+    assert avg_sq_error < 1e-20
+
+    # rede maior: árvore (casos 1 e 2), depois laços e aterramentos (casos 3 e 4)
+    rng = np.random.default_rng(7)
+    n = 400
+    z = ZBusSquareMatrix()
+    ground = [(z.add_bus_and_connect_to_ground(0.5j), 0.5j)]
+    branches = []
+    t0 = time.perf_counter()
+    for k in range(1, n):
+        impedance = complex(0.01, rng.uniform(0.05, 0.3))
+        target = int(rng.integers(0, k))
+        z.add_bus_and_connect_to_bus(impedance, target)
+        branches.append((target, k, impedance))
+    for _ in range(2 * n):
+        impedance = complex(0.01, rng.uniform(0.05, 0.3))
+        source, target = (int(i) for i in rng.choice(n, 2, replace=False))
+        z.connect_bus_to_bus(impedance, source, target)
+        branches.append((source, target, impedance))
+    for bus in rng.choice(n, 20, replace=False):
+        z.connect_bus_to_ground(2.0j, int(bus))
+        ground.append((int(bus), 2.0j))
+    elapsed = time.perf_counter() - t0
+
+    y = build_y(n, ground, branches)
+    reference = np.array(y.z_matrix, dtype=complex)
+    rel = np.abs(z.z_matrix - reference).max() / np.abs(reference).max()
+    print(f"{n} barras, {len(branches) + len(ground)} ramos em {elapsed:.2f} s; erro relativo {rel:.2e}")
+    assert rel < 1e-9
 
 
 if __name__ == "__main__":